@@ -0,0 +1,131 @@
+"""
+Multiset Fingerprints
+
+Order-independent 64-bit hashes of integer lists. Two lists that are
+permutations of each other always get the same fingerprint, so permutation
+checks become integer comparisons and permutation-equivalent lists can be
+grouped with a dict. Different multisets collide with probability about
+2^-64; the exact practice.is_permutation check is used to rule collisions out
+unless verification is turned off.
+"""
+
+import numpy as np
+
+from practice import is_permutation
+
+MASK_64 = (1 << 64) - 1
+
+# Default key mixed into every element hash. Fingerprints are only comparable
+# when they were computed with the same seed.
+DEFAULT_SEED = 0x313E_C5_2024_0001
+
+
+def _mix64(value):
+    """
+    splitmix64 finalizer on a Python int.
+
+    pre: 0 <= value < 2^64
+    post: returns a well-mixed int in [0, 2^64).
+    """
+
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+
+def _mix64_array(values):
+    """
+    splitmix64 finalizer on a uint64 array, wrapping mod 2^64 like _mix64.
+
+    pre: values is a uint64 NumPy array.
+    post: returns a new uint64 array with _mix64 applied to every element.
+    """
+
+    values = values + np.uint64(0x9E3779B97F4A7C15)
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def multiset_fingerprint(data, seed=DEFAULT_SEED):
+    """
+    Computes an order-independent 64-bit fingerprint of a list of ints.
+
+    pre: data is a sequence of ints, seed is an int.
+    post: returns sum(mix(x ^ seed) for x in data) mod 2^64 as an int, where
+    mix is the splitmix64 finalizer and x is taken mod 2^64. Permutations of
+    the same list always have equal fingerprints. Lists whose values fit in
+    64 bits are hashed in one vectorized NumPy pass; larger values fall back
+    to a pure Python loop. data is not altered.
+    """
+
+    key = seed & MASK_64
+    try:
+        values = np.asarray(data, dtype=np.int64).view(np.uint64)
+    except OverflowError:
+        total = 0
+        for number in data:
+            total += _mix64((number & MASK_64) ^ key)
+        return total & MASK_64
+
+    # uint64 addition wraps, so the sum is already reduced mod 2^64
+    return int(_mix64_array(values ^ np.uint64(key)).sum(dtype=np.uint64))
+
+
+def is_permutation_fingerprint(a_data, b_data, verify=True, seed=DEFAULT_SEED):
+    """
+    Determine whether integer lists a_data and b_data are permutations of each
+    other by comparing their multiset fingerprints.
+
+    pre: a_data and b_data are sequences of ints.
+    post: return False if the lengths or fingerprints differ. Otherwise return
+    is_permutation(a_data, b_data) if verify is True, or True without an exact
+    check if verify is False (wrong with probability about 2^-64).
+    Neither a_data nor b_data are altered as a result of this function.
+    """
+
+    if len(a_data) != len(b_data):
+        return False
+    if multiset_fingerprint(a_data, seed) != multiset_fingerprint(b_data, seed):
+        return False
+    return is_permutation(a_data, b_data) if verify else True
+
+
+def group_permutations(lists, verify=True, seed=DEFAULT_SEED):
+    """
+    Groups integer lists that are permutations of each other.
+
+    pre: lists is a sequence of sequences of ints.
+    post: returns a list of groups, each a list of indices into lists whose
+    elements are permutations of each other. Groups are ordered by their
+    smallest index and indices within a group are increasing. If verify is
+    True, lists that share a fingerprint are split into exact permutation
+    classes with is_permutation; otherwise a shared (length, fingerprint) is
+    trusted. lists is not altered.
+    """
+
+    buckets = {}
+    for index, data in enumerate(lists):
+        key = (len(data), multiset_fingerprint(data, seed))
+        buckets.setdefault(key, []).append(index)
+
+    groups = []
+    for indices in buckets.values():
+        if not verify:
+            groups.append(indices)
+            continue
+
+        # a hash collision splits one bucket into several exact classes
+        classes = []
+        for index in indices:
+            for members in classes:
+                if is_permutation(lists[members[0]], lists[index]):
+                    members.append(index)
+                    break
+            else:
+                classes.append([index])
+        groups.extend(classes)
+
+    groups.sort(key=lambda members: members[0])
+    return groups
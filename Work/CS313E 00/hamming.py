@@ -0,0 +1,176 @@
+"""
+Batch Hamming Distance Engine
+
+Vectorized versions of practice.hamming_distance for comparing many
+equal-length int vectors at once. practice.hamming_distance stays the
+reference result; every function here must agree with it element for element.
+"""
+
+import numpy as np
+
+# Upper bound on the number of elements compared in one broadcast step, so
+# that an (n, m, length) comparison never materializes more than ~16M bools.
+BLOCK_ELEMENTS = 1 << 24
+
+WORD_BITS = 64
+
+# First and largest block sizes used by hamming_distance_within_chunked
+FIRST_CHUNK = 1 << 10
+MAX_CHUNK = 1 << 20
+
+
+def _as_matrix(vectors, name):
+    """
+    Converts vectors to a 2D NumPy array.
+
+    pre: vectors is a 1D or 2D array-like of ints.
+    post: returns a 2D array; a single 1D vector becomes a matrix with one row.
+    Raises a ValueError if vectors has more than 2 dimensions.
+    """
+
+    matrix = np.asarray(vectors)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != 2:
+        raise ValueError(f"{name} must be a 1D or 2D array of vectors")
+    return matrix
+
+
+def _rows_per_block(other_rows, length):
+    """
+    Determine how many query rows can be broadcast against other_rows
+    reference rows of the given length without exceeding BLOCK_ELEMENTS.
+
+    pre: other_rows >= 0, length >= 0
+    post: returns an int >= 1.
+    """
+
+    return max(1, BLOCK_ELEMENTS // max(1, other_rows * length))
+
+
+def hamming_distance_batch(queries, references, packed=False):
+    """
+    Determine the Hamming distance between every query vector and one or many
+    reference vectors in a single NumPy-backed call.
+
+    pre: queries is a 2D array-like of ints with shape (n, length).
+    references is a 1D array-like of `length` ints or a 2D array-like with
+    shape (m, length). If packed is True, every element of queries and
+    references is 0 or 1.
+    post: if references is 1D, returns an int64 array of shape (n,) where entry
+    i is hamming_distance(queries[i], references). If references is 2D, returns
+    an int64 array of shape (n, m) where entry (i, j) is
+    hamming_distance(queries[i], references[j]).
+    If packed is True, the vectors are packed into uint64 words and compared
+    with popcount instead of element by element.
+    Neither queries nor references are altered as a result of this function.
+    Raises a ValueError if the vector lengths differ.
+    """
+
+    single_reference = np.ndim(references) == 1
+    queries = _as_matrix(queries, "queries")
+    references = _as_matrix(references, "references")
+
+    if queries.shape[1] != references.shape[1]:
+        raise ValueError("queries and references must have the same length")
+
+    if packed:
+        distances = hamming_distance_packed(pack_bits(queries), pack_bits(references))
+    elif single_reference:
+        return np.count_nonzero(queries != references, axis=1).astype(np.int64)
+    else:
+        distances = np.empty((queries.shape[0], references.shape[0]), dtype=np.int64)
+        step = _rows_per_block(references.shape[0], queries.shape[1])
+        for start in range(0, queries.shape[0], step):
+            block = queries[start:start + step, np.newaxis, :]
+            distances[start:start + step] = np.count_nonzero(
+                block != references[np.newaxis, :, :], axis=2
+            )
+
+    if single_reference:
+        return distances[:, 0]
+    return distances
+
+
+def pack_bits(vectors):
+    """
+    Packs 0/1 vectors into rows of uint64 words for popcount comparisons.
+
+    pre: vectors is a 1D or 2D array-like where every element is 0 or 1.
+    post: returns a uint64 array of shape (n, ceil(length / 64)). Bits past the
+    end of each vector are zero, so they never count as a difference.
+    vectors is not altered as a result of this function.
+    Raises a ValueError if any element is not 0 or 1.
+    """
+
+    bits = _as_matrix(vectors, "vectors")
+    if bits.size and (bits.min() < 0 or bits.max() > 1):
+        raise ValueError("packed mode requires every element to be 0 or 1")
+
+    packed_bytes = np.packbits(bits.astype(np.uint8), axis=1)
+    words = -(-bits.shape[1] // WORD_BITS)
+    padded = np.zeros((bits.shape[0], words * 8), dtype=np.uint8)
+    padded[:, :packed_bytes.shape[1]] = packed_bytes
+    return padded.view(np.uint64)
+
+
+def hamming_distance_packed(packed_queries, packed_references):
+    """
+    Determine the Hamming distance between every pair of packed bit vectors
+    by XOR-ing their uint64 words and counting the set bits.
+
+    pre: packed_queries has shape (n, words) and packed_references has shape
+    (m, words), both as returned by pack_bits for vectors of the same length.
+    post: returns an int64 array of shape (n, m) where entry (i, j) is the
+    number of differing bits between packed_queries[i] and packed_references[j].
+    Neither argument is altered as a result of this function.
+    Raises a ValueError if the word counts differ.
+    """
+
+    queries = _as_matrix(packed_queries, "packed_queries")
+    references = _as_matrix(packed_references, "packed_references")
+
+    if queries.shape[1] != references.shape[1]:
+        raise ValueError("packed vectors must have the same number of words")
+
+    distances = np.empty((queries.shape[0], references.shape[0]), dtype=np.int64)
+    step = _rows_per_block(references.shape[0], queries.shape[1])
+    for start in range(0, queries.shape[0], step):
+        block = queries[start:start + step, np.newaxis, :] ^ references[np.newaxis, :, :]
+        distances[start:start + step] = np.bitwise_count(block).sum(axis=2)
+
+    return distances
+
+
+def hamming_distance_within_chunked(a_data, b_data, k, first_chunk=FIRST_CHUNK):
+    """
+    Determine whether the Hamming distance between two int vectors is at most
+    k by comparing them in vectorized blocks.
+
+    pre: a_data and b_data are 1D sequences or arrays of ints of equal length,
+    k >= 0, first_chunk >= 1.
+    post: return True if hamming_distance(a_data, b_data) <= k, False
+    otherwise. Blocks start at first_chunk elements and double up to
+    MAX_CHUNK; the running mismatch count is checked after every block, so
+    only a prefix of mostly-different inputs is converted and compared.
+    Neither a_data nor b_data are altered as a result of this function.
+    Raises a ValueError if the lengths differ.
+    """
+
+    if len(a_data) != len(b_data):
+        raise ValueError("a_data and b_data must have the same length")
+
+    mismatches = 0
+    start = 0
+    chunk = first_chunk
+    while start < len(a_data):
+        end = start + chunk
+        a_block = np.asarray(a_data[start:end])
+        b_block = np.asarray(b_data[start:end])
+        mismatches += int(np.count_nonzero(a_block != b_block))
+        if mismatches > k:
+            return False
+        start = end
+        chunk = min(chunk * 2, MAX_CHUNK)
+
+    return True
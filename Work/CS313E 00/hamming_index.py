@@ -0,0 +1,208 @@
+"""
+Hamming Nearest-Neighbor Index
+
+A BK-tree over fixed-length int vectors that answers k-nearest-neighbor and
+radius queries by Hamming distance without scanning every stored vector.
+Distances are computed with practice.hamming_distance, so query results are
+exactly the results of a brute-force scan with that function.
+"""
+
+import heapq
+import pickle
+
+from practice import hamming_distance
+
+
+class HammingIndex:
+    """
+    BK-tree of fixed-length int vectors keyed by Hamming distance.
+
+    Every node stores one vector and the ids of all inserted vectors equal to
+    it. A child reached through edge d holds vectors at distance exactly d from
+    its parent, so by the triangle inequality a query at distance q from a
+    node only has to visit children whose edge lies within radius of q.
+    Deleting an id removes it from its node but keeps the node as a routing
+    point, so inserts and deletes never rebuild the tree.
+    """
+
+    def __init__(self, length):
+        """
+        pre: length >= 0 is the number of ints in every indexed vector.
+        post: creates an empty index.
+        """
+
+        self.length = length
+        self._vectors = []
+        self._ids = []
+        self._children = []
+        self._node_of_id = {}
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._node_of_id)
+
+    def __contains__(self, item_id):
+        return item_id in self._node_of_id
+
+    def _check_length(self, vector):
+        """Raises a ValueError if vector does not have the indexed length."""
+        if len(vector) != self.length:
+            raise ValueError(
+                f"vector has length {len(vector)}, index expects {self.length}"
+            )
+
+    def insert(self, vector):
+        """
+        Adds a vector to the index.
+
+        pre: vector is a sequence of self.length ints.
+        post: returns the new int id of the vector. vector is not altered.
+        """
+
+        vector = tuple(vector)
+        self._check_length(vector)
+
+        item_id = self._next_id
+        self._next_id += 1
+
+        if not self._vectors:
+            self._add_node(vector, item_id)
+            return item_id
+
+        node = 0
+        while True:
+            distance = hamming_distance(vector, self._vectors[node])
+            if distance == 0:
+                self._ids[node].append(item_id)
+                self._node_of_id[item_id] = node
+                return item_id
+
+            child = self._children[node].get(distance)
+            if child is None:
+                self._children[node][distance] = self._add_node(vector, item_id)
+                return item_id
+            node = child
+
+    def _add_node(self, vector, item_id):
+        """Appends a new node holding vector and item_id and returns its index."""
+        node = len(self._vectors)
+        self._vectors.append(vector)
+        self._ids.append([item_id])
+        self._children.append({})
+        self._node_of_id[item_id] = node
+        return node
+
+    def delete(self, item_id):
+        """
+        Removes a vector from the index.
+
+        pre: item_id was returned by insert and has not been deleted.
+        post: item_id no longer appears in query results.
+        Raises a KeyError if item_id is not in the index.
+        """
+
+        node = self._node_of_id.pop(item_id)
+        self._ids[node].remove(item_id)
+
+    def get(self, item_id):
+        """
+        pre: item_id is in the index.
+        post: returns the vector stored under item_id as a tuple.
+        Raises a KeyError if item_id is not in the index.
+        """
+
+        return self._vectors[self._node_of_id[item_id]]
+
+    def radius_query(self, query, radius):
+        """
+        Finds every stored vector within a Hamming distance of the query.
+
+        pre: query is a sequence of self.length ints, radius >= 0.
+        post: returns a list of (distance, id) tuples for every stored vector
+        with hamming_distance(query, vector) <= radius, sorted by distance and
+        then by id. query is not altered.
+        """
+
+        self._check_length(query)
+        if not self._vectors:
+            return []
+
+        matches = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            distance = hamming_distance(query, self._vectors[node])
+            if distance <= radius:
+                matches.extend((distance, item_id) for item_id in self._ids[node])
+
+            for edge, child in self._children[node].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+
+        matches.sort()
+        return matches
+
+    def nearest(self, query, k):
+        """
+        Finds the k stored vectors closest to the query.
+
+        pre: query is a sequence of self.length ints, k >= 0.
+        post: returns a list of at most k (distance, id) tuples, the same as
+        the first k entries of all stored vectors sorted by (distance, id).
+        query is not altered.
+        """
+
+        self._check_length(query)
+        if k <= 0 or not self._vectors:
+            return []
+
+        # max-heap of the best k candidates so far, stored as (-distance, -id)
+        best = []
+        # min-heap of subtrees keyed by a lower bound on the distance from the
+        # query to anything inside them, from the triangle inequality
+        frontier = [(0, 0)]
+        while frontier:
+            lower_bound, node = heapq.heappop(frontier)
+            if len(best) == k and lower_bound > -best[0][0]:
+                break
+
+            distance = hamming_distance(query, self._vectors[node])
+            for item_id in self._ids[node]:
+                candidate = (-distance, -item_id)
+                if len(best) < k:
+                    heapq.heappush(best, candidate)
+                elif candidate > best[0]:
+                    heapq.heapreplace(best, candidate)
+
+            bound = -best[0][0] if len(best) == k else self.length
+            for edge, child in self._children[node].items():
+                child_bound = max(lower_bound, abs(edge - distance))
+                if child_bound <= bound:
+                    heapq.heappush(frontier, (child_bound, child))
+
+        return sorted((-distance, -item_id) for distance, item_id in best)
+
+    def save(self, path):
+        """
+        Writes the index to a file so it can be reloaded with HammingIndex.load.
+
+        pre: path is a writable file path.
+        post: the file at path holds the full index, ready to accept more inserts
+        and deletes after it is loaded.
+        """
+
+        with open(path, "wb") as outfile:
+            pickle.dump(self.__dict__, outfile, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """
+        pre: path is a file written by HammingIndex.save.
+        post: returns the index stored in the file.
+        """
+
+        with open(path, "rb") as infile:
+            state = pickle.load(infile)
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        return index
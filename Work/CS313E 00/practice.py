@@ -14,6 +14,16 @@ Students. Academic penalties up to and including an F in the course are likely.
 UT EID: wah938
 """
 
+import itertools
+import os
+from collections import Counter
+
+# Number of ints read from each stream at a time by is_permutation_stream
+STREAM_CHUNK_SIZE = 1 << 16
+
+# Number of bytes read from a file at a time by is_permutation_stream
+FILE_BLOCK_SIZE = 1 << 20
+
 def hamming_distance(a_data, b_data):
     """
     Determine the Hamming distance between two lists of ints.
@@ -33,6 +43,29 @@ def hamming_distance(a_data, b_data):
     return hamming_dist
 
 
+def hamming_distance_within(a_data, b_data, k):
+    """
+    Determine whether the Hamming distance between two lists of ints is at
+    most k, stopping as soon as the answer is known.
+
+    pre: a_data is not None, b_data is not None, len(a_data) == len(b_data),
+    k >= 0
+    post: return True if hamming_distance(a_data, b_data) <= k, False
+    otherwise. The scan stops at the first mismatch that pushes the count
+    past k. Neither a_data nor b_data are altered as a result of this function.
+    """
+
+    hamming_dist = 0
+
+    for index, element in enumerate(a_data):
+        if element != b_data[index]:
+            hamming_dist += 1
+            if hamming_dist > k:
+                return False
+
+    return True
+
+
 def is_permutation(a_data, b_data):
     """
     Determine whether integer lists a_data and b_data are permutations of each
@@ -56,6 +89,110 @@ def is_permutation(a_data, b_data):
     return dict_a == dict_b
 
 
+def _int_chunks_from_file(path, block_size):
+    """
+    Yields lists of the whitespace-separated ints in a text file, reading at
+    most block_size bytes at a time.
+
+    pre: path names a readable text file of whitespace-separated ints,
+    block_size > 0
+    post: every int in the file appears in exactly one yielded list, in order.
+    """
+
+    with open(path, "rb") as infile:
+        leftover = b""
+        while True:
+            block = infile.read(block_size)
+            if not block:
+                break
+            tokens = (leftover + block).split()
+            # the last token may continue in the next block unless the block
+            # ended on whitespace
+            if block[-1:].isspace():
+                leftover = b""
+            else:
+                leftover = tokens.pop() if tokens else b""
+            if tokens:
+                yield [int(token) for token in tokens]
+        if leftover:
+            yield [int(leftover)]
+
+
+def _int_chunks(source, chunk_size, block_size):
+    """
+    Yields lists of ints from an iterable of ints or from a file path.
+
+    pre: source is an iterable of ints or a str/os.PathLike path to a text
+    file of whitespace-separated ints. chunk_size > 0, block_size > 0.
+    post: every int in source appears in exactly one yielded list, in order.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        yield from _int_chunks_from_file(source, block_size)
+        return
+
+    iterator = iter(source)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def is_permutation_stream(
+    a_source, b_source, chunk_size=STREAM_CHUNK_SIZE, block_size=FILE_BLOCK_SIZE
+):
+    """
+    Determine whether two integer streams are permutations of each other
+    without holding either stream in memory.
+
+    pre: a_source and b_source are each an iterable of ints or a path to a text
+    file of whitespace-separated ints. chunk_size > 0 is the number of ints
+    taken from an iterable at a time; block_size > 0 is the number of bytes
+    read from a file at a time.
+    post: return the same result as is_permutation(list(a_source),
+    list(b_source)). Both streams are read in alternating chunks into a single
+    signed counter table, so memory is bounded by the number of distinct
+    values plus one chunk. Returns False as soon as one stream has produced
+    more ints than the other stream had in total.
+    """
+
+    chunks = [
+        _int_chunks(a_source, chunk_size, block_size),
+        _int_chunks(b_source, chunk_size, block_size),
+    ]
+    signs = [1, -1]
+    lengths = [0, 0]
+    done = [False, False]
+
+    # counts[n] is (occurrences of n in a) - (occurrences of n in b); entries
+    # that reach zero are removed so the table only holds unbalanced values
+    counts = {}
+
+    while not (done[0] and done[1]):
+        for side in range(2):
+            if done[side]:
+                continue
+
+            chunk = next(chunks[side], None)
+            if chunk is None:
+                done[side] = True
+                continue
+
+            lengths[side] += len(chunk)
+            for number, count in Counter(chunk).items():
+                balance = counts.get(number, 0) + signs[side] * count
+                if balance:
+                    counts[number] = balance
+                else:
+                    del counts[number]
+
+        if (done[0] and lengths[1] > lengths[0]) or (done[1] and lengths[0] > lengths[1]):
+            return False
+
+    return not counts
+
+
 def most_vowels(list_of_strings):
     """
     Determine the index of the string that has the largest number of vowels.
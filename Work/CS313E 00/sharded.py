@@ -0,0 +1,166 @@
+"""
+Sharded Execution for practice.py
+
+Runs hamming_distance, is_permutation and most_vowels over large inputs by
+splitting them into contiguous shards, evaluating every shard in a worker
+process and merging the partial results. Each runner returns the same value
+as the single-process function along with the wall time of every shard.
+"""
+
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from practice import hamming_distance, most_vowels
+from vowels import count_vowels
+
+# value: the merged result. shard_timings: one (start, end, seconds) tuple per
+# shard, where [start, end) is the slice of the input the shard covered.
+ShardedResult = namedtuple("ShardedResult", ["value", "shard_timings"])
+
+
+def shard_bounds(length, shards):
+    """
+    Splits range(length) into contiguous, nearly equal slices.
+
+    pre: length >= 0, shards >= 1
+    post: returns a list of at most shards (start, end) tuples that cover
+    range(length) in order; slice sizes differ by at most one.
+    """
+
+    shards = max(1, min(shards, length))
+    size, extra = divmod(length, shards)
+    bounds = []
+    start = 0
+    for shard in range(shards):
+        end = start + size + (1 if shard < extra else 0)
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def _timed(function, *args):
+    """Calls function(*args) and returns (result, elapsed seconds)."""
+    start_time = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start_time
+
+
+def _run_shards(function, shard_args, bounds, workers):
+    """
+    Evaluates function on every tuple of shard_args in a process pool.
+
+    post: returns (list of results in shard order, list of shard timings).
+    """
+
+    functions = [function] * len(shard_args)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        outcomes = list(executor.map(_timed, functions, *zip(*shard_args)))
+
+    results = [result for result, _ in outcomes]
+    timings = [
+        (start, end, seconds) for (start, end), (_, seconds) in zip(bounds, outcomes)
+    ]
+    return results, timings
+
+
+def _signed_counts(a_slice, b_slice):
+    """
+    Counts a_slice minus b_slice.
+
+    post: returns a dict mapping each value to (occurrences in a_slice) -
+    (occurrences in b_slice), without zero entries.
+    """
+
+    counts = Counter(a_slice)
+    counts.subtract(b_slice)
+    return {number: count for number, count in counts.items() if count}
+
+
+def _vowel_shard(list_of_strings):
+    """
+    Finds the best string of one shard.
+
+    post: returns (vowel count, local index) of the string most_vowels picks.
+    The count is 0 when the shard has no vowels at all, so such a shard never
+    wins the merge.
+    """
+
+    index = most_vowels(list_of_strings)
+    string = list_of_strings[index]
+    if string is None:
+        return 0, index
+    return count_vowels(string), index
+
+
+def sharded_hamming_distance(a_data, b_data, shards, workers=None):
+    """
+    Determine the Hamming distance between two lists of ints in shards.
+
+    pre: a_data and b_data are lists of ints, len(a_data) == len(b_data),
+    shards >= 1. workers is the process pool size (None uses every CPU).
+    post: returns a ShardedResult whose value equals
+    hamming_distance(a_data, b_data), computed as the sum of the distances of
+    matching slices. Neither list is altered.
+    """
+
+    bounds = shard_bounds(len(a_data), shards)
+    shard_args = [(a_data[start:end], b_data[start:end]) for start, end in bounds]
+    results, timings = _run_shards(hamming_distance, shard_args, bounds, workers)
+    return ShardedResult(sum(results), timings)
+
+
+def sharded_is_permutation(a_data, b_data, shards, workers=None):
+    """
+    Determine whether integer lists a_data and b_data are permutations of each
+    other in shards.
+
+    pre: a_data and b_data are lists of ints, shards >= 1. workers is the
+    process pool size (None uses every CPU).
+    post: returns a ShardedResult whose value equals
+    is_permutation(a_data, b_data). Each shard counts its slice of a_data
+    minus the matching slice of b_data and the signed counters are summed.
+    Lists of different lengths return False without starting any workers.
+    Neither list is altered.
+    """
+
+    if len(a_data) != len(b_data):
+        return ShardedResult(False, [])
+
+    bounds = shard_bounds(len(a_data), shards)
+    shard_args = [(a_data[start:end], b_data[start:end]) for start, end in bounds]
+    results, timings = _run_shards(_signed_counts, shard_args, bounds, workers)
+
+    merged = {}
+    for counts in results:
+        for number, count in counts.items():
+            merged[number] = merged.get(number, 0) + count
+    return ShardedResult(not any(merged.values()), timings)
+
+
+def sharded_most_vowels(list_of_strings, shards, workers=None):
+    """
+    Determine the index of the string that has the largest number of vowels
+    in shards.
+
+    pre: same as most_vowels; shards >= 1. workers is the process pool size
+    (None uses every CPU).
+    post: returns a ShardedResult whose value equals
+    most_vowels(list_of_strings). Every shard reports its (vowel count, index)
+    and the earliest shard with the largest count wins, which keeps the
+    global rule that the tied index closest to zero is returned.
+    list_of_strings is not altered.
+    """
+
+    bounds = shard_bounds(len(list_of_strings), shards)
+    shard_args = [(list_of_strings[start:end],) for start, end in bounds]
+    results, timings = _run_shards(_vowel_shard, shard_args, bounds, workers)
+
+    index_of_string = 0
+    max_vowels = 0
+    for (start, _), (vowel_count, index) in zip(bounds, results):
+        if vowel_count > max_vowels:
+            max_vowels = vowel_count
+            index_of_string = start + index
+
+    return ShardedResult(index_of_string, timings)
@@ -0,0 +1,93 @@
+"""Multiset Fingerprint Test Suite"""
+
+import random
+import unittest
+
+from practice import is_permutation
+from fingerprint import (
+    multiset_fingerprint,
+    is_permutation_fingerprint,
+    group_permutations,
+    _mix64,
+    MASK_64,
+    DEFAULT_SEED,
+)
+
+
+class TestFingerprint(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Permutations have equal fingerprints"""
+        a = [1, 1, 1, 2, 2, 3]
+        b = [2, 1, 3, 1, 2, 1]
+        self.assertEqual(multiset_fingerprint(a), multiset_fingerprint(b))
+
+    def test_2(self):
+        """Test 2: Same elements, different frequencies differ"""
+        a = [1, 2, 2]
+        b = [2, 1, 1]
+        self.assertNotEqual(multiset_fingerprint(a), multiset_fingerprint(b))
+
+    def test_3(self):
+        """Test 3: Vectorized path matches the pure Python path"""
+        data = [0, -1, 2147483647, -2147483648, 7, 7]
+        expected = sum(_mix64((x & MASK_64) ^ DEFAULT_SEED) for x in data) & MASK_64
+        self.assertEqual(multiset_fingerprint(data), expected)
+
+    def test_4(self):
+        """Test 4: Empty list fingerprint is zero"""
+        self.assertEqual(multiset_fingerprint([]), 0)
+
+    def test_5(self):
+        """Test 5: The seed changes the fingerprint"""
+        data = [3, 1, 4, 1, 5]
+        self.assertNotEqual(
+            multiset_fingerprint(data, seed=1), multiset_fingerprint(data, seed=2)
+        )
+
+
+class TestPermutationFingerprint(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Agrees with is_permutation on random pairs"""
+        rng = random.Random(313)
+        for _ in range(200):
+            a = [rng.randint(-4, 4) for _ in range(rng.randint(0, 12))]
+            b = list(a)
+            rng.shuffle(b)
+            if rng.random() < 0.5 and b:
+                b[rng.randrange(len(b))] = rng.randint(-4, 4)
+            expected_bool = is_permutation(a, b)
+            self.assertEqual(is_permutation_fingerprint(a, b), expected_bool)
+            self.assertEqual(is_permutation_fingerprint(a, b, verify=False), expected_bool)
+
+    def test_2(self):
+        """Test 2: Different lengths"""
+        actual_bool = is_permutation_fingerprint([1, 2, 3], [1, 2, 3, 4])
+        self.assertEqual(actual_bool, False)
+
+    def test_3(self):
+        """Test 3: A forced collision is caught by exact verification"""
+        # values equal mod 2^64 hash identically
+        a = [1 << 64, 5]
+        b = [0, 5]
+        self.assertEqual(multiset_fingerprint(a), multiset_fingerprint(b))
+        self.assertEqual(is_permutation_fingerprint(a, b, verify=False), True)
+        self.assertEqual(is_permutation_fingerprint(a, b, verify=True), False)
+
+
+class TestGroupPermutations(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Lists are grouped by permutation class"""
+        lists = [[1, 2, 3], [4], [3, 2, 1], [], [2, 1, 3], [4], [1, 2, 2]]
+        expected = [[0, 2, 4], [1, 5], [3], [6]]
+        self.assertEqual(group_permutations(lists), expected)
+        self.assertEqual(group_permutations(lists, verify=False), expected)
+
+    def test_2(self):
+        """Test 2: Colliding lists are split when verifying"""
+        lists = [[1 << 64, 5], [5, 0], [0, 5]]
+        self.assertEqual(group_permutations(lists), [[0], [1, 2]])
+        self.assertEqual(group_permutations(lists, verify=False), [[0, 1, 2]])
+
+
+if __name__ == "__main__":
+    unittest.main()
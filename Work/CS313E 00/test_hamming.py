@@ -0,0 +1,122 @@
+"""Batch Hamming Distance Test Suite"""
+
+import random
+import unittest
+
+from practice import hamming_distance
+from hamming import (
+    hamming_distance_batch,
+    hamming_distance_packed,
+    hamming_distance_within_chunked,
+    pack_bits,
+)
+
+
+def random_vectors(rng, count, length, low, high):
+    """Generates count seeded random int vectors of the given length."""
+    return [[rng.randint(low, high) for _ in range(length)] for _ in range(count)]
+
+
+class TestHammingBatch(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Many queries against one reference match the scalar function"""
+        rng = random.Random(313)
+        queries = random_vectors(rng, 50, 17, -3, 3)
+        reference = random_vectors(rng, 1, 17, -3, 3)[0]
+        expected = [hamming_distance(query, reference) for query in queries]
+        actual = hamming_distance_batch(queries, reference).tolist()
+        self.assertEqual(actual, expected)
+
+    def test_2(self):
+        """Test 2: Many queries against many references match the scalar function"""
+        rng = random.Random(1)
+        queries = random_vectors(rng, 20, 9, 0, 4)
+        references = random_vectors(rng, 30, 9, 0, 4)
+        expected = [
+            [hamming_distance(query, reference) for reference in references]
+            for query in queries
+        ]
+        actual = hamming_distance_batch(queries, references).tolist()
+        self.assertEqual(actual, expected)
+
+    def test_3(self):
+        """Test 3: Large integer values"""
+        queries = [[2147483647, -2147483648], [-2147483648, 2147483647]]
+        reference = [2147483647, -2147483648]
+        actual = hamming_distance_batch(queries, reference).tolist()
+        self.assertEqual(actual, [0, 2])
+
+    def test_4(self):
+        """Test 4: Mismatched lengths raise a ValueError"""
+        with self.assertRaises(ValueError):
+            hamming_distance_batch([[1, 2, 3]], [1, 2])
+
+    def test_5(self):
+        """Test 5: Packed mode matches the scalar function on 0/1 data"""
+        rng = random.Random(42)
+        queries = random_vectors(rng, 25, 130, 0, 1)
+        references = random_vectors(rng, 7, 130, 0, 1)
+        expected = [
+            [hamming_distance(query, reference) for reference in references]
+            for query in queries
+        ]
+        actual = hamming_distance_batch(queries, references, packed=True).tolist()
+        self.assertEqual(actual, expected)
+
+    def test_6(self):
+        """Test 6: Packed mode against a single reference"""
+        queries = [[1, 1, 1, 0, 1, 0], [0, 1, 0, 1, 0, 1]]
+        reference = [0, 1, 0, 1, 0, 1]
+        actual = hamming_distance_batch(queries, reference, packed=True).tolist()
+        self.assertEqual(actual, [5, 0])
+
+    def test_7(self):
+        """Test 7: Packed mode rejects data that is not 0/1"""
+        with self.assertRaises(ValueError):
+            pack_bits([[0, 1, 2]])
+
+    def test_8(self):
+        """Test 8: Pre-packed vectors can be compared repeatedly"""
+        rng = random.Random(7)
+        queries = random_vectors(rng, 4, 64, 0, 1)
+        references = random_vectors(rng, 3, 64, 0, 1)
+        packed_queries = pack_bits(queries)
+        packed_references = pack_bits(references)
+        self.assertEqual(packed_queries.shape, (4, 1))
+        expected = [
+            [hamming_distance(query, reference) for reference in references]
+            for query in queries
+        ]
+        actual = hamming_distance_packed(packed_queries, packed_references).tolist()
+        self.assertEqual(actual, expected)
+
+
+class TestHammingWithinChunked(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Agrees with hamming_distance across block boundaries"""
+        rng = random.Random(3)
+        for _ in range(30):
+            length = rng.randint(0, 200)
+            a = [rng.randint(0, 1) for _ in range(length)]
+            b = [bit if rng.random() < 0.9 else 1 - bit for bit in a]
+            distance = hamming_distance(a, b)
+            for k in (0, distance - 1, distance, distance + 1):
+                if k < 0:
+                    continue
+                actual = hamming_distance_within_chunked(a, b, k, first_chunk=3)
+                self.assertEqual(actual, distance <= k)
+
+    def test_2(self):
+        """Test 2: Stops after the first block that passes k"""
+        a = [0] * 8 + [None] * 100
+        b = [1] * 8 + [None] * 100
+        self.assertEqual(hamming_distance_within_chunked(a, b, 5, first_chunk=8), False)
+
+    def test_3(self):
+        """Test 3: Mismatched lengths raise a ValueError"""
+        with self.assertRaises(ValueError):
+            hamming_distance_within_chunked([1, 2, 3], [1, 2], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
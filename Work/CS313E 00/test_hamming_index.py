@@ -0,0 +1,108 @@
+"""Hamming Nearest-Neighbor Index Test Suite"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from practice import hamming_distance
+from hamming_index import HammingIndex
+
+
+def brute_force(vectors, query):
+    """Sorted (distance, id) pairs for every live vector by linear scan."""
+    return sorted(
+        (hamming_distance(query, vector), item_id)
+        for item_id, vector in vectors.items()
+    )
+
+
+def build_index(seed, count, length, alphabet):
+    """Builds an index of seeded random vectors and the id -> vector map."""
+    rng = random.Random(seed)
+    index = HammingIndex(length)
+    vectors = {}
+    for _ in range(count):
+        vector = [rng.randrange(alphabet) for _ in range(length)]
+        vectors[index.insert(vector)] = vector
+    return index, vectors, rng
+
+
+class TestHammingIndex(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Radius queries match a brute-force scan"""
+        index, vectors, rng = build_index(313, 400, 12, 2)
+        for radius in range(0, 5):
+            query = [rng.randrange(2) for _ in range(12)]
+            expected = [pair for pair in brute_force(vectors, query) if pair[0] <= radius]
+            self.assertEqual(index.radius_query(query, radius), expected)
+
+    def test_2(self):
+        """Test 2: k-NN queries match a brute-force scan, ties broken by id"""
+        index, vectors, rng = build_index(5, 300, 8, 3)
+        for k in (1, 3, 10, 50):
+            query = [rng.randrange(3) for _ in range(8)]
+            self.assertEqual(index.nearest(query, k), brute_force(vectors, query)[:k])
+
+    def test_3(self):
+        """Test 3: Deleted vectors disappear from results"""
+        index, vectors, rng = build_index(11, 200, 10, 2)
+        for item_id in rng.sample(sorted(vectors), 80):
+            index.delete(item_id)
+            del vectors[item_id]
+        self.assertEqual(len(index), 120)
+        query = [rng.randrange(2) for _ in range(10)]
+        self.assertEqual(index.nearest(query, 7), brute_force(vectors, query)[:7])
+        expected = [pair for pair in brute_force(vectors, query) if pair[0] <= 3]
+        self.assertEqual(index.radius_query(query, 3), expected)
+
+    def test_4(self):
+        """Test 4: Duplicate vectors each get their own id"""
+        index = HammingIndex(3)
+        first = index.insert([1, 2, 3])
+        second = index.insert([1, 2, 3])
+        self.assertNotEqual(first, second)
+        self.assertEqual(index.radius_query([1, 2, 3], 0), [(0, first), (0, second)])
+        index.delete(first)
+        self.assertEqual(index.nearest([1, 2, 3], 5), [(0, second)])
+
+    def test_5(self):
+        """Test 5: Empty index and k of zero"""
+        index = HammingIndex(4)
+        self.assertEqual(index.nearest([0, 0, 0, 0], 3), [])
+        self.assertEqual(index.radius_query([0, 0, 0, 0], 4), [])
+        index.insert([1, 1, 1, 1])
+        self.assertEqual(index.nearest([0, 0, 0, 0], 0), [])
+
+    def test_6(self):
+        """Test 6: Wrong vector length raises a ValueError"""
+        index = HammingIndex(4)
+        with self.assertRaises(ValueError):
+            index.insert([1, 2, 3])
+        with self.assertRaises(ValueError):
+            index.nearest([1, 2, 3, 4, 5], 1)
+
+    def test_7(self):
+        """Test 7: Deleting an unknown id raises a KeyError"""
+        index = HammingIndex(2)
+        item_id = index.insert([1, 2])
+        index.delete(item_id)
+        with self.assertRaises(KeyError):
+            index.delete(item_id)
+
+    def test_8(self):
+        """Test 8: A saved index reloads with the same results and keeps growing"""
+        index, _, rng = build_index(99, 150, 6, 4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "index.pkl")
+            index.save(path)
+            loaded = HammingIndex.load(path)
+        query = [rng.randrange(4) for _ in range(6)]
+        self.assertEqual(loaded.nearest(query, 5), index.nearest(query, 5))
+        new_id = loaded.insert(query)
+        self.assertEqual(loaded.nearest(query, 1), [(0, new_id)])
+        self.assertEqual(loaded.get(new_id), tuple(query))
+
+
+if __name__ == "__main__":
+    unittest.main()
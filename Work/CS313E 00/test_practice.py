@@ -1,5 +1,15 @@
+import itertools
+import os
+import random
+import tempfile
 import unittest
-from practice import hamming_distance, is_permutation, most_vowels
+from practice import (
+    hamming_distance,
+    hamming_distance_within,
+    is_permutation,
+    is_permutation_stream,
+    most_vowels,
+)
 
 
 class TestHamming(unittest.TestCase):
@@ -108,6 +118,29 @@ class TestHamming(unittest.TestCase):
         self.assertEqual(actual, expected)
 
 
+class TestHammingWithin(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Agrees with hamming_distance for every threshold"""
+        h1 = [2, 3, 4, 5, 4, 3, 2, 1]
+        h2 = [2, 5, 5, 5, 4, 3, -10, 0]
+        for k in range(0, 9):
+            expected_bool = hamming_distance(h1, h2) <= k
+            actual_bool = hamming_distance_within(h1, h2, k)
+            self.assertEqual(actual_bool, expected_bool)
+
+    def test_2(self):
+        """Test 2: Stops at the first mismatch past k"""
+        h1 = [0, 1] + [0] * 10
+        h2 = [1, 0] + [None] * 10
+        actual_bool = hamming_distance_within(h1, h2, 1)
+        self.assertEqual(actual_bool, False)
+
+    def test_3(self):
+        """Test 3: Empty and identical lists"""
+        self.assertEqual(hamming_distance_within([], [], 0), True)
+        self.assertEqual(hamming_distance_within([1, 2, 3], [1, 2, 3], 0), True)
+
+
 class TestPermutation(unittest.TestCase):
     def test_1(self):
         """Test 1: Simple permutation"""
@@ -214,6 +247,73 @@ class TestPermutation(unittest.TestCase):
         self.assertEqual(actual_bool, expected_bool)
 
 
+class TestPermutationStream(unittest.TestCase):
+    def write_ints(self, directory, name, numbers, per_line):
+        """Writes numbers to a text file, per_line ints on each line"""
+        path = os.path.join(directory, name)
+        with open(path, "w", encoding="ascii") as outfile:
+            for start in range(0, len(numbers), per_line):
+                line = numbers[start:start + per_line]
+                outfile.write(" ".join(str(number) for number in line) + "\n")
+        return path
+
+    def test_1(self):
+        """Test 1: Streaming agrees with is_permutation on random iterables"""
+        rng = random.Random(313)
+        for _ in range(50):
+            a = [rng.randint(-5, 5) for _ in range(rng.randint(0, 40))]
+            b = list(a)
+            rng.shuffle(b)
+            if rng.random() < 0.5 and b:
+                b[rng.randrange(len(b))] += 1
+            expected_bool = is_permutation(a, b)
+            actual_bool = is_permutation_stream(iter(a), iter(b), chunk_size=7)
+            self.assertEqual(actual_bool, expected_bool)
+
+    def test_2(self):
+        """Test 2: Both streams empty"""
+        actual_bool = is_permutation_stream(iter([]), iter([]))
+        self.assertEqual(actual_bool, True)
+
+    def test_3(self):
+        """Test 3: Same elements, different frequencies"""
+        actual_bool = is_permutation_stream(iter([1, 2, 2]), iter([2, 1, 1]))
+        self.assertEqual(actual_bool, False)
+
+    def test_4(self):
+        """Test 4: Exits early when the shorter stream runs out"""
+        actual_bool = is_permutation_stream([1, 2, 3], itertools.count(), chunk_size=2)
+        self.assertEqual(actual_bool, False)
+        actual_bool = is_permutation_stream(itertools.count(), [1, 2, 3], chunk_size=2)
+        self.assertEqual(actual_bool, False)
+
+    def test_5(self):
+        """Test 5: File paths with ints split across read blocks"""
+        rng = random.Random(5)
+        a = [rng.randint(-100000, 100000) for _ in range(500)]
+        b = list(a)
+        rng.shuffle(b)
+        with tempfile.TemporaryDirectory() as directory:
+            a_path = self.write_ints(directory, "a.txt", a, 7)
+            b_path = self.write_ints(directory, "b.txt", b, 13)
+            actual_bool = is_permutation_stream(a_path, b_path, block_size=5)
+            self.assertEqual(actual_bool, True)
+
+            b[0] += 1
+            b_path = self.write_ints(directory, "b.txt", b, 13)
+            actual_bool = is_permutation_stream(a_path, b_path, block_size=5)
+            self.assertEqual(actual_bool, False)
+
+    def test_6(self):
+        """Test 6: A file against an iterable, no trailing newline"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "a.txt")
+            with open(path, "w", encoding="ascii") as outfile:
+                outfile.write("3 -1\n2 -1")
+            actual_bool = is_permutation_stream(path, [-1, -1, 2, 3], block_size=3)
+            self.assertEqual(actual_bool, True)
+
+
 class TestVowels(unittest.TestCase):
     def test_1(self):
         """Test 1: Most Vowels"""
@@ -0,0 +1,69 @@
+"""Sharded Execution Test Suite"""
+
+import random
+import unittest
+
+from practice import hamming_distance, is_permutation, most_vowels
+from sharded import (
+    shard_bounds,
+    sharded_hamming_distance,
+    sharded_is_permutation,
+    sharded_most_vowels,
+)
+
+
+class TestShardBounds(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Slices cover the input in order and differ by at most one"""
+        self.assertEqual(shard_bounds(10, 3), [(0, 4), (4, 7), (7, 10)])
+
+    def test_2(self):
+        """Test 2: More shards than elements"""
+        self.assertEqual(shard_bounds(2, 5), [(0, 1), (1, 2)])
+        self.assertEqual(shard_bounds(0, 5), [(0, 0)])
+
+
+class TestSharded(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Sharded Hamming distance equals the scalar result"""
+        rng = random.Random(313)
+        a = [rng.randint(0, 3) for _ in range(1000)]
+        b = [rng.randint(0, 3) for _ in range(1000)]
+        result = sharded_hamming_distance(a, b, shards=4, workers=2)
+        self.assertEqual(result.value, hamming_distance(a, b))
+        self.assertEqual([timing[:2] for timing in result.shard_timings], shard_bounds(1000, 4))
+        self.assertTrue(all(timing[2] >= 0 for timing in result.shard_timings))
+
+    def test_2(self):
+        """Test 2: Sharded permutation check merges signed counters"""
+        rng = random.Random(5)
+        a = [rng.randint(-20, 20) for _ in range(500)]
+        b = list(a)
+        rng.shuffle(b)
+        self.assertEqual(sharded_is_permutation(a, b, shards=3, workers=2).value, True)
+        b[17] += 1
+        self.assertEqual(sharded_is_permutation(a, b, shards=3, workers=2).value, False)
+        self.assertEqual(is_permutation(a, b), False)
+
+    def test_3(self):
+        """Test 3: Different lengths"""
+        result = sharded_is_permutation([1, 2, 3], [1, 2, 3, 4], shards=2)
+        self.assertEqual(result.value, False)
+        self.assertEqual(result.shard_timings, [])
+
+    def test_4(self):
+        """Test 4: Sharded most_vowels keeps the global tie rule"""
+        list_of_strings = ["xyz", None, "ab", "bcd", "ae", "ea", None, "io", "u"]
+        for shards in range(1, 10):
+            result = sharded_most_vowels(list_of_strings, shards=shards, workers=2)
+            self.assertEqual(result.value, most_vowels(list_of_strings))
+
+    def test_5(self):
+        """Test 5: No vowels anywhere returns index 0"""
+        list_of_strings = [None, "xyz", None, "bcd"]
+        result = sharded_most_vowels(list_of_strings, shards=2, workers=2)
+        self.assertEqual(result.value, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
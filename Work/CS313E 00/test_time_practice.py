@@ -0,0 +1,70 @@
+"""Practice Benchmark Regression Gate Test Suite"""
+
+import unittest
+
+from time_practice import find_regressions
+
+
+def entry(function, variant, size, seconds):
+    """One benchmark result, as written by run_benchmarks."""
+    return {"function": function, "variant": variant, "size": size, "seconds": seconds}
+
+
+BASELINE = {
+    "results": [
+        entry("hamming_distance", "practice", 1000, 0.010),
+        entry("hamming_distance", "practice", 10000, 0.100),
+        entry("most_vowels", "corpus", 1000, 0.0001),
+    ]
+}
+
+
+class TestFindRegressions(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Times within the threshold pass"""
+        results = [
+            entry("hamming_distance", "practice", 1000, 0.014),
+            entry("hamming_distance", "practice", 10000, 0.090),
+            entry("most_vowels", "corpus", 1000, 0.0001),
+        ]
+        self.assertEqual(find_regressions(results, BASELINE, 1.5, 1e-3), [])
+
+    def test_2(self):
+        """Test 2: A time over threshold times its baseline is reported"""
+        results = [
+            entry("hamming_distance", "practice", 1000, 0.016),
+            entry("hamming_distance", "practice", 10000, 0.100),
+            entry("most_vowels", "corpus", 1000, 0.0001),
+        ]
+        regressions = find_regressions(results, BASELINE, 1.5, 1e-3)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("hamming_distance [practice] at size 1000", regressions[0])
+        self.assertIn("1.60x", regressions[0])
+
+    def test_3(self):
+        """Test 3: Baseline times under min_seconds are never gated"""
+        results = [
+            entry("hamming_distance", "practice", 1000, 0.010),
+            entry("hamming_distance", "practice", 10000, 0.100),
+            entry("most_vowels", "corpus", 1000, 0.5),
+        ]
+        self.assertEqual(find_regressions(results, BASELINE, 1.5, 1e-3), [])
+        self.assertEqual(len(find_regressions(results, BASELINE, 1.5, 1e-5)), 1)
+
+    def test_4(self):
+        """Test 4: A baseline entry the run did not measure is reported"""
+        results = [entry("hamming_distance", "practice", 1000, 0.010)]
+        regressions = find_regressions(results, BASELINE, 1.5, 1e-3, max_size=10000)
+        self.assertEqual(len(regressions), 1)
+        self.assertIn("at size 10000: not measured", regressions[0])
+        self.assertEqual(len(find_regressions(results, BASELINE, 1.5, 1e-3)), 1)
+
+    def test_5(self):
+        """Test 5: Baseline sizes above the run's largest size are not reported"""
+        results = [entry("hamming_distance", "practice", 1000, 0.010)]
+        self.assertEqual(find_regressions(results, BASELINE, 1.5, 1e-3, max_size=1000), [])
+        self.assertEqual(find_regressions([], BASELINE, 1.5, 1e-3, max_size=100), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
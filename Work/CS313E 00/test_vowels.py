@@ -0,0 +1,84 @@
+"""Corpus-Scale Vowel Counting Test Suite"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from practice import most_vowels
+from vowels import count_vowels, most_vowels_corpus, top_vowels
+
+
+def random_corpus(rng, size):
+    """Seeded random lines of letters, digits and spaces."""
+    alphabet = "aeiouAEIOUbcdfgXYZ0123 !"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        for _ in range(size)
+    ]
+
+
+class TestCountVowels(unittest.TestCase):
+    def test_1(self):
+        """Test 1: str and bytes lines"""
+        self.assertEqual(count_vowels("IT'S NOT ME"), 3)
+        self.assertEqual(count_vowels(b"IT'S NOT ME\n"), 3)
+        self.assertEqual(count_vowels(""), 0)
+
+    def test_2(self):
+        """Test 2: Non-ASCII characters are not vowels"""
+        self.assertEqual(count_vowels("café au lait"), 5)
+        self.assertEqual(count_vowels("café au lait".encode("utf-8")), 5)
+
+
+class TestMostVowelsCorpus(unittest.TestCase):
+    def test_1(self):
+        """Test 1: Same result as most_vowels, including None and ties"""
+        lists = [
+            [None, "AaE", None, "CS313E", "iiiiii", None, "aeiou", None],
+            ["g0rn", "l3s3", "tie", "pie", "lie"],
+            ["", None, "apple", "banana", "    "],
+            ["gym", "HHHH", "Y;LWWW"],
+            [None, "xyz", "bcd"],
+        ]
+        for list_of_strings in lists:
+            expected_result = most_vowels(list_of_strings)
+            actual_result = most_vowels_corpus(iter(list_of_strings))
+            self.assertEqual(actual_result, expected_result)
+
+    def test_2(self):
+        """Test 2: Random corpora agree with most_vowels"""
+        rng = random.Random(313)
+        for _ in range(30):
+            corpus = random_corpus(rng, rng.randint(1, 40))
+            self.assertEqual(most_vowels_corpus(corpus), most_vowels(corpus))
+
+    def test_3(self):
+        """Test 3: Top-k ordered by count, then index"""
+        corpus = ["aa", None, "e", "aa", "iii", "", "o"]
+        expected = [(4, 3), (0, 2), (3, 2), (2, 1)]
+        self.assertEqual(top_vowels(corpus, 4), expected)
+        self.assertEqual(top_vowels(corpus, 0), [])
+
+    def test_4(self):
+        """Test 4: Files, sequential and parallel with tiny chunks"""
+        rng = random.Random(5)
+        corpus = random_corpus(rng, 300)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "corpus.txt")
+            with open(path, "w", encoding="ascii") as outfile:
+                outfile.write("\n".join(corpus))
+
+            expected_result = most_vowels(corpus)
+            self.assertEqual(most_vowels_corpus(path), expected_result)
+            self.assertEqual(
+                most_vowels_corpus(path, workers=2, chunk_bytes=97), expected_result
+            )
+
+            expected_top = top_vowels(corpus, 10)
+            self.assertEqual(top_vowels(path, 10), expected_top)
+            self.assertEqual(top_vowels(path, 10, workers=3, chunk_bytes=64), expected_top)
+
+
+if __name__ == "__main__":
+    unittest.main()
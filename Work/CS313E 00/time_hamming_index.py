@@ -0,0 +1,102 @@
+"""Hamming Index Benchmark
+
+Times HammingIndex radius and k-NN queries against a brute-force scan with
+practice.hamming_distance as the number of stored vectors grows, and checks
+that both return the same results. Radius queries and small-k queries over
+clustered data visit a shrinking fraction of the tree as it grows; k-NN
+queries whose k-th neighbor is far away degrade toward a full scan.
+
+usage: python3 time_hamming_index.py [--max-size 1000000] [--length 64]
+       [--queries 20] [--radius 3] [--k 1] [--cluster 8] [--seed 313]
+"""
+
+import argparse
+import random
+import time
+
+from practice import hamming_distance
+from hamming_index import HammingIndex
+
+
+def perturb(rng, vector, flips):
+    """Returns a copy of a 0/1 vector with `flips` random positions inverted."""
+    copy = list(vector)
+    for position in rng.sample(range(len(copy)), flips):
+        copy[position] = 1 - copy[position]
+    return copy
+
+
+def brute_force_nearest(vectors, query, k):
+    """k-NN by linear scan, the workload the index replaces."""
+    return sorted(
+        (hamming_distance(query, vector), item_id)
+        for item_id, vector in enumerate(vectors)
+    )[:k]
+
+
+def main():
+    """Runs the benchmark and prints one row per index size."""
+    parser = argparse.ArgumentParser(description="Hamming index benchmark")
+    parser.add_argument("--max-size", type=int, default=1_000_000)
+    parser.add_argument("--length", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--radius", type=int, default=3)
+    parser.add_argument("--k", type=int, default=1)
+    parser.add_argument("--cluster", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=313)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    index = HammingIndex(args.length)
+    vectors = []
+
+    print(
+        f"{'size':>10} {'insert us':>10} {'radius ms':>10} {'knn ms':>10} "
+        f"{'scan ms':>10} {'speedup':>8}"
+    )
+
+    size = 1000
+    while size <= args.max_size:
+        inserted = size - len(vectors)
+        start_time = time.perf_counter()
+        while len(vectors) < size:
+            # stored vectors come in small clusters of near-duplicates
+            center = [rng.randrange(2) for _ in range(args.length)]
+            for _ in range(min(args.cluster, size - len(vectors))):
+                vector = perturb(rng, center, rng.randint(0, args.radius))
+                vectors.append(vector)
+                index.insert(vector)
+        insert_time = (time.perf_counter() - start_time) / inserted
+
+        # queries are near-duplicates of stored vectors, as in dedup workloads
+        queries = [
+            perturb(rng, rng.choice(vectors), args.radius) for _ in range(args.queries)
+        ]
+
+        start_time = time.perf_counter()
+        for query in queries:
+            index.radius_query(query, args.radius)
+        radius_time = (time.perf_counter() - start_time) / len(queries)
+
+        start_time = time.perf_counter()
+        results = [index.nearest(query, args.k) for query in queries]
+        knn_time = (time.perf_counter() - start_time) / len(queries)
+
+        # the linear scan is slow at large sizes, so only time a few queries
+        scan_queries = queries[:3]
+        start_time = time.perf_counter()
+        expected = [brute_force_nearest(vectors, query, args.k) for query in scan_queries]
+        scan_time = (time.perf_counter() - start_time) / len(scan_queries)
+
+        assert results[:len(scan_queries)] == expected, "index disagrees with scan"
+
+        print(
+            f"{size:>10} {insert_time * 1e6:>10.1f} {radius_time * 1e3:>10.2f} "
+            f"{knn_time * 1e3:>10.2f} {scan_time * 1e3:>10.2f} "
+            f"{scan_time / knn_time:>7.1f}x"
+        )
+        size *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""Practice Benchmark Suite
+
+Times every implementation of hamming_distance, is_permutation and
+most_vowels on seeded inputs from 10 to 10^7 elements, writes the results to
+JSON and, given a stored baseline, fails if any variant got slower than the
+allowed threshold.
+
+usage: python3 time_practice.py [--max-exponent 7] [--repeat 3]
+       [--output bench_practice.json] [--baseline baseline.json]
+       [--threshold 1.5]
+
+Sizes count list elements for hamming_distance and is_permutation and total
+characters for most_vowels (strings of STRING_LENGTH characters).
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from practice import (
+    hamming_distance,
+    hamming_distance_within,
+    is_permutation,
+    is_permutation_stream,
+    most_vowels,
+)
+from hamming import hamming_distance_batch, hamming_distance_within_chunked
+from fingerprint import is_permutation_fingerprint
+from vowels import most_vowels_corpus
+from sharded import sharded_hamming_distance, sharded_is_permutation, sharded_most_vowels
+
+STRING_LENGTH = 10
+SHARDS = 4
+
+
+def generate_inputs(size, seed):
+    """
+    Generates the seeded inputs of every benchmarked function for one size.
+    """
+
+    rng = random.Random(seed + size)
+    a_bits = [rng.randint(0, 1) for _ in range(size)]
+    b_bits = [rng.randint(0, 1) for _ in range(size)]
+    b_perm = list(a_bits)
+    rng.shuffle(b_perm)
+    letters = "aeiouAEIOUbcdfghjklmnpqrstvwxyz"
+    strings = [
+        "".join(rng.choices(letters, k=STRING_LENGTH))
+        for _ in range(max(1, size // STRING_LENGTH))
+    ]
+    return {"a": a_bits, "b": b_bits, "b_perm": b_perm, "strings": strings}
+
+
+# function name -> variant name -> callable taking the generated inputs
+VARIANTS = {
+    "hamming_distance": {
+        "practice": lambda data: hamming_distance(data["a"], data["b"]),
+        "batch": lambda data: hamming_distance_batch([data["a"]], data["b"]),
+        "batch_packed": lambda data: hamming_distance_batch(
+            [data["a"]], data["b"], packed=True
+        ),
+        "sharded": lambda data: sharded_hamming_distance(data["a"], data["b"], SHARDS),
+        # "within k" checks with k at a quarter of the length; random bit
+        # vectors differ in about half their positions, so both exit early
+        "within": lambda data: hamming_distance_within(
+            data["a"], data["b"], len(data["a"]) // 4
+        ),
+        "within_chunked": lambda data: hamming_distance_within_chunked(
+            data["a"], data["b"], len(data["a"]) // 4
+        ),
+    },
+    "is_permutation": {
+        "practice": lambda data: is_permutation(data["a"], data["b_perm"]),
+        "stream": lambda data: is_permutation_stream(data["a"], data["b_perm"]),
+        "fingerprint": lambda data: is_permutation_fingerprint(
+            data["a"], data["b_perm"], verify=False
+        ),
+        "sharded": lambda data: sharded_is_permutation(data["a"], data["b_perm"], SHARDS),
+    },
+    "most_vowels": {
+        "practice": lambda data: most_vowels(data["strings"]),
+        "corpus": lambda data: most_vowels_corpus(data["strings"]),
+        "sharded": lambda data: sharded_most_vowels(data["strings"], SHARDS),
+    },
+}
+
+
+def time_call(function, data, repeat):
+    """Returns the best wall time of repeat calls of function(data)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(data)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+def run_benchmarks(max_exponent, repeat, seed, time_limit):
+    """
+    Times every variant at sizes 10, 100, ..., 10^max_exponent.
+
+    A variant whose run takes longer than time_limit seconds is skipped for
+    every larger size, the same way time_graph.py stops the slow algorithms.
+    """
+
+    results = []
+    skipped = set()
+    for exponent in range(1, max_exponent + 1):
+        size = 10 ** exponent
+        data = generate_inputs(size, seed)
+        for function_name, variants in VARIANTS.items():
+            for variant_name, function in variants.items():
+                if (function_name, variant_name) in skipped:
+                    continue
+                seconds = time_call(function, data, repeat)
+                results.append(
+                    {
+                        "function": function_name,
+                        "variant": variant_name,
+                        "size": size,
+                        "seconds": seconds,
+                    }
+                )
+                print(f"{function_name:>17} {variant_name:>15} {size:>9} {seconds:>12.6f}s")
+                if seconds > time_limit:
+                    skipped.add((function_name, variant_name))
+    return results
+
+
+def find_regressions(results, baseline, threshold, min_seconds, max_size=None):
+    """
+    Compares results to a baseline run.
+
+    post: returns a list of messages, one per (function, variant, size) whose
+    time exceeds threshold times its baseline time, and one per baseline
+    entry up to max_size (any size if max_size is None) that results did not
+    measure: a variant removed or renamed, or a size cut off by the time
+    limit. Larger baseline sizes were left out of this run on purpose and
+    are not reported. Baseline times under min_seconds are too noisy to gate
+    on and are ignored.
+    """
+
+    expected = {
+        (entry["function"], entry["variant"], entry["size"]): entry["seconds"]
+        for entry in baseline["results"]
+    }
+
+    measured = set()
+    regressions = []
+    for entry in results:
+        key = (entry["function"], entry["variant"], entry["size"])
+        measured.add(key)
+        if key not in expected or expected[key] < min_seconds:
+            continue
+        ratio = entry["seconds"] / expected[key]
+        if ratio > threshold:
+            regressions.append(
+                f"{key[0]} [{key[1]}] at size {key[2]}: {entry['seconds']:.6f}s is "
+                f"{ratio:.2f}x the baseline {expected[key]:.6f}s"
+            )
+
+    for key, seconds in expected.items():
+        if key in measured or seconds < min_seconds:
+            continue
+        if max_size is None or key[2] <= max_size:
+            regressions.append(
+                f"{key[0]} [{key[1]}] at size {key[2]}: not measured "
+                f"(baseline {seconds:.6f}s)"
+            )
+    return regressions
+
+
+def main():
+    """Runs the suite, writes JSON and applies the regression gate."""
+    parser = argparse.ArgumentParser(description="practice.py benchmark suite")
+    parser.add_argument("--max-exponent", type=int, default=7, choices=range(1, 8))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=313)
+    parser.add_argument("--time-limit", type=float, default=2.0)
+    parser.add_argument("--output", default="bench_practice.json")
+    parser.add_argument("--baseline", default=None)
+    parser.add_argument("--threshold", type=float, default=1.5)
+    parser.add_argument("--min-seconds", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.max_exponent, args.repeat, args.seed, args.time_limit)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as outfile:
+        json.dump(report, outfile, indent=2)
+    print(f"wrote {len(results)} results to {args.output}")
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, "r", encoding="utf-8") as infile:
+        baseline = json.load(infile)
+    regressions = find_regressions(
+        results, baseline, args.threshold, args.min_seconds, 10 ** args.max_exponent
+    )
+    for message in regressions:
+        print("REGRESSION:", message)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
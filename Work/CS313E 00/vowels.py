@@ -0,0 +1,172 @@
+"""
+Corpus-Scale Vowel Counting
+
+Versions of practice.most_vowels for files and iterators far too large to
+hold as a list. Each line is counted with one C-level bytes.translate call
+(delete the vowel bytes, compare lengths) instead of a per-character Python
+loop; str lines are UTF-8 encoded first, which never turns another character
+into an ASCII vowel byte. The same tie rule applies: the index closest to
+zero wins.
+"""
+
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+VOWELS = "AaEeIiOoUu"
+VOWEL_BYTES = VOWELS.encode("ascii")
+
+# Bytes of a file handled by one worker in parallel mode
+CHUNK_BYTES = 64 << 20
+
+
+def count_vowels(text):
+    """
+    Counts the vowels in a str or bytes line.
+
+    pre: text is a str or a bytes object holding ASCII-compatible text
+    (such as UTF-8).
+    post: returns the number of characters in text that are one of
+    'A', 'a', 'E', 'e', 'I', 'i', 'O', 'o', 'U', or 'u'.
+    """
+
+    if isinstance(text, str):
+        text = text.encode("utf-8", "surrogatepass")
+    return len(text) - len(text.translate(None, VOWEL_BYTES))
+
+
+def _vowel_counts(source):
+    """
+    Yields (index, vowel count) for every line of a corpus, skipping None.
+
+    pre: source is an iterable of str/bytes/None or a path to a text file.
+    post: indices count every element or line, including skipped Nones.
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as infile:
+            for index, line in enumerate(infile):
+                yield index, count_vowels(line)
+        return
+
+    for index, text in enumerate(source):
+        if text is not None:
+            yield index, count_vowels(text)
+
+
+def _best(pairs, k):
+    """
+    Selects the k best (index, count) pairs: most vowels first, ties broken
+    by the smaller index. Only k pairs are held in memory at a time.
+    """
+
+    return heapq.nsmallest(k, pairs, key=lambda pair: (-pair[1], pair[0]))
+
+
+def _scan_range(path, start, end, k):
+    """
+    Counts the lines of a file that begin at a byte offset in [start, end).
+
+    pre: path is a text file, 0 <= start <= end, k >= 1.
+    post: returns (number of lines, best k (local index, count) pairs), where
+    local indices count from the first line that begins at or after start.
+    """
+
+    pairs = []
+    line_count = 0
+    with open(path, "rb") as infile:
+        if start > 0:
+            # a line that straddles start belongs to the previous range
+            infile.seek(start - 1)
+            if infile.read(1) != b"\n":
+                infile.readline()
+
+        position = infile.tell()
+        for line in infile:
+            if position >= end:
+                break
+            pairs.append((line_count, count_vowels(line)))
+            if len(pairs) >= 4 * k + 1024:
+                pairs = _best(pairs, k)
+            position += len(line)
+            line_count += 1
+
+    return line_count, _best(pairs, k)
+
+
+def _top_vowels_parallel(path, k, workers, chunk_bytes):
+    """
+    Splits a file into byte ranges, scans them in a process pool and merges
+    the per-range results into global (index, count) pairs.
+    """
+
+    size = os.path.getsize(path)
+    ranges = [(start, min(start + chunk_bytes, size)) for start in range(0, size, chunk_bytes)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                _scan_range,
+                [path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                [k] * len(ranges),
+            )
+        )
+
+    # shift local indices by the number of lines in every earlier range
+    candidates = []
+    offset = 0
+    for line_count, pairs in results:
+        candidates.extend((offset + index, count) for index, count in pairs)
+        offset += line_count
+
+    return _best(candidates, k)
+
+
+def top_vowels(source, k, workers=1, chunk_bytes=CHUNK_BYTES):
+    """
+    Finds the k strings of a corpus with the most vowels.
+
+    pre: source is an iterable of strings (str, bytes or None) or a path to a
+    text file with one string per line. k >= 0. workers >= 1 and
+    chunk_bytes > 0 only apply when source is a path.
+    post: returns a list of at most k (index, vowel count) tuples ordered by
+    vowel count, most first, with ties ordered by index. None elements are
+    skipped but still counted in the indices. If source is a path and
+    workers > 1, byte ranges of chunk_bytes are scanned in worker processes.
+    """
+
+    if k <= 0:
+        return []
+    if workers > 1 and isinstance(source, (str, os.PathLike)):
+        return _top_vowels_parallel(source, k, workers, chunk_bytes)
+    return _best(_vowel_counts(source), k)
+
+
+def most_vowels_corpus(source, workers=1, chunk_bytes=CHUNK_BYTES):
+    """
+    Determine the index of the string with the largest number of vowels in a
+    corpus that may be too large to hold in memory.
+
+    pre: source is an iterable of strings (str, bytes or None) or a path to a
+    text file with one string per line. workers and chunk_bytes are as in
+    top_vowels.
+    post: returns the same index as practice.most_vowels(list(source)),
+    including its tie rule (the index closest to zero wins) and its result of
+    0 when no string has a vowel.
+    """
+
+    if workers > 1 and isinstance(source, (str, os.PathLike)):
+        best = top_vowels(source, 1, workers, chunk_bytes)
+        return best[0][0] if best and best[0][1] > 0 else 0
+
+    # running maximum; a strictly larger count is needed to move the index,
+    # so the earliest of tied strings wins
+    best_index = 0
+    best_count = 0
+    for index, count in _vowel_counts(source):
+        if count > best_count:
+            best_index = index
+            best_count = count
+    return best_index
@@ -6,42 +6,52 @@ This file will not be checked for PEP8
 
 import tkinter as tk
 import argparse
-from traversals import (
-    row_zigzag_traversal,
-    column_zigzag_traversal,
-    main_diagonal_traversal,
-    secondary_diagonal_traversal,
-    spiral_traversal,
-)
-
-traversal_functions = {
-    "row_zigzag": row_zigzag_traversal,
-    "column_zigzag": column_zigzag_traversal,
-    "main": main_diagonal_traversal,
-    "secondary": secondary_diagonal_traversal,
-    "spiral": spiral_traversal,
-}
+import time
+from itertools import islice
+from traversals import TRAVERSAL_FUNCTIONS
+
+
+# Render modes: "cells" builds one tk.Canvas widget per cell and animates one
+# cell per timer callback; "canvas" draws the whole grid as rectangle items on
+# a single canvas and animates many cells per frame.
+RENDER_MODES = ("cells", "canvas")
+
+# Frame interval of the canvas mode, about 60 frames per second
+FRAME_MS = 16
+
+# Largest side of the canvas in pixels; cells shrink to fit big grids
+CANVAS_PIXELS = 800
 
 
 class GridTraversalApp:
     """Graphical User Interface for the Traversals assignment"""
 
-    def __init__(self, master, rows, cols, speed):
+    def __init__(self, master, rows, cols, speed, render="cells"):
         self.master = master
         self.actual_grid = [[None for _ in range(cols)] for _ in range(rows)]
         rows, cols = rows + 2, cols + 2
-        self.grid_cells = [[None for _ in range(cols)] for _ in range(rows)]
+        self.columns = cols
         self.speed = speed
+        self.render = render
 
         self.current_traversal = None
 
         self.after_id = None
 
+        # clock and progress of the running canvas mode traversal
+        self.start_time = 0.0
+        self.cells_drawn = 0
+
         self.create_navigation_bar()
 
         # Creates the grid
         grid_frame = tk.Frame(self.master)
         grid_frame.grid(row=1, column=0, padx=10, pady=10)
+        if render == "canvas":
+            self.create_canvas(grid_frame, rows, cols)
+            return
+
+        self.grid_cells = [[None for _ in range(cols)] for _ in range(rows)]
         for i in range(rows):
             for j in range(cols):
                 if i == 0 or j == 0 or i == rows - 1 or j == cols - 1:
@@ -67,10 +77,38 @@ class GridTraversalApp:
             label = tk.Label(grid_frame, text=f"Col {j - 1}")
             label.grid(row=rows, column=j)
 
+    def create_canvas(self, grid_frame, rows, cols):
+        """
+        Draws the grid, including its grey border, as rectangle items on one
+        canvas. self.cell_items[r][c] is the item ID of cell (r, c) of the
+        bordered grid and self.cell_orange[r][c] whether it is orange.
+        Row and column labels are left out, as they do not fit big grids.
+        """
+        size = max(1, min(50, CANVAS_PIXELS // max(rows, cols)))
+        outline = "black" if size >= 4 else ""
+        self.canvas = tk.Canvas(
+            grid_frame, width=cols * size, height=rows * size, highlightthickness=0
+        )
+        self.canvas.grid(row=0, column=0)
+        self.cell_items = [[None for _ in range(cols)] for _ in range(rows)]
+        self.cell_orange = [[False for _ in range(cols)] for _ in range(rows)]
+        for i in range(rows):
+            for j in range(cols):
+                border = i == 0 or j == 0 or i == rows - 1 or j == cols - 1
+                self.cell_items[i][j] = self.canvas.create_rectangle(
+                    j * size,
+                    i * size,
+                    (j + 1) * size,
+                    (i + 1) * size,
+                    fill="grey" if border else "white",
+                    outline=outline,
+                    tags="border" if border else "interior",
+                )
+
     def create_navigation_bar(self):
         """Creates the UI for the traversals"""
         navigation_frame = tk.Frame(self.master)
-        navigation_frame.grid(row=0, column=0, columnspan=len(self.grid_cells[0]))
+        navigation_frame.grid(row=0, column=0, columnspan=self.columns)
 
         texts = [
             "Row Zigzag",
@@ -81,7 +119,7 @@ class GridTraversalApp:
             "Exit",
         ]
 
-        buttons = zip(texts, [*traversal_functions.values()] + [self.master.destroy])
+        buttons = zip(texts, [*TRAVERSAL_FUNCTIONS.values()] + [self.master.destroy])
 
         for i, (text, command) in enumerate(buttons):
             if text == texts[-1]:
@@ -100,25 +138,70 @@ class GridTraversalApp:
         if self.after_id is not None:
             self.master.after_cancel(self.after_id)
         self.current_traversal = iter(traversal_function(self.actual_grid))
-        self.update_grid()
+        if self.render == "canvas":
+            self.start_time = time.perf_counter()
+            self.cells_drawn = 0
+            self.update_canvas()
+        else:
+            self.update_grid()
 
     def update_grid(self):
         """Updates the grid based on the provided coordinates"""
         try:
-            r, c = next(self.current_traversal)
-            r += 1
-            c += 1
-            current_color = self.grid_cells[r][c].cget("bg")
-            if current_color == "orange":
-                self.grid_cells[r][c].configure(bg="black")
-            else:
-                self.grid_cells[r][c].configure(bg="orange")
+            self.paint_cells([next(self.current_traversal)])
             self.after_id = self.master.after(self.speed, self.update_grid)
         except StopIteration:
             pass
 
+    def paint_cells(self, coordinates):
+        """
+        Colors every (row, column) of coordinates, orange on the first visit
+        and then alternating between black and orange, in both render modes.
+        """
+        if self.render != "canvas":
+            for r, c in coordinates:
+                cell = self.grid_cells[r + 1][c + 1]
+                if cell.cget("bg") == "orange":
+                    cell.configure(bg="black")
+                else:
+                    cell.configure(bg="orange")
+            return
+
+        for r, c in coordinates:
+            r += 1
+            c += 1
+            orange = self.cell_orange[r][c]
+            self.canvas.itemconfigure(
+                self.cell_items[r][c], fill="black" if orange else "orange"
+            )
+            self.cell_orange[r][c] = not orange
+
+    def update_canvas(self):
+        """
+        Draws every cell that is due by the clock, speed milliseconds per
+        cell, then schedules the next frame. Frames come every FRAME_MS (or
+        every speed milliseconds if that is longer); a frame that runs late
+        draws more cells instead of slowing the animation down, so frames
+        are skipped rather than the traversal falling behind.
+        """
+        elapsed_ms = (time.perf_counter() - self.start_time) * 1000
+        wanted = int(elapsed_ms / self.speed) + 1 - self.cells_drawn
+        batch = list(islice(self.current_traversal, wanted))
+        self.paint_cells(batch)
+        self.cells_drawn += len(batch)
+        # a short batch means the traversal is finished
+        if len(batch) == wanted:
+            self.after_id = self.master.after(
+                max(FRAME_MS, int(self.speed)), self.update_canvas
+            )
+
     def reset_grid(self):
         """Resets the grid back to white"""
+        if self.render == "canvas":
+            self.canvas.itemconfigure("interior", fill="white")
+            for row in self.cell_orange:
+                row[:] = [False] * len(row)
+            return
         rows, cols = len(self.grid_cells), len(self.grid_cells[0])
         for i, row in enumerate(self.grid_cells):
             for j, cell in enumerate(row):
@@ -135,26 +218,42 @@ if __name__ == "__main__":
         "--rows",
         type=int,
         default=5,
-        choices=range(1, 11),
-        help="Number of rows in the matrix (between 1 and 10)",
+        help="Number of rows in the matrix (1 to 10, or 1 to 1000 with --render canvas)",
     )
     parser.add_argument(
         "--columns",
         type=int,
         default=5,
-        choices=range(1, 11),
-        help="Number of columns in the matrix (between 1 and 10)",
+        help="Number of columns in the matrix (1 to 10, or 1 to 1000 with --render canvas)",
     )
     parser.add_argument(
         "--speed",
-        type=int,
+        type=float,
         default=100,
-        choices=range(50, 1001, 50),
-        help="Speed of grid updates in milliseconds",
+        help="Speed of grid updates in milliseconds per cell (50 to 1000 in "
+        "steps of 50, or any positive value with --render canvas)",
+    )
+    parser.add_argument(
+        "--render",
+        default="cells",
+        choices=RENDER_MODES,
+        help="One widget per cell, or the whole grid on a single canvas",
     )
 
     args = parser.parse_args()
 
+    if args.render == "canvas":
+        if not (1 <= args.rows <= 1000 and 1 <= args.columns <= 1000):
+            parser.error("rows and columns must be between 1 and 1000")
+        if args.speed <= 0:
+            parser.error("speed must be positive")
+    else:
+        if not (1 <= args.rows <= 10 and 1 <= args.columns <= 10):
+            parser.error("rows and columns must be between 1 and 10")
+        if args.speed not in range(50, 1001, 50):
+            parser.error("speed must be a multiple of 50 between 50 and 1000")
+        args.speed = int(args.speed)
+
     root = tk.Tk()
-    app = GridTraversalApp(root, args.rows, args.columns, args.speed)
+    app = GridTraversalApp(root, args.rows, args.columns, args.speed, args.render)
     root.mainloop()
@@ -0,0 +1,111 @@
+"""
+NumPy Traversal Index Arrays Test Suite
+"""
+
+import unittest
+
+import numpy as np
+
+from traversals import TRAVERSAL_FUNCTIONS, TRAVERSAL_KINDS, iter_traversal_range
+from traversal_arrays import (
+    traversal_coordinate_range,
+    traversal_indices,
+    traversal_order,
+    traversal_rank_grid,
+    gather_traversal,
+    scatter_traversal,
+)
+import traversal_arrays
+
+
+class TestTraversalArrays(unittest.TestCase):
+    """Traversal Index Array Test Suite"""
+
+    def test_all_shapes(self):
+        """Index arrays: same coordinates as the lists, 1x1 to 12x12"""
+        for rows in range(1, 13):
+            for cols in range(1, 13):
+                grid = [[0] * cols for _ in range(rows)]
+                for kind in TRAVERSAL_KINDS:
+                    with self.subTest(kind=kind, rows=rows, cols=cols):
+                        row_indices, col_indices = traversal_indices(kind, rows, cols)
+                        actual = list(zip(row_indices.tolist(), col_indices.tolist()))
+                        self.assertEqual(actual, TRAVERSAL_FUNCTIONS[kind](grid))
+
+    def test_dtype(self):
+        """Index arrays: int32 by default, int64 on request"""
+        self.assertEqual(traversal_order("spiral", 4, 5).dtype, np.int32)
+        order = traversal_order("spiral", 4, 5, dtype=np.int64)
+        self.assertEqual(order.dtype, np.int64)
+
+    def test_bands(self):
+        """Index arrays: building in many small row bands gives the same plan"""
+        expected = {kind: traversal_order(kind, 23, 9) for kind in TRAVERSAL_KINDS}
+        original = traversal_arrays.BAND_CELLS
+        traversal_arrays.BAND_CELLS = 7
+        try:
+            for kind in TRAVERSAL_KINDS:
+                self.assertTrue(np.array_equal(traversal_order(kind, 23, 9), expected[kind]))
+        finally:
+            traversal_arrays.BAND_CELLS = original
+
+    def test_rank_grid(self):
+        """Rank grid: inverse of the flat permutation"""
+        ranks = traversal_rank_grid("main", 6, 4)
+        order = traversal_order("main", 6, 4)
+        self.assertTrue(np.array_equal(ranks.reshape(-1)[order], np.arange(24)))
+
+    def test_gather_scatter(self):
+        """Gather and scatter: round trip, including trailing dimensions"""
+        grid = np.arange(7 * 5 * 3).reshape(7, 5, 3)
+        for kind in TRAVERSAL_KINDS:
+            flat = gather_traversal(grid, kind)
+            expected = [grid[row, col] for row, col in TRAVERSAL_FUNCTIONS[kind](grid.tolist())]
+            self.assertTrue(np.array_equal(flat, np.array(expected)))
+            self.assertTrue(np.array_equal(scatter_traversal(flat, kind, (7, 5)), grid))
+
+    def test_coordinate_range(self):
+        """Coordinate range: every slice start matches iter_traversal_range"""
+        for rows in range(1, 10):
+            for cols in range(1, 10):
+                total = rows * cols
+                for kind in TRAVERSAL_KINDS:
+                    for start in range(total + 1):
+                        with self.subTest(kind=kind, rows=rows, cols=cols, start=start):
+                            row_indices, col_indices = traversal_coordinate_range(
+                                kind, rows, cols, start, total
+                            )
+                            actual = list(zip(row_indices.tolist(), col_indices.tolist()))
+                            expected = list(iter_traversal_range(kind, rows, cols, start, total))
+                            self.assertEqual(actual, expected)
+
+    def test_coordinate_range_bands(self):
+        """Coordinate range: small bands and wide grids give the same arrays"""
+        original = traversal_arrays.BAND_CELLS
+        traversal_arrays.BAND_CELLS = 5
+        try:
+            for kind in TRAVERSAL_KINDS:
+                for rows, cols in [(3, 400), (400, 3), (31, 17)]:
+                    with self.subTest(kind=kind, rows=rows, cols=cols):
+                        row_indices, col_indices = traversal_coordinate_range(
+                            kind, rows, cols, 11, rows * cols - 2
+                        )
+                        self.assertEqual(row_indices.dtype, np.int32)
+                        actual = list(zip(row_indices.tolist(), col_indices.tolist()))
+                        expected = list(iter_traversal_range(kind, rows, cols, 11, rows * cols - 2))
+                        self.assertEqual(actual, expected)
+        finally:
+            traversal_arrays.BAND_CELLS = original
+
+    def test_unknown_kind(self):
+        """Index arrays: unknown kind raises a ValueError"""
+        with self.assertRaises(ValueError):
+            traversal_order("zigzag", 3, 3)
+        with self.assertRaises(ValueError):
+            traversal_coordinate_range("zigzag", 3, 3, 0, 9)
+        with self.assertRaises(IndexError):
+            traversal_coordinate_range("main", 3, 3, 4, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Traversal Plan Cache Test Suite
+"""
+
+import threading
+import unittest
+
+import numpy as np
+
+from traversal_arrays import traversal_order
+from traversal_cache import TraversalPlanCache, cached_traversal_order
+
+
+class TestTraversalPlanCache(unittest.TestCase):
+    """Traversal Plan Cache Test Suite"""
+
+    def test_1(self):
+        """Test 1: The second lookup of a shape is a hit"""
+        cache = TraversalPlanCache()
+        first = cache.get("spiral", 6, 4)
+        second = cache.get("spiral", 6, 4)
+        cache.get("main", 6, 4)
+        self.assertIs(first, second)
+        self.assertTrue(np.array_equal(first, traversal_order("spiral", 6, 4)))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 2, "plans": 2, "bytes": 192})
+
+    def test_2(self):
+        """Test 2: Cached plans cannot be modified by callers"""
+        plan = TraversalPlanCache().get("row_zigzag", 3, 3)
+        with self.assertRaises(ValueError):
+            plan[0] = 5
+
+    def test_3(self):
+        """Test 3: Least recently used plans are evicted by total bytes"""
+        # every 5x5 int32 plan takes 100 bytes
+        cache = TraversalPlanCache(max_bytes=250)
+        cache.get("row_zigzag", 5, 5)
+        cache.get("column_zigzag", 5, 5)
+        cache.get("row_zigzag", 5, 5)
+        cache.get("spiral", 5, 5)
+        self.assertIn(("row_zigzag", 5, 5), cache)
+        self.assertIn(("spiral", 5, 5), cache)
+        self.assertNotIn(("column_zigzag", 5, 5), cache)
+        self.assertEqual(cache.stats()["bytes"], 200)
+
+    def test_4(self):
+        """Test 4: A plan larger than the budget is returned, not stored"""
+        cache = TraversalPlanCache(max_bytes=10)
+        plan = cache.get("main", 4, 4)
+        self.assertEqual(len(plan), 16)
+        self.assertEqual(len(cache), 0)
+
+    def test_5(self):
+        """Test 5: Concurrent lookups agree and every call is counted"""
+        cache = TraversalPlanCache()
+        kinds = ["row_zigzag", "column_zigzag", "main", "secondary", "spiral"]
+        errors = []
+
+        def worker():
+            for i in range(200):
+                kind = kinds[i % len(kinds)]
+                plan = cache.get(kind, 9, 7)
+                if not np.array_equal(plan, traversal_order(kind, 9, 7)):
+                    errors.append(kind)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        self.assertEqual(errors, [])
+        self.assertEqual(stats["hits"] + stats["misses"], 1600)
+        self.assertEqual(stats["plans"], 5)
+
+    def test_6(self):
+        """Test 6: The module-level helper reuses one plan"""
+        self.assertIs(cached_traversal_order("secondary", 3, 8),
+                      cached_traversal_order("secondary", 3, 8))
+
+    def test_7(self):
+        """Test 7: clear() empties the cache and resets counters"""
+        cache = TraversalPlanCache()
+        cache.get("spiral", 2, 2)
+        cache.clear()
+        self.assertEqual(cache.stats(), {"hits": 0, "misses": 0, "plans": 0, "bytes": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
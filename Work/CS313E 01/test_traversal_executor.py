@@ -0,0 +1,58 @@
+"""
+Tiled Traversal Executor Test Suite
+"""
+
+import unittest
+
+import numpy as np
+
+from traversals import TRAVERSAL_FUNCTIONS, TRAVERSAL_KINDS
+from traversal_executor import run_traversal, run_traversal_vectorized
+
+
+def naive(grid, kind, callback):
+    """Reference: apply callback coordinate by coordinate"""
+    return [callback(grid[row][col]) for row, col in TRAVERSAL_FUNCTIONS[kind](grid)]
+
+
+class TestTraversalExecutor(unittest.TestCase):
+    """Tiled Traversal Executor Test Suite"""
+
+    def test_1(self):
+        """Test 1: List grids match per-coordinate access for odd tile sizes"""
+        for rows, cols in ((1, 1), (1, 9), (9, 1), (7, 11), (16, 5)):
+            grid = [[row * cols + col for col in range(cols)] for row in range(rows)]
+            for kind in TRAVERSAL_KINDS:
+                with self.subTest(kind=kind, rows=rows, cols=cols):
+                    expected = naive(grid, kind, lambda value: value * 2 + 1)
+                    actual = run_traversal(grid, kind, lambda value: value * 2 + 1, 3, 4)
+                    self.assertEqual(actual, expected)
+
+    def test_2(self):
+        """Test 2: Every cell is passed to the callback exactly once"""
+        grid = [[(row, col) for col in range(6)] for row in range(5)]
+        seen = []
+        run_traversal(grid, "spiral", seen.append, 2, 2)
+        self.assertEqual(sorted(seen), sorted(value for row in grid for value in row))
+
+    def test_3(self):
+        """Test 3: NumPy grids with scalar and vectorized callbacks"""
+        grid = np.arange(13 * 10).reshape(13, 10)
+        for kind in TRAVERSAL_KINDS:
+            with self.subTest(kind=kind):
+                expected = naive(grid.tolist(), kind, lambda value: value % 7)
+                actual = run_traversal(grid, kind, lambda value: int(value) % 7, 4, 3)
+                self.assertEqual(actual, expected)
+                vectorized = run_traversal_vectorized(grid, kind, lambda tile: tile % 7, 4, 3)
+                self.assertEqual(vectorized.tolist(), expected)
+
+    def test_4(self):
+        """Test 4: Unknown kind raises a ValueError"""
+        with self.assertRaises(ValueError):
+            run_traversal([[1]], "diagonal", abs)
+        with self.assertRaises(ValueError):
+            run_traversal_vectorized(np.ones((2, 2)), "diagonal", abs)
+
+
+if __name__ == "__main__":
+    unittest.main()
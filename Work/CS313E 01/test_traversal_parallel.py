@@ -0,0 +1,86 @@
+"""Parallel Chunked Traversal Test Suite"""
+
+import operator
+import unittest
+
+import numpy as np
+
+from traversals import TRAVERSAL_FUNCTIONS, TRAVERSAL_KINDS, iter_traversal_range
+from traversal_parallel import parallel_reduce, parallel_traversal, position_ranges
+from test_traversals import make_grid
+
+
+def weighted_sum(total, coordinate):
+    """Order-independent reduction used by the tests."""
+    return total + coordinate[0] * 1000 + coordinate[1]
+
+
+def append_row(rows, coordinate):
+    """Order-dependent reduction used by the tests."""
+    return rows + (coordinate[0],)
+
+
+class TestTraversalRange(unittest.TestCase):
+    """Tests for iter_traversal_range."""
+
+    def test_1(self):
+        """Test 1: Every traversal range matches its slice of the list traversal"""
+        for kind in TRAVERSAL_KINDS:
+            for rows, cols in [(1, 1), (1, 5), (5, 1), (4, 7), (6, 3)]:
+                expected = TRAVERSAL_FUNCTIONS[kind](make_grid(rows, cols))
+                for start in range(rows * cols + 1):
+                    for stop in range(start, rows * cols + 1):
+                        with self.subTest(kind=kind, rows=rows, cols=cols,
+                                          start=start, stop=stop):
+                            actual = list(iter_traversal_range(kind, rows, cols, start, stop))
+                            self.assertEqual(actual, expected[start:stop])
+
+    def test_2(self):
+        """Test 2: Unknown kinds and bad ranges raise"""
+        with self.assertRaises(ValueError):
+            iter_traversal_range("diagonal", 2, 2, 0, 1)
+        with self.assertRaises(IndexError):
+            iter_traversal_range("main", 2, 2, 3, 5)
+        with self.assertRaises(IndexError):
+            iter_traversal_range("main", 2, 2, 2, 1)
+
+
+class TestParallelTraversal(unittest.TestCase):
+    """Tests for position_ranges, parallel_traversal and parallel_reduce."""
+
+    def test_1(self):
+        """Test 1: Position ranges are contiguous, ordered and balanced"""
+        self.assertEqual(position_ranges(10, 3), [(0, 4), (4, 7), (7, 10)])
+        self.assertEqual(position_ranges(2, 5), [(0, 1), (1, 2)])
+        self.assertEqual(position_ranges(0, 4), [(0, 0)])
+
+    def test_2(self):
+        """Test 2: A parallel traversal of a 37x23 grid matches every list traversal"""
+        grid = make_grid(37, 23)
+        for kind in TRAVERSAL_KINDS:
+            with self.subTest(kind=kind):
+                expected = TRAVERSAL_FUNCTIONS[kind](grid)
+                row_indices, col_indices = parallel_traversal(kind, 37, 23, chunks=7, workers=2)
+                self.assertEqual(row_indices.dtype, np.int32)
+                self.assertEqual(list(zip(row_indices.tolist(), col_indices.tolist())), expected)
+
+    def test_3(self):
+        """Test 3: Parallel reduce combines partial results in traversal order"""
+        for kind in TRAVERSAL_KINDS:
+            with self.subTest(kind=kind):
+                expected = TRAVERSAL_FUNCTIONS[kind](make_grid(9, 5))
+                total = parallel_reduce(kind, 9, 5, weighted_sum, operator.add, 0,
+                                        chunks=4, workers=2)
+                self.assertEqual(total, sum(row * 1000 + col for row, col in expected))
+                order = parallel_reduce(kind, 9, 5, append_row, operator.add, (),
+                                        chunks=4, workers=2)
+                self.assertEqual(order, tuple(row for row, _ in expected))
+
+    def test_4(self):
+        """Test 4: Unknown kinds raise a ValueError in parallel_traversal"""
+        with self.assertRaises(ValueError):
+            parallel_traversal("diagonal", 3, 3, workers=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""Streaming Grid Sources Test Suite"""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from traversals import TRAVERSAL_FUNCTIONS, TRAVERSAL_KINDS, iter_traversal_of_rows
+from traversal_streams import iter_traversal_values, memmap_grid, read_grid_rows
+from test_traversals import make_grid
+
+
+class TestGridSources(unittest.TestCase):
+    """Tests for read_grid_rows, memmap_grid and iter_traversal_values."""
+
+    def test_1(self):
+        """Test 1: Text file rows are parsed one line at a time, blank lines are empty rows"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "grid.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("1 2 3\n4 5\n\n6\n")
+            self.assertEqual(list(read_grid_rows(path)), [[1, 2, 3], [4, 5], [], [6]])
+            self.assertEqual(
+                list(iter_traversal_of_rows("column_zigzag", read_grid_rows(path))),
+                [(0, 0), (1, 0), (3, 0), (1, 1), (0, 1), (0, 2)],
+            )
+
+    def test_2(self):
+        """Test 2: Memmap rows come from the file and values follow the traversal"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "grid.bin")
+            values = np.arange(6 * 4, dtype=np.int32).reshape(6, 4)
+            values.tofile(path)
+            grid = memmap_grid(path, 4, np.int32)
+            self.assertEqual(grid.shape, (6, 4))
+            for kind in TRAVERSAL_KINDS:
+                expected = TRAVERSAL_FUNCTIONS[kind](make_grid(6, 4))
+                with self.subTest(kind=kind):
+                    self.assertEqual(list(iter_traversal_of_rows(kind, grid)), expected)
+                    actual = [int(value) for value in iter_traversal_values(kind, grid)]
+                    self.assertEqual(actual, [int(values[row, col]) for row, col in expected])
+            # close the map before the directory is removed
+            del grid
+
+    def test_3(self):
+        """Test 3: A memmap with a partial last row raises a ValueError"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "partial.bin")
+            np.arange(7, dtype=np.int64).tofile(path)
+            with self.assertRaises(ValueError):
+                memmap_grid(path, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
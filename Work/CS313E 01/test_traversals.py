@@ -10,9 +10,36 @@ from traversals import (
     main_diagonal_traversal,
     secondary_diagonal_traversal,
     spiral_traversal,
+    iter_row_zigzag_traversal,
+    iter_column_zigzag_traversal,
+    iter_main_diagonal_traversal,
+    iter_secondary_diagonal_traversal,
+    iter_spiral_traversal,
+    traversal_coordinate,
+    traversal_position,
+    iter_traversal,
+    iter_ragged_traversal,
+    iter_traversal_of_rows,
+    grid_row_lengths,
+    TRAVERSAL_FUNCTIONS,
+    TRAVERSAL_KINDS,
 )
 
 
+TRAVERSAL_PAIRS = [
+    (row_zigzag_traversal, iter_row_zigzag_traversal),
+    (column_zigzag_traversal, iter_column_zigzag_traversal),
+    (main_diagonal_traversal, iter_main_diagonal_traversal),
+    (secondary_diagonal_traversal, iter_secondary_diagonal_traversal),
+    (spiral_traversal, iter_spiral_traversal),
+]
+
+
+def make_grid(rows, cols):
+    """Builds a rows x cols grid of distinct values"""
+    return [[row * cols + col for col in range(cols)] for row in range(rows)]
+
+
 class TestRowZigZagTraversal(unittest.TestCase):
     """Row ZigZag Traversal Test Suite"""
 
@@ -2558,5 +2585,126 @@ class TestSpiralTraversal(unittest.TestCase):
 
         self.assertEqual(actual, expected)
 
+
+class TestTraversalGenerators(unittest.TestCase):
+    """Lazy Traversal Generator Test Suite"""
+
+    def test_all_shapes(self):
+        """Generators: same coordinates as the list versions, 1x1 to 10x10"""
+        for rows in range(1, 11):
+            for cols in range(1, 11):
+                grid = make_grid(rows, cols)
+                for traversal, generator in TRAVERSAL_PAIRS:
+                    with self.subTest(traversal=traversal.__name__, rows=rows, cols=cols):
+                        self.assertEqual(list(generator(grid)), traversal(grid))
+
+    def test_resume(self):
+        """Generators: resuming from every offset of a 7x4 and 4x7 grid"""
+        for grid in (make_grid(7, 4), make_grid(4, 7)):
+            for traversal, generator in TRAVERSAL_PAIRS:
+                expected = traversal(grid)
+                for start in range(len(expected) + 1):
+                    with self.subTest(traversal=traversal.__name__, start=start):
+                        self.assertEqual(list(generator(grid, start)), expected[start:])
+
+    def test_lazy(self):
+        """Generators: coordinates are produced on demand"""
+        grid = make_grid(1000, 1000)
+        spiral = iter_spiral_traversal(grid)
+        self.assertEqual([next(spiral) for _ in range(3)], [(0, 0), (0, 1), (0, 2)])
+        diagonal = iter_main_diagonal_traversal(grid, 2)
+        self.assertEqual([next(diagonal) for _ in range(2)], [(1, 999), (0, 997)])
+
+
+class TestTraversalIndexMapping(unittest.TestCase):
+    """Closed-Form Index Mapping Test Suite"""
+
+    def test_all_shapes(self):
+        """Index mapping: both directions match the lists, 1x1 to 12x12"""
+        for rows in range(1, 13):
+            for cols in range(1, 13):
+                grid = make_grid(rows, cols)
+                for kind in TRAVERSAL_KINDS:
+                    expected = TRAVERSAL_FUNCTIONS[kind](grid)
+                    with self.subTest(kind=kind, rows=rows, cols=cols):
+                        actual = [
+                            traversal_coordinate(kind, rows, cols, position)
+                            for position in range(rows * cols)
+                        ]
+                        self.assertEqual(actual, expected)
+                        positions = [
+                            traversal_position(kind, rows, cols, row, col)
+                            for row, col in expected
+                        ]
+                        self.assertEqual(positions, list(range(rows * cols)))
+
+    def test_large_grid(self):
+        """Index mapping: round trip on a 10000x7000 grid"""
+        rows, cols = 10000, 7000
+        for kind in TRAVERSAL_KINDS:
+            for position in (0, 1, 12345, 24999999, 69999998, 69999999):
+                row, col = traversal_coordinate(kind, rows, cols, position)
+                with self.subTest(kind=kind, position=position):
+                    self.assertEqual(traversal_position(kind, rows, cols, row, col), position)
+        self.assertEqual(traversal_coordinate("spiral", rows, cols, 69999999), (3500, 3499))
+
+    def test_errors(self):
+        """Index mapping: unknown kinds and out of range arguments"""
+        with self.assertRaises(ValueError):
+            traversal_coordinate("diagonal", 3, 3, 0)
+        with self.assertRaises(IndexError):
+            traversal_coordinate("spiral", 3, 3, 9)
+        with self.assertRaises(IndexError):
+            traversal_position("main", 3, 3, 3, 0)
+
+
+class TestDimensionAndRaggedTraversals(unittest.TestCase):
+    """Tests for the dimension-only and ragged traversals."""
+
+    def test_dimensions_only(self):
+        """Dimension traversal: matches the list traversals without a grid"""
+        for kind in TRAVERSAL_KINDS:
+            for rows, cols in [(1, 1), (1, 6), (6, 1), (4, 9), (9, 4)]:
+                expected = TRAVERSAL_FUNCTIONS[kind](make_grid(rows, cols))
+                with self.subTest(kind=kind, rows=rows, cols=cols):
+                    self.assertEqual(list(iter_traversal(kind, rows, cols)), expected)
+                    start = min(3, rows * cols)
+                    actual = list(iter_traversal(kind, rows, cols, start))
+                    self.assertEqual(actual, expected[start:])
+
+    def test_rows_from_stream(self):
+        """Row stream: a generator of rows is measured once and traversed"""
+        for kind in TRAVERSAL_KINDS:
+            grid = make_grid(5, 7)
+            rows = (list(row) for row in grid)
+            with self.subTest(kind=kind):
+                actual = list(iter_traversal_of_rows(kind, rows))
+                self.assertEqual(actual, TRAVERSAL_FUNCTIONS[kind](grid))
+
+    def test_ragged_skip_policy(self):
+        """Ragged grid: holes of the bounding rectangle are skipped"""
+        grid = [[1, 2, 3], [4], [], [5, 6]]
+        lengths = grid_row_lengths(grid)
+        self.assertEqual(lengths, [3, 1, 0, 2])
+        for kind in TRAVERSAL_KINDS:
+            rectangle = TRAVERSAL_FUNCTIONS[kind](make_grid(4, 3))
+            expected = [(row, col) for row, col in rectangle if col < lengths[row]]
+            with self.subTest(kind=kind):
+                self.assertEqual(list(iter_ragged_traversal(kind, lengths)), expected)
+        self.assertEqual(
+            list(iter_ragged_traversal("row_zigzag", lengths)),
+            [(0, 0), (0, 1), (0, 2), (1, 0), (3, 1), (3, 0)],
+        )
+
+    def test_empty_and_errors(self):
+        """Ragged grid: empty grids yield nothing, unknown kinds raise"""
+        self.assertEqual(list(iter_ragged_traversal("spiral", [])), [])
+        self.assertEqual(list(iter_ragged_traversal("spiral", [0, 0])), [])
+        with self.assertRaises(ValueError):
+            iter_ragged_traversal("diagonal", [1])
+        with self.assertRaises(IndexError):
+            iter_traversal("main", 2, 2, 5)
+
+
 if __name__ == "__main__":
     unittest.main()
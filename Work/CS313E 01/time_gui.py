@@ -0,0 +1,88 @@
+"""GUI Render Throughput Benchmark
+
+Measures how fast gui.GridTraversalApp builds its grid and paints a spiral
+traversal in the one-widget-per-cell mode and the single-canvas mode. Frames
+are painted back to back with root.update() after each one, so the numbers
+are the render cost alone, without the animation timer.
+
+The benchmark needs a display; on a machine without one, run it under a
+virtual X server:
+
+usage: xvfb-run -a python3 time_gui.py [--sizes 10 50 100 200] [--batch 512]
+"""
+
+import argparse
+import sys
+import time
+import tkinter as tk
+from itertools import islice
+
+from gui import GridTraversalApp
+from traversals import spiral_traversal
+
+# The widget mode takes minutes to build grids much larger than this
+MAX_CELLS_MODE_SIZE = 50
+
+
+def time_render(root, size, render, batch):
+    """
+    Builds a size x size app and paints a full spiral traversal.
+
+    post: returns (build seconds, paint seconds, frames painted).
+    """
+
+    frame = tk.Frame(root)
+    frame.grid()
+    start_time = time.perf_counter()
+    app = GridTraversalApp(frame, size, size, 1, render)
+    root.update()
+    build_time = time.perf_counter() - start_time
+
+    # the widget mode animates one cell per frame
+    per_frame = batch if render == "canvas" else 1
+    coordinates = iter(spiral_traversal(app.actual_grid))
+    frames = 0
+    start_time = time.perf_counter()
+    while True:
+        cells = list(islice(coordinates, per_frame))
+        if not cells:
+            break
+        app.paint_cells(cells)
+        root.update()
+        frames += 1
+    paint_time = time.perf_counter() - start_time
+
+    frame.destroy()
+    return build_time, paint_time, frames
+
+
+def main():
+    """Runs the benchmark and prints one row per (size, render mode)."""
+    parser = argparse.ArgumentParser(description="GUI render throughput benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--batch", type=int, default=512, help="cells per canvas frame")
+    args = parser.parse_args()
+
+    try:
+        root = tk.Tk()
+    except tk.TclError as error:
+        sys.exit(f"no display available ({error}); run under xvfb-run")
+
+    print(
+        f"{'size':>6} {'render':>7} {'build s':>9} {'paint s':>9} "
+        f"{'cells/s':>11} {'frames/s':>9}"
+    )
+    for size in args.sizes:
+        for render in ("cells", "canvas"):
+            if render == "cells" and size > MAX_CELLS_MODE_SIZE:
+                continue
+            build_time, paint_time, frames = time_render(root, size, render, args.batch)
+            print(
+                f"{size:>6} {render:>7} {build_time:>9.3f} {paint_time:>9.3f} "
+                f"{size * size / paint_time:>11.0f} {frames / paint_time:>9.1f}"
+            )
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
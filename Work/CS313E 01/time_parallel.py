@@ -0,0 +1,61 @@
+"""Parallel Chunked Traversal Benchmark
+
+Compares parallel_traversal against the serial list traversals and against
+a single-process traversal_coordinate_range on square grids, for a growing
+number of worker processes. The pool timings include starting the workers
+and joining their index arrays.
+
+usage: python3 time_parallel.py [--size 2000] [--max-workers 4]
+"""
+
+import argparse
+import time
+
+from traversals import TRAVERSAL_FUNCTIONS
+from traversal_arrays import traversal_coordinate_range
+from traversal_parallel import parallel_traversal
+
+
+def time_call(function, *args, **kwargs):
+    """Returns (result, wall time in seconds) of one call."""
+    start_time = time.perf_counter()
+    result = function(*args, **kwargs)
+    return result, time.perf_counter() - start_time
+
+
+def main():
+    """Runs the benchmark and prints one row per (traversal, workers)."""
+    parser = argparse.ArgumentParser(description="Parallel chunked traversal benchmark")
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--max-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    size = args.size
+    grid = [[0] * size for _ in range(size)]
+    print(
+        f"{'traversal':>14} {'workers':>7} {'serial s':>9} {'arrays s':>9} "
+        f"{'pool s':>9} {'vs serial':>9}"
+    )
+
+    for kind, function in TRAVERSAL_FUNCTIONS.items():
+        expected, serial_time = time_call(function, grid)
+        (rows, cols), arrays_time = time_call(
+            traversal_coordinate_range, kind, size, size, 0, size * size
+        )
+        assert list(zip(rows.tolist(), cols.tolist())) == expected, f"{kind} arrays differ"
+
+        workers = 1
+        while workers <= args.max_workers:
+            (rows, cols), pool_time = time_call(
+                parallel_traversal, kind, size, size, workers=workers
+            )
+            assert list(zip(rows.tolist(), cols.tolist())) == expected, f"{kind} pool differs"
+            print(
+                f"{kind:>14} {workers:>7} {serial_time:>9.3f} {arrays_time:>9.3f} "
+                f"{pool_time:>9.3f} {serial_time / pool_time:>8.1f}x"
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
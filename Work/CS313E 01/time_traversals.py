@@ -0,0 +1,198 @@
+"""Traversal Benchmark Harness
+
+Times the five traversal functions of traversals.py and their faster
+variants on grids from 1x1 to 10^4 x 10^4, recording wall time, peak memory
+traced by tracemalloc and throughput in cells per second. Results are written
+to CSV and JSON and can be plotted the way time_graph.py plots bigo.
+
+usage: python3 time_traversals.py [--max-exponent 4] [--repeat 3]
+       [--output bench_traversals] [--plot]
+
+Variants:
+- list: the list-building traversal function.
+- lazy: the matching iter_* generator, consumed without storing anything.
+- numpy: traversal_arrays.traversal_order, the whole order as one int array.
+
+The traversal functions only read len(grid) and len(grid[0]), so every grid
+is a list of references to one shared row; only the traversal itself shows
+up in the memory column.
+"""
+
+import argparse
+import csv
+import json
+import platform
+import time
+import tracemalloc
+from collections import deque
+
+from traversals import (
+    row_zigzag_traversal,
+    column_zigzag_traversal,
+    main_diagonal_traversal,
+    secondary_diagonal_traversal,
+    spiral_traversal,
+    iter_row_zigzag_traversal,
+    iter_column_zigzag_traversal,
+    iter_main_diagonal_traversal,
+    iter_secondary_diagonal_traversal,
+    iter_spiral_traversal,
+)
+from traversal_arrays import traversal_order
+
+# kind -> (list function, lazy generator function)
+TRAVERSALS = {
+    "row_zigzag": (row_zigzag_traversal, iter_row_zigzag_traversal),
+    "column_zigzag": (column_zigzag_traversal, iter_column_zigzag_traversal),
+    "main": (main_diagonal_traversal, iter_main_diagonal_traversal),
+    "secondary": (secondary_diagonal_traversal, iter_secondary_diagonal_traversal),
+    "spiral": (spiral_traversal, iter_spiral_traversal),
+}
+
+# Every size is 10x the side, so 100x the cells, of the one before
+GROWTH = 100
+
+FIELDS = ["kind", "variant", "size", "cells", "seconds", "peak_bytes", "cells_per_second"]
+
+
+def make_variants(kind):
+    """Returns {variant name: callable taking (grid, rows, cols)} for one kind."""
+    list_function, lazy_function = TRAVERSALS[kind]
+    return {
+        "list": lambda grid, rows, cols: list_function(grid),
+        "lazy": lambda grid, rows, cols: deque(lazy_function(grid), maxlen=0),
+        "numpy": lambda grid, rows, cols: traversal_order(kind, rows, cols),
+    }
+
+
+def measure(function, grid, repeat):
+    """
+    Returns (best wall time in seconds, peak traced bytes) of function.
+
+    Wall time is measured without tracemalloc, which slows down every
+    allocation; the peak comes from one extra traced call.
+    """
+
+    rows, cols = len(grid), len(grid[0])
+    best = float("inf")
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = function(grid, rows, cols)
+        best = min(best, time.perf_counter() - start_time)
+        del result
+
+    tracemalloc.start()
+    result = function(grid, rows, cols)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return best, peak
+
+
+def run_benchmarks(max_exponent, repeat, time_limit, max_bytes):
+    """
+    Times every variant on size x size grids for size = 1, 10, ..., 10^max_exponent.
+
+    A variant is skipped for every larger size once GROWTH times its time
+    would pass time_limit seconds or GROWTH times its peak would pass
+    max_bytes, so the 10^4 x 10^4 runs only include the variants that can
+    finish them.
+    """
+
+    results = []
+    skipped = set()
+    for exponent in range(max_exponent + 1):
+        size = 10 ** exponent
+        grid = [[None] * size] * size
+        for kind in TRAVERSALS:
+            for variant, function in make_variants(kind).items():
+                if (kind, variant) in skipped:
+                    continue
+                seconds, peak = measure(function, grid, repeat)
+                cells = size * size
+                results.append(
+                    {
+                        "kind": kind,
+                        "variant": variant,
+                        "size": size,
+                        "cells": cells,
+                        "seconds": seconds,
+                        "peak_bytes": peak,
+                        "cells_per_second": cells / seconds if seconds else 0.0,
+                    }
+                )
+                print(
+                    f"{kind:>14} {variant:>6} {size:>6} {seconds:>11.6f}s "
+                    f"{peak / 2 ** 20:>10.2f} MiB {cells / max(seconds, 1e-9):>14.0f} cells/s"
+                )
+                if seconds * GROWTH > time_limit or peak * GROWTH > max_bytes:
+                    skipped.add((kind, variant))
+    return results
+
+
+def write_results(results, prefix, meta):
+    """Writes results to prefix.csv and, with meta, to prefix.json."""
+    with open(f"{prefix}.csv", "w", newline="", encoding="utf-8") as outfile:
+        writer = csv.DictWriter(outfile, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+    with open(f"{prefix}.json", "w", encoding="utf-8") as outfile:
+        json.dump({"meta": meta, "results": results}, outfile, indent=2)
+
+
+def plot_results(results):
+    """Plots time and peak memory against cells, one line per kind and variant."""
+    import matplotlib.pyplot as plt
+
+    figure, (time_axis, memory_axis) = plt.subplots(1, 2, figsize=(14, 6))
+    lines = {}
+    for entry in results:
+        lines.setdefault((entry["kind"], entry["variant"]), []).append(entry)
+    for (kind, variant), entries in lines.items():
+        cells = [entry["cells"] for entry in entries]
+        label = f"{kind} ({variant})"
+        time_axis.plot(cells, [entry["seconds"] for entry in entries], label=label, marker="o")
+        memory_axis.plot(
+            cells, [entry["peak_bytes"] / 2 ** 20 for entry in entries], label=label, marker="o"
+        )
+    for axis, ylabel in ((time_axis, "Time (seconds)"), (memory_axis, "Peak memory (MiB)")):
+        axis.set_xscale("log")
+        axis.set_yscale("symlog", linthresh=1e-3)
+        axis.set_xlabel("Grid Size (cells)")
+        axis.set_ylabel(ylabel)
+        axis.grid(True)
+    time_axis.set_title("Runtime of the traversal functions")
+    memory_axis.set_title("Peak traced memory of the traversal functions")
+    memory_axis.legend(fontsize="small", ncol=2)
+    figure.tight_layout()
+    plt.show()
+
+
+def main():
+    """Runs the harness, writes CSV and JSON and optionally plots."""
+    parser = argparse.ArgumentParser(description="traversals.py benchmark harness")
+    parser.add_argument("--max-exponent", type=int, default=4, choices=range(0, 5))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--time-limit", type=float, default=120.0)
+    parser.add_argument("--max-mib", type=float, default=4096.0)
+    parser.add_argument("--output", default="bench_traversals")
+    parser.add_argument("--plot", action="store_true")
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        args.max_exponent, args.repeat, args.time_limit, args.max_mib * 2 ** 20
+    )
+    meta = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "repeat": args.repeat,
+    }
+    write_results(results, args.output, meta)
+    print(f"wrote {len(results)} results to {args.output}.csv and {args.output}.json")
+
+    if args.plot:
+        plot_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""
+NumPy Traversal Index Arrays
+
+Builds the orders from traversals.py as integer index arrays with vectorized
+arithmetic, so a large NumPy grid can be flattened in traversal order with a
+single gather and restored with a single scatter. Every cell's traversal
+position is computed with the closed-form formulas behind
+traversals.traversal_position, applied to whole row bands at once.
+"""
+
+import numpy as np
+
+from traversals import TRAVERSAL_KINDS
+
+# Cells whose positions are computed in one vectorized step; bounds the size
+# of the temporary arrays when building plans for very large grids.
+BAND_CELLS = 1 << 20
+
+
+def default_dtype(rows, cols):
+    """
+    pre: rows >= 1, cols >= 1
+    post: returns np.int32 if every flat index of a rows x cols grid fits in
+    32 bits, np.int64 otherwise.
+    """
+
+    return np.int32 if rows * cols <= np.iinfo(np.int32).max else np.int64
+
+
+def _diagonal_first_positions(rows, cols, diagonal):
+    """Vectorized traversals._diagonal_first_position."""
+    shortest = min(rows, cols)
+    count = rows + cols - 1
+    remaining = count - diagonal
+    return np.where(
+        diagonal < shortest,
+        diagonal * (diagonal + 1) // 2,
+        np.where(
+            diagonal <= count - shortest,
+            (shortest - 1) * shortest // 2 + (diagonal - shortest + 1) * shortest,
+            rows * cols - remaining * (remaining + 1) // 2,
+        ),
+    )
+
+
+def _band_positions(kind, rows, cols, row, col):
+    """
+    Traversal positions of a band of cells.
+
+    pre: row has shape (band rows, 1) and col has shape (1, band cols), both
+    int64.
+    post: returns an int64 array of shape (band rows, band cols) holding the
+    position of every cell in the band.
+    """
+
+    if kind == "row_zigzag":
+        return row * cols + np.where(row % 2 == 0, col, cols - 1 - col)
+
+    if kind == "column_zigzag":
+        return col * rows + np.where(col % 2 == 0, row, rows - 1 - row)
+
+    if kind == "main":
+        diagonal = cols - 1 - (col - row)
+        return _diagonal_first_positions(rows, cols, diagonal) + np.minimum(row, col)
+
+    if kind == "secondary":
+        diagonal = row + col
+        offset = row - np.maximum(0, diagonal - cols + 1)
+        return _diagonal_first_positions(rows, cols, diagonal) + offset
+
+    # spiral: position = cells in the outer layers + step along this layer
+    row, col = np.broadcast_arrays(row, col)
+    layer = np.minimum(np.minimum(row, col), np.minimum(rows - 1 - row, cols - 1 - col))
+    width = cols - 2 * layer
+    height = rows - 2 * layer
+    row = row - layer
+    col = col - layer
+    step = np.select(
+        [row == 0, col == width - 1, row == height - 1],
+        [col, width - 1 + row, width + height - 2 + (width - 1 - col)],
+        2 * width + height - 3 + (height - 1 - row),
+    )
+    return rows * cols - width * height + step
+
+
+def check_kind(kind):
+    """Raises a ValueError if kind is not one of traversals.TRAVERSAL_KINDS."""
+    if kind not in TRAVERSAL_KINDS:
+        raise ValueError(f"unknown traversal kind: {kind}")
+
+
+def _isqrt(values):
+    """Vectorized math.isqrt for a non-negative int64 array."""
+    root = np.sqrt(values.astype(np.float64)).astype(np.int64)
+    root -= root * root > values
+    root += (root + 1) * (root + 1) <= values
+    return root
+
+
+def _diagonals_of_positions(rows, cols, position):
+    """Vectorized traversals._diagonal_of_position."""
+    shortest = min(rows, cols)
+    count = rows + cols - 1
+    growing = (shortest - 1) * shortest // 2
+    steady = (count - 2 * shortest + 2) * shortest
+
+    # the first and last diagonals are both triangular; the last ones are
+    # counted from the end of the traversal
+    in_growing = position < growing
+    in_steady = ~in_growing & (position < growing + steady)
+    triangular = np.where(in_growing, position, rows * cols - 1 - position)
+    mirrored = (_isqrt(8 * triangular + 1) - 1) // 2
+    triangular_offset = triangular - mirrored * (mirrored + 1) // 2
+    steady_diagonal, steady_offset = np.divmod(position - growing, shortest)
+
+    diagonal = np.select(
+        [in_growing, in_steady],
+        [mirrored, shortest - 1 + steady_diagonal],
+        count - 1 - mirrored,
+    )
+    offset = np.select(
+        [in_growing, in_steady],
+        [triangular_offset, steady_offset],
+        mirrored - triangular_offset,
+    )
+    return diagonal, offset
+
+
+def _spiral_layers_of_positions(rows, cols, position):
+    """Vectorized traversals._spiral_layer_of_position."""
+    total = rows + cols
+    last_layer = (min(rows, cols) - 1) // 2
+    layer = np.clip((total - _isqrt(total * total - 4 * position)) // 4, 0, last_layer)
+    first = rows * cols - (rows - 2 * layer) * (cols - 2 * layer)
+    # the float root can be off by one, which the loops below correct
+    while True:
+        too_far = (layer > 0) & (first > position)
+        if not np.any(too_far):
+            break
+        layer -= too_far
+        first = rows * cols - (rows - 2 * layer) * (cols - 2 * layer)
+    while True:
+        following = rows * cols - (rows - 2 * layer - 2) * (cols - 2 * layer - 2)
+        too_near = (layer < last_layer) & (following <= position)
+        if not np.any(too_near):
+            return layer, first
+        layer += too_near
+        first = np.where(too_near, following, first)
+
+
+def _band_coordinates(kind, rows, cols, position):
+    """
+    Coordinates of a band of traversal positions.
+
+    pre: position is a 1D int64 array of positions inside range(rows * cols).
+    post: returns (row, col), two int64 arrays shaped like position.
+    """
+
+    if kind == "row_zigzag":
+        row, offset = np.divmod(position, cols)
+        return row, np.where(row % 2 == 0, offset, cols - 1 - offset)
+
+    if kind == "column_zigzag":
+        col, offset = np.divmod(position, rows)
+        return np.where(col % 2 == 0, offset, rows - 1 - offset), col
+
+    if kind in ("main", "secondary"):
+        diagonal, offset = _diagonals_of_positions(rows, cols, position)
+        upper = diagonal < cols
+        row = np.where(upper, offset, diagonal - cols + 1 + offset)
+        if kind == "main":
+            return row, np.where(upper, cols - 1 - diagonal + offset, offset)
+        return row, np.where(upper, diagonal - offset, cols - 1 - offset)
+
+    # spiral: walk the top, right, bottom and left sides of the layer
+    layer, first = _spiral_layers_of_positions(rows, cols, position)
+    step = position - first
+    width = cols - 2 * layer
+    height = rows - 2 * layer
+    sides = [step < width, step < width + height - 1, step < 2 * width + height - 2]
+    row = np.select(
+        sides,
+        [layer, layer + 1 + step - width, layer + height - 1],
+        layer + height - 2 - (step - 2 * width - height + 2),
+    )
+    col = np.select(
+        sides,
+        [layer + step, layer + width - 1, layer + width - 2 - (step - width - height + 1)],
+        layer,
+    )
+    return row, col
+
+
+def traversal_rank_block(kind, rows, cols, row_range, col_range, dtype=None):
+    """
+    Computes the traversal positions of a rectangular block of a grid.
+
+    pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1.
+    row_range and col_range are range objects inside range(rows) and
+    range(cols).
+    post: returns an integer array of shape (len(row_range), len(col_range))
+    where entry (i, j) is traversal_position(kind, rows, cols,
+    row_range[i], col_range[j]). dtype defaults to default_dtype(rows, cols).
+    Raises a ValueError for an unknown kind.
+    """
+
+    check_kind(kind)
+    row = np.arange(row_range.start, row_range.stop, row_range.step, dtype=np.int64)
+    col = np.arange(col_range.start, col_range.stop, col_range.step, dtype=np.int64)
+    positions = _band_positions(kind, rows, cols, row[:, np.newaxis], col[np.newaxis, :])
+    return positions.astype(dtype or default_dtype(rows, cols), copy=False)
+
+
+def traversal_rank_grid(kind, rows, cols, dtype=None):
+    """
+    Computes the traversal position of every cell of a grid.
+
+    pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1.
+    post: returns an integer array of shape (rows, cols) where entry
+    (row, col) is traversal_position(kind, rows, cols, row, col). dtype
+    defaults to default_dtype(rows, cols).
+    Raises a ValueError for an unknown kind.
+    """
+
+    check_kind(kind)
+    dtype = dtype or default_dtype(rows, cols)
+    ranks = np.empty((rows, cols), dtype=dtype)
+    band = max(1, BAND_CELLS // cols)
+    for first_row in range(0, rows, band):
+        band_rows = range(first_row, min(first_row + band, rows))
+        ranks[first_row:first_row + band] = traversal_rank_block(
+            kind, rows, cols, band_rows, range(cols), dtype
+        )
+    return ranks
+
+
+def traversal_coordinate_range(kind, rows, cols, start, stop, dtype=None):
+    """
+    Computes a slice of a traversal as row and column index arrays without
+    building the rest of the traversal.
+
+    pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1,
+    0 <= start <= stop <= rows * cols.
+    post: returns (row_indices, col_indices), two 1D integer arrays of length
+    stop - start such that zip(row_indices, col_indices) lists the same
+    coordinates as traversals.iter_traversal_range(kind, rows, cols, start,
+    stop). dtype defaults to default_dtype(rows, cols).
+    Raises a ValueError for an unknown kind and an IndexError for a range
+    outside the traversal.
+    """
+
+    check_kind(kind)
+    if not 0 <= start <= stop <= rows * cols:
+        raise IndexError("traversal range out of range")
+    dtype = dtype or default_dtype(rows, cols)
+    row_indices = np.empty(stop - start, dtype=dtype)
+    col_indices = np.empty(stop - start, dtype=dtype)
+    for first in range(start, stop, BAND_CELLS):
+        last = min(first + BAND_CELLS, stop)
+        position = np.arange(first, last, dtype=np.int64)
+        row, col = _band_coordinates(kind, rows, cols, position)
+        row_indices[first - start:last - start] = row
+        col_indices[first - start:last - start] = col
+    return row_indices, col_indices
+
+
+def traversal_order(kind, rows, cols, dtype=None):
+    """
+    Computes a traversal as a flat permutation of row-major cell indices.
+
+    pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1.
+    post: returns a 1D integer array of length rows * cols whose entry p is
+    row * cols + col for the p-th (row, col) of the traversal. dtype defaults
+    to default_dtype(rows, cols).
+    Raises a ValueError for an unknown kind.
+    """
+
+    ranks = traversal_rank_grid(kind, rows, cols, dtype)
+    order = np.empty(rows * cols, dtype=ranks.dtype)
+    order[ranks.reshape(-1)] = np.arange(rows * cols, dtype=ranks.dtype)
+    return order
+
+
+def traversal_indices(kind, rows, cols, dtype=None):
+    """
+    Computes a traversal as a pair of row and column index arrays.
+
+    pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1.
+    post: returns (row_indices, col_indices), two 1D integer arrays of length
+    rows * cols such that zip(row_indices, col_indices) lists the same
+    coordinates as the matching traversal function. dtype defaults to
+    default_dtype(rows, cols).
+    Raises a ValueError for an unknown kind.
+    """
+
+    return np.divmod(traversal_order(kind, rows, cols, dtype), cols)
+
+
+def gather_traversal(array, kind, order=None):
+    """
+    Flattens a grid in traversal order with a single gather.
+
+    pre: array is an ndarray with at least 2 dimensions; the first two are the
+    grid rows and columns. order is None or traversal_order(kind, rows, cols)
+    for the grid shape, so a plan can be reused across calls.
+    post: returns a new array of shape (rows * cols, *array.shape[2:]) whose
+    entry p is the cell at the p-th coordinate of the traversal.
+    array is not altered.
+    """
+
+    rows, cols = array.shape[:2]
+    if order is None:
+        order = traversal_order(kind, rows, cols)
+    return array.reshape(rows * cols, *array.shape[2:])[order]
+
+
+def scatter_traversal(values, kind, shape, order=None):
+    """
+    Places values given in traversal order back onto a grid. This is the
+    inverse of gather_traversal.
+
+    pre: values is an ndarray of shape (rows * cols, ...), shape is
+    (rows, cols). order is None or traversal_order(kind, rows, cols).
+    post: returns a new array of shape (rows, cols, *values.shape[1:]) where
+    the p-th coordinate of the traversal holds values[p].
+    values is not altered.
+    """
+
+    rows, cols = shape
+    if order is None:
+        order = traversal_order(kind, rows, cols)
+    grid = np.empty((rows * cols, *values.shape[1:]), dtype=values.dtype)
+    grid[order] = values
+    return grid.reshape(rows, cols, *values.shape[1:])
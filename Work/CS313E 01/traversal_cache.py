@@ -0,0 +1,123 @@
+"""
+Traversal Plan Cache
+
+Memoizes traversal plans (flat index arrays from traversal_arrays) keyed by
+(kind, rows, cols), so grids that share a shape reuse one plan instead of
+rebuilding it on every call. The cache is bounded by the total bytes of the
+plans it holds, evicts the least recently used plan first and can be shared
+by many threads.
+"""
+
+import threading
+from collections import OrderedDict
+
+from traversal_arrays import traversal_order
+
+# Default bound on the total size of cached plans
+DEFAULT_MAX_BYTES = 256 << 20
+
+
+class TraversalPlanCache:
+    """
+    Thread-safe LRU cache of traversal plans, bounded by total bytes.
+
+    Plans are read-only NumPy arrays, so the same array can be handed to every
+    caller. A plan larger than the whole budget is built and returned but
+    never stored.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        pre: max_bytes >= 0
+        post: creates an empty cache.
+        """
+
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.current_bytes = 0
+        self._plans = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._plans)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._plans
+
+    def get(self, kind, rows, cols):
+        """
+        Looks up or builds the plan of a traversal.
+
+        pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1.
+        post: returns traversal_order(kind, rows, cols) as a read-only array
+        and records a hit or a miss. Raises a ValueError for an unknown kind.
+        """
+
+        key = (kind, rows, cols)
+        with self._lock:
+            plan = self._plans.get(key)
+            if plan is not None:
+                self._plans.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        # build outside the lock so hits on other plans are never blocked by
+        # a large build; if two threads race, the first stored plan wins
+        plan = traversal_order(kind, rows, cols)
+        plan.setflags(write=False)
+        if plan.nbytes > self.max_bytes:
+            return plan
+
+        with self._lock:
+            existing = self._plans.get(key)
+            if existing is not None:
+                return existing
+            self._plans[key] = plan
+            self.current_bytes += plan.nbytes
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._plans.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+        return plan
+
+    def stats(self):
+        """
+        post: returns a dict with the hit and miss counters, the number of
+        cached plans and their total bytes.
+        """
+
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "plans": len(self._plans),
+                "bytes": self.current_bytes,
+            }
+
+    def clear(self):
+        """
+        post: removes every cached plan and resets the counters.
+        """
+
+        with self._lock:
+            self._plans.clear()
+            self.current_bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+# Cache shared by cached_traversal_order
+default_plan_cache = TraversalPlanCache()
+
+
+def cached_traversal_order(kind, rows, cols):
+    """
+    pre: kind is one of traversals.TRAVERSAL_KINDS, rows >= 1, cols >= 1.
+    post: returns the read-only traversal_order(kind, rows, cols) plan from
+    default_plan_cache, building it on the first call for that shape.
+    """
+
+    return default_plan_cache.get(kind, rows, cols)
@@ -0,0 +1,120 @@
+"""
+Parallel Chunked Traversals
+
+Splits a traversal from traversals.py into contiguous position ranges and
+evaluates every range in its own worker process. Each worker finds the start
+of its range with the closed-form index mapping, so no worker walks the
+coordinates of the ranges before its own, and the per-range results are
+concatenated (or combined) in traversal order. Coordinates travel back from
+the workers as compact NumPy index arrays rather than lists of tuples, so
+the parent process only has to join a few buffers.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from traversal_arrays import check_kind, traversal_coordinate_range
+from traversals import iter_traversal_range
+
+
+def position_ranges(total, chunks):
+    """
+    Splits range(total) into contiguous, nearly equal position ranges.
+
+    pre: total >= 0, chunks >= 1
+    post: returns a list of at most chunks (start, stop) tuples that cover
+    range(total) in order; range sizes differ by at most one.
+    """
+
+    chunks = max(1, min(chunks, total))
+    size, extra = divmod(total, chunks)
+    bounds = []
+    start = 0
+    for chunk in range(chunks):
+        stop = start + size + (1 if chunk < extra else 0)
+        bounds.append((start, stop))
+        start = stop
+    return bounds
+
+
+def _chunk_coordinates(kind, rows, cols, start, stop):
+    """Worker: the row and column index arrays of positions start to stop - 1."""
+    return traversal_coordinate_range(kind, rows, cols, start, stop)
+
+
+def _chunk_reduce(kind, rows, cols, start, stop, function, initial):
+    """Worker: function folded over the coordinates of start to stop - 1."""
+    return reduce(function, iter_traversal_range(kind, rows, cols, start, stop), initial)
+
+
+def _map_chunks(worker, kind, rows, cols, chunks, workers, *extra):
+    """
+    Evaluates worker on every position range in a process pool.
+
+    post: returns the worker results in traversal order.
+    """
+
+    check_kind(kind)
+    workers = workers or os.cpu_count() or 1
+    bounds = position_ranges(rows * cols, chunks or workers)
+    starts = [start for start, _ in bounds]
+    stops = [stop for _, stop in bounds]
+    count = len(bounds)
+    extra = [[value] * count for value in extra]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            worker, [kind] * count, [rows] * count, [cols] * count,
+            starts, stops, *extra
+        ))
+
+
+def parallel_traversal(kind, rows, cols, chunks=None, workers=None):
+    """
+    Generates a whole traversal with one process per position range.
+
+    pre:
+    - kind is one of traversals.TRAVERSAL_KINDS.
+    - rows >= 1 and cols >= 1 are the dimensions of the grid.
+    - chunks and workers are None or >= 1; workers defaults to the number of
+      CPUs and chunks defaults to workers.
+
+    post:
+    - Returns (row_indices, col_indices), two 1D integer arrays of length
+      rows * cols such that zip(row_indices, col_indices) lists the same
+      coordinates as the matching traversal function for a rows x cols grid.
+      The dtype is traversal_arrays.default_dtype(rows, cols).
+    - Raises a ValueError for an unknown kind.
+    """
+
+    parts = _map_chunks(_chunk_coordinates, kind, rows, cols, chunks, workers)
+    return (np.concatenate([row for row, _ in parts]),
+            np.concatenate([col for _, col in parts]))
+
+
+def parallel_reduce(kind, rows, cols, function, combine, initial, chunks=None, workers=None):
+    """
+    Folds a function over a traversal with one process per position range.
+
+    pre:
+    - kind is one of traversals.TRAVERSAL_KINDS.
+    - rows >= 1 and cols >= 1 are the dimensions of the grid.
+    - function(accumulator, (row, column)) returns the next accumulator and
+      combine(left, right) merges the accumulators of two adjacent ranges.
+      initial is an identity of combine. function and combine must be
+      defined at module level so they can be sent to the worker processes.
+    - chunks and workers are as in parallel_traversal.
+
+    post:
+    - Returns combine applied left to right over the per-range folds, each
+      starting from initial. If combine is associative this equals
+      functools.reduce(function, traversal, initial).
+    - Raises a ValueError for an unknown kind.
+    """
+
+    partials = _map_chunks(
+        _chunk_reduce, kind, rows, cols, chunks, workers, function, initial
+    )
+    return reduce(combine, partials, initial)
@@ -0,0 +1,61 @@
+"""
+Streaming Grid Sources
+
+Row sources for grids that are too large to hold as a 2D list. A text file
+is read one line (row) at a time, and a raw binary file is mapped into
+memory with np.memmap, so the operating system pages cells in on demand.
+Both can be passed to traversals.grid_row_lengths and
+traversals.iter_traversal_of_rows, and the values of a memmapped grid can be
+read in any traversal order.
+"""
+
+import numpy as np
+
+from traversals import iter_traversal
+
+
+def read_grid_rows(path, parse=int):
+    """
+    Reads a grid from a text file one row at a time.
+
+    pre: path names a text file with one row per line and the cells of a row
+    separated by whitespace. parse converts one cell string to a value.
+    post: yields every row as a list of parsed values. A blank line is an
+    empty row, so rows may be ragged. The file is never read whole.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            yield [parse(cell) for cell in line.split()]
+
+
+def memmap_grid(path, cols, dtype=np.int64):
+    """
+    Maps a grid stored as raw row-major cells into memory without reading it.
+
+    pre: path names a binary file of rows * cols cells of dtype, cols >= 1.
+    post: returns a read-only np.memmap of shape (rows, cols), where rows is
+    derived from the file size. Iterating over it yields one row at a time.
+    Raises a ValueError if the file size is not a whole number of rows.
+    """
+
+    cells = np.memmap(path, dtype=dtype, mode="r")
+    if cells.size % cols:
+        raise ValueError("file size is not a whole number of rows")
+    return cells.reshape(-1, cols)
+
+
+def iter_traversal_values(kind, grid, start=0):
+    """
+    Lazily reads the cells of a rectangular grid in traversal order.
+
+    pre: kind is one of traversals.TRAVERSAL_KINDS. grid is a 2D ndarray or
+    memmap with at least one row and one column. 0 <= start <= grid.size.
+    post: yields grid[row, col] for every (row, column) of the traversal,
+    beginning with the one at index start. For a memmap only the pages
+    holding the cells read so far are loaded.
+    """
+
+    rows, cols = grid.shape
+    for row, col in iter_traversal(kind, rows, cols, start):
+        yield grid[row, col]
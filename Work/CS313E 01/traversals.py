@@ -16,6 +16,9 @@ UT EID 1: wah938
 UT EID 2: ak54655
 """
 
+from itertools import islice
+from math import isqrt
+
 
 def row_zigzag_traversal(grid):
     """
@@ -187,43 +190,631 @@ def spiral_traversal(grid):
       coordinates of all elements in the specified order.
     """
 
-    # start moving right; add 1 to column val
-    # if col+1 = cols, then change direction to down - add 1 to row val
-    # so on,
+    # walk the grid one layer (ring) at a time, tracking the bounds of the
+    # current layer instead of a visited grid: right along the top row, down
+    # the right column, left along the bottom row, up the left column, then
+    # shrink every bound by one
 
     traversal = []
     rows = len(grid)
     cols = len(grid[0])
 
-    visited_grid = [] # make a visited grid, set it to all false initially
-    for _ in range(rows):
-        row = []
-        for _ in range(cols):
-            row.append(False)
-        visited_grid.append(row)
+    top = 0
+    bottom = rows - 1
+    left = 0
+    right = cols - 1
+
+    while top <= bottom and left <= right:
+        for col in range(left, right + 1):
+            traversal.append((top, col))
+        for row in range(top + 1, bottom + 1):
+            traversal.append((row, right))
+
+        # a single remaining row or column has no bottom or left side
+        if top < bottom and left < right:
+            for col in range(right - 1, left - 1, -1):
+                traversal.append((bottom, col))
+            for row in range(bottom - 1, top, -1):
+                traversal.append((row, left))
+
+        top += 1
+        bottom -= 1
+        left += 1
+        right -= 1
+
+    return traversal
+
+
+# Lazy versions of the traversals above. Each generator yields the same
+# coordinates in the same order as its list-building counterpart, but keeps
+# only a few ints of state instead of a list of rows * cols tuples. Passing
+# start skips the first start coordinates, so an interrupted traversal can be
+# resumed from the number of coordinates already consumed. The generators
+# only need the grid dimensions, so the work is done by the _*_coordinates
+# helpers that take rows and cols directly.
+
+
+def _row_zigzag_coordinates(rows, cols, start):
+    """Row zigzag coordinates of a rows x cols grid from position start."""
+    first_row, offset = divmod(start, cols)
+
+    for row in range(first_row, rows):
+        going_right = row % 2 == 0
+        for step in range(offset, cols):
+            if going_right:
+                yield (row, step)
+            else:
+                yield (row, cols - 1 - step)
+        offset = 0
+
+
+def _column_zigzag_coordinates(rows, cols, start):
+    """Column zigzag coordinates of a rows x cols grid from position start."""
+    first_col, offset = divmod(start, rows)
+
+    for col in range(first_col, cols):
+        going_down = col % 2 == 0
+        for step in range(offset, rows):
+            if going_down:
+                yield (step, col)
+            else:
+                yield (rows - 1 - step, col)
+        offset = 0
+
+
+def _diagonal_coordinates(rows, cols, diagonal_start, row_step_col, start):
+    """
+    Shared walk for both diagonal traversals.
+
+    diagonal_start(d) returns the (row, col) where diagonal number d begins,
+    and every diagonal moves one row down and row_step_col columns across
+    until it leaves the grid. The diagonal holding position start is found
+    in closed form, so resuming never walks the earlier diagonals.
+    """
+
+    if start >= rows * cols:
+        return
+    first_diagonal, offset = _diagonal_of_position(rows, cols, start)
+
+    for diagonal in range(first_diagonal, rows + cols - 1):
+        row, col = diagonal_start(diagonal)
+        length = _diagonal_length(rows, cols, diagonal)
+
+        row += offset
+        col += offset * row_step_col
+        for _ in range(length - offset):
+            yield (row, col)
+            row += 1
+            col += row_step_col
+        offset = 0
+
+
+def _main_diagonal_coordinates(rows, cols, start):
+    """Main diagonal coordinates of a rows x cols grid from position start."""
+
+    # diagonals start along the top row from the last column to the first,
+    # then down the first column from the 2nd row to the last
+    def diagonal_start(diagonal):
+        if diagonal < cols:
+            return 0, cols - 1 - diagonal
+        return diagonal - cols + 1, 0
 
+    return _diagonal_coordinates(rows, cols, diagonal_start, 1, start)
+
+
+def _secondary_diagonal_coordinates(rows, cols, start):
+    """Secondary diagonal coordinates of a rows x cols grid from position start."""
+
+    # diagonals start along the top row from the first column to the last,
+    # then down the last column from the 2nd row to the last
+    def diagonal_start(diagonal):
+        if diagonal < cols:
+            return 0, diagonal
+        return diagonal - cols + 1, cols - 1
+
+    return _diagonal_coordinates(rows, cols, diagonal_start, -1, start)
+
+
+def _spiral_coordinates(rows, cols, start):
+    """Spiral coordinates of a rows x cols grid from position start."""
+
+    # the spiral is a chain of straight segments: right cols, down rows-1,
+    # left cols-1, up rows-2, right cols-2, ... until a segment is empty.
+    # Only the segment lengths and the current cell are tracked.
 
-    current_row = 0
-    current_col = 0
     directions = [[0, 1], [1, 0], [0, -1], [-1, 0]] # right, down, left, up
-    current_direction = 0 # starts by moving right. directions[current_direction] = movement vector
 
-    for _ in range(rows * cols):
-        traversal.append((current_row, current_col))
-        visited_grid[current_row][current_col] = True
+    # jump straight to the layer (ring) holding position start
+    layer = 0
+    if start < rows * cols:
+        layer = _spiral_layer_of_position(rows, cols, start)
+        start -= _spiral_layer_first_position(rows, cols, layer)
 
-        next_row = current_row + directions[current_direction][0]
-        next_col = current_col + directions[current_direction][1]
+    current_row = layer
+    current_col = layer - 1
+    horizontal = cols - 2 * layer
+    vertical = rows - 2 * layer - 1
+    current_direction = 0
 
-        if(next_row < 0 or next_row >= rows
-           or next_col < 0 or next_col >= cols
-           or visited_grid[next_row][next_col]):
-            # if any of the above are true, then direction change needed
-            current_direction = (current_direction + 1) % 4
-            next_row = current_row + directions[current_direction][0]
-            next_col = current_col + directions[current_direction][1]
+    while True:
+        length = horizontal if current_direction % 2 == 0 else vertical
+        if length <= 0:
+            return
 
-        current_row = next_row
-        current_col = next_col
+        row_step, col_step = directions[current_direction]
+        skipped = min(start, length)
+        current_row += row_step * skipped
+        current_col += col_step * skipped
+        start -= skipped
 
-    return traversal
+        for _ in range(length - skipped):
+            current_row += row_step
+            current_col += col_step
+            yield (current_row, current_col)
+
+        if current_direction % 2 == 0:
+            horizontal -= 1
+        else:
+            vertical -= 1
+        current_direction = (current_direction + 1) % 4
+
+
+
+def iter_row_zigzag_traversal(grid, start=0):
+    """
+    Lazily performs a row zigzag traversal of a 2D list.
+
+    pre:
+    - grid is a 2D list representing a 2D matrix.
+    - All rows in grid have the same number of columns.
+    - 0 <= start <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) of row_zigzag_traversal(grid),
+      beginning with the one at index start.
+    """
+
+    return _row_zigzag_coordinates(len(grid), len(grid[0]), start)
+
+
+def iter_column_zigzag_traversal(grid, start=0):
+    """
+    Lazily performs a column zigzag traversal of a 2D list.
+
+    pre:
+    - grid is a 2D list representing a 2D matrix.
+    - All rows in grid have the same number of columns.
+    - 0 <= start <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) of column_zigzag_traversal(grid),
+      beginning with the one at index start.
+    """
+
+    return _column_zigzag_coordinates(len(grid), len(grid[0]), start)
+
+
+def iter_main_diagonal_traversal(grid, start=0):
+    """
+    Lazily performs a main diagonal traversal of a 2D list.
+
+    pre:
+    - grid is a 2D list representing a 2D matrix.
+    - All rows in grid have the same number of columns.
+    - 0 <= start <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) of main_diagonal_traversal(grid),
+      beginning with the one at index start.
+    """
+
+    return _main_diagonal_coordinates(len(grid), len(grid[0]), start)
+
+
+def iter_secondary_diagonal_traversal(grid, start=0):
+    """
+    Lazily performs a secondary diagonal traversal of a 2D list.
+
+    pre:
+    - grid is a 2D list representing a 2D matrix.
+    - All rows in grid have the same number of columns.
+    - 0 <= start <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) of secondary_diagonal_traversal(grid),
+      beginning with the one at index start.
+    """
+
+    return _secondary_diagonal_coordinates(len(grid), len(grid[0]), start)
+
+
+def iter_spiral_traversal(grid, start=0):
+    """
+    Lazily performs a spiral traversal of a 2D list.
+
+    pre:
+    - grid is a 2D list representing a 2D matrix.
+    - All rows in grid have the same number of columns.
+    - 0 <= start <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) of spiral_traversal(grid),
+      beginning with the one at index start.
+    """
+
+    return _spiral_coordinates(len(grid), len(grid[0]), start)
+
+
+# Closed-form index mapping. For every traversal kind, a position in the
+# traversal order maps to its (row, col) and back in O(1) arithmetic, so a
+# cell, a slice or a partition of a traversal can be located without
+# enumerating the coordinates before it. TRAVERSAL_FUNCTIONS maps every kind
+# to its list traversal function; gui.py, the benchmarks and the tests share
+# it.
+
+TRAVERSAL_KINDS = ("row_zigzag", "column_zigzag", "main", "secondary", "spiral")
+
+TRAVERSAL_FUNCTIONS = {
+    "row_zigzag": row_zigzag_traversal,
+    "column_zigzag": column_zigzag_traversal,
+    "main": main_diagonal_traversal,
+    "secondary": secondary_diagonal_traversal,
+    "spiral": spiral_traversal,
+}
+
+
+def _diagonal_length(rows, cols, diagonal):
+    """
+    Number of cells on diagonal number diagonal. Both diagonal orders visit
+    diagonals of length 1, 2, ..., min(rows, cols), repeat that length, and
+    shrink back to 1.
+    """
+
+    return min(diagonal + 1, rows, cols, rows + cols - 1 - diagonal)
+
+
+def _diagonal_first_position(rows, cols, diagonal):
+    """Traversal position of the first cell of diagonal number diagonal."""
+    shortest = min(rows, cols)
+    count = rows + cols - 1
+    if diagonal < shortest:
+        return diagonal * (diagonal + 1) // 2
+    if diagonal <= count - shortest:
+        return (shortest - 1) * shortest // 2 + (diagonal - shortest + 1) * shortest
+    remaining = count - diagonal
+    return rows * cols - remaining * (remaining + 1) // 2
+
+
+def _diagonal_of_position(rows, cols, position):
+    """
+    Finds the diagonal holding a traversal position.
+
+    pre: 0 <= position < rows * cols
+    post: returns (diagonal number, offset of position along that diagonal).
+    """
+
+    shortest = min(rows, cols)
+    count = rows + cols - 1
+    growing = (shortest - 1) * shortest // 2
+    steady = (count - 2 * shortest + 2) * shortest
+
+    if position < growing:
+        # the first diagonals have lengths 1, 2, 3, ..., a triangular number
+        diagonal = (isqrt(8 * position + 1) - 1) // 2
+        return diagonal, position - diagonal * (diagonal + 1) // 2
+    if position < growing + steady:
+        diagonal, offset = divmod(position - growing, shortest)
+        return shortest - 1 + diagonal, offset
+
+    # the last diagonals mirror the first ones, so count from the end
+    from_end = rows * cols - 1 - position
+    mirrored = (isqrt(8 * from_end + 1) - 1) // 2
+    offset_from_end = from_end - mirrored * (mirrored + 1) // 2
+    return count - 1 - mirrored, mirrored - offset_from_end
+
+
+def _spiral_layer_first_position(rows, cols, layer):
+    """Traversal position of the first cell of spiral layer (ring) layer."""
+    return rows * cols - (rows - 2 * layer) * (cols - 2 * layer)
+
+
+def _spiral_layer_of_position(rows, cols, position):
+    """
+    Finds the spiral layer holding a traversal position.
+
+    pre: 0 <= position < rows * cols
+    post: returns the largest layer whose first position is <= position.
+    """
+
+    # the layer is the floor of the smaller root of
+    # 4 * layer^2 - 2 * (rows + cols) * layer + position = 0;
+    # isqrt can be off by one, which the loops below correct
+    total = rows + cols
+    layer = (total - isqrt(total * total - 4 * position)) // 4
+    last_layer = (min(rows, cols) - 1) // 2
+    layer = max(0, min(layer, last_layer))
+    while layer > 0 and _spiral_layer_first_position(rows, cols, layer) > position:
+        layer -= 1
+    while (layer < last_layer
+           and _spiral_layer_first_position(rows, cols, layer + 1) <= position):
+        layer += 1
+    return layer
+
+
+def _row_zigzag_coordinate(_rows, cols, position):
+    """Cell at a position of the row zigzag traversal."""
+    row, offset = divmod(position, cols)
+    return (row, offset if row % 2 == 0 else cols - 1 - offset)
+
+
+def _row_zigzag_position(_rows, cols, row, col):
+    """Position of a cell in the row zigzag traversal."""
+    return row * cols + (col if row % 2 == 0 else cols - 1 - col)
+
+
+def _column_zigzag_coordinate(rows, _cols, position):
+    """Cell at a position of the column zigzag traversal."""
+    col, offset = divmod(position, rows)
+    return (offset if col % 2 == 0 else rows - 1 - offset, col)
+
+
+def _column_zigzag_position(rows, _cols, row, col):
+    """Position of a cell in the column zigzag traversal."""
+    return col * rows + (row if col % 2 == 0 else rows - 1 - row)
+
+
+def _main_diagonal_coordinate(rows, cols, position):
+    """Cell at a position of the main diagonal traversal."""
+    diagonal, offset = _diagonal_of_position(rows, cols, position)
+    if diagonal < cols:
+        return (offset, cols - 1 - diagonal + offset)
+    return (diagonal - cols + 1 + offset, offset)
+
+
+def _main_diagonal_position(rows, cols, row, col):
+    """Position of a cell in the main diagonal traversal."""
+    diagonal = cols - 1 - (col - row)
+    return _diagonal_first_position(rows, cols, diagonal) + min(row, col)
+
+
+def _secondary_diagonal_coordinate(rows, cols, position):
+    """Cell at a position of the secondary diagonal traversal."""
+    diagonal, offset = _diagonal_of_position(rows, cols, position)
+    if diagonal < cols:
+        return (offset, diagonal - offset)
+    return (diagonal - cols + 1 + offset, cols - 1 - offset)
+
+
+def _secondary_diagonal_position(rows, cols, row, col):
+    """Position of a cell in the secondary diagonal traversal."""
+    diagonal = row + col
+    offset = row - max(0, diagonal - cols + 1)
+    return _diagonal_first_position(rows, cols, diagonal) + offset
+
+
+def _spiral_coordinate(rows, cols, position):
+    """Cell at a position of the spiral traversal."""
+    layer = _spiral_layer_of_position(rows, cols, position)
+    step = position - _spiral_layer_first_position(rows, cols, layer)
+    width = cols - 2 * layer
+    height = rows - 2 * layer
+
+    if step < width:  # top row, moving right
+        return (layer, layer + step)
+    step -= width
+    if step < height - 1:  # right column, moving down
+        return (layer + 1 + step, layer + width - 1)
+    step -= height - 1
+    if step < width - 1:  # bottom row, moving left
+        return (layer + height - 1, layer + width - 2 - step)
+    step -= width - 1
+    return (layer + height - 2 - step, layer)  # left column, moving up
+
+
+def _spiral_position(rows, cols, row, col):
+    """Position of a cell in the spiral traversal."""
+    layer = min(row, col, rows - 1 - row, cols - 1 - col)
+    width = cols - 2 * layer
+    height = rows - 2 * layer
+    row -= layer
+    col -= layer
+
+    if row == 0:
+        step = col
+    elif col == width - 1:
+        step = width - 1 + row
+    elif row == height - 1:
+        step = width + height - 2 + (width - 1 - col)
+    else:
+        step = 2 * width + height - 3 + (height - 1 - row)
+    return _spiral_layer_first_position(rows, cols, layer) + step
+
+
+_COORDINATE_FUNCTIONS = {
+    "row_zigzag": _row_zigzag_coordinate,
+    "column_zigzag": _column_zigzag_coordinate,
+    "main": _main_diagonal_coordinate,
+    "secondary": _secondary_diagonal_coordinate,
+    "spiral": _spiral_coordinate,
+}
+
+_POSITION_FUNCTIONS = {
+    "row_zigzag": _row_zigzag_position,
+    "column_zigzag": _column_zigzag_position,
+    "main": _main_diagonal_position,
+    "secondary": _secondary_diagonal_position,
+    "spiral": _spiral_position,
+}
+
+
+def traversal_coordinate(kind, rows, cols, position):
+    """
+    Finds the cell at a given position of a traversal without generating
+    the traversal.
+
+    pre:
+    - kind is one of TRAVERSAL_KINDS.
+    - rows >= 1 and cols >= 1 are the dimensions of the grid.
+
+    post:
+    - Returns the tuple (row, column) at index position of the list the
+      matching traversal function returns for a rows x cols grid.
+    - Raises a ValueError for an unknown kind and an IndexError if position
+      is not in range(rows * cols).
+    """
+
+    if kind not in _COORDINATE_FUNCTIONS:
+        raise ValueError(f"unknown traversal kind: {kind}")
+    if not 0 <= position < rows * cols:
+        raise IndexError("traversal position out of range")
+    return _COORDINATE_FUNCTIONS[kind](rows, cols, position)
+
+
+def traversal_position(kind, rows, cols, row, col):
+    """
+    Finds the position of a cell in a traversal without generating the
+    traversal. This is the inverse of traversal_coordinate.
+
+    pre:
+    - kind is one of TRAVERSAL_KINDS.
+    - rows >= 1 and cols >= 1 are the dimensions of the grid.
+
+    post:
+    - Returns the index of (row, col) in the list the matching traversal
+      function returns for a rows x cols grid.
+    - Raises a ValueError for an unknown kind and an IndexError if (row, col)
+      is outside the grid.
+    """
+
+    if kind not in _POSITION_FUNCTIONS:
+        raise ValueError(f"unknown traversal kind: {kind}")
+    if not (0 <= row < rows and 0 <= col < cols):
+        raise IndexError("cell is outside the grid")
+    return _POSITION_FUNCTIONS[kind](rows, cols, row, col)
+
+
+_COORDINATE_ITERATORS = {
+    "row_zigzag": _row_zigzag_coordinates,
+    "column_zigzag": _column_zigzag_coordinates,
+    "main": _main_diagonal_coordinates,
+    "secondary": _secondary_diagonal_coordinates,
+    "spiral": _spiral_coordinates,
+}
+
+
+def iter_traversal_range(kind, rows, cols, start, stop):
+    """
+    Lazily generates one contiguous slice of a traversal. The state at start
+    is found in closed form, so no earlier coordinate is ever generated.
+
+    pre:
+    - kind is one of TRAVERSAL_KINDS.
+    - rows >= 1 and cols >= 1 are the dimensions of the grid.
+    - 0 <= start <= stop <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) at indices start to stop - 1 of the
+      list the matching traversal function returns for a rows x cols grid.
+    - Raises a ValueError for an unknown kind and an IndexError if
+      start:stop is not a slice of range(rows * cols).
+    """
+
+    if kind not in _COORDINATE_ITERATORS:
+        raise ValueError(f"unknown traversal kind: {kind}")
+    if not 0 <= start <= stop <= rows * cols:
+        raise IndexError("traversal range out of range")
+    return islice(_COORDINATE_ITERATORS[kind](rows, cols, start), stop - start)
+
+
+def iter_traversal(kind, rows, cols, start=0):
+    """
+    Lazily performs a traversal of a grid given only its dimensions, so the
+    grid itself never has to be in memory.
+
+    pre:
+    - kind is one of TRAVERSAL_KINDS.
+    - rows >= 1 and cols >= 1 are the dimensions of the grid.
+    - 0 <= start <= rows * cols
+
+    post:
+    - Yields the tuples (row, column) of the matching traversal function for
+      a rows x cols grid, beginning with the one at index start.
+    - Raises a ValueError for an unknown kind and an IndexError if start is
+      out of range.
+    """
+
+    return iter_traversal_range(kind, rows, cols, start, rows * cols)
+
+
+# Ragged grids, whose rows may have different lengths, are traversed with
+# the following skip policy: the traversal runs over the bounding rectangle
+# of len(row_lengths) rows by max(row_lengths) columns, and every coordinate
+# (row, col) with col >= row_lengths[row] is a hole that is skipped. Every
+# other coordinate keeps its place relative to the rest, so a rectangular
+# grid gives exactly the rectangular traversal. Empty rows still count as
+# rows but contribute no coordinates.
+
+
+def grid_row_lengths(rows):
+    """
+    Measures the rows of a grid in one pass.
+
+    pre: rows is any iterable of sized rows: a 2D list, a file reader, a
+    generator or a 2D memmap.
+    post: returns a list holding the length of every row. Only one row is
+    held at a time, so rows can come from a stream.
+    """
+
+    return [len(row) for row in rows]
+
+
+def iter_ragged_traversal(kind, row_lengths):
+    """
+    Lazily performs a traversal of a ragged grid given only its row lengths.
+
+    pre:
+    - kind is one of TRAVERSAL_KINDS.
+    - row_lengths is a list of ints >= 0, one per row.
+
+    post:
+    - Yields the tuples (row, column) of the traversal of the bounding
+      rectangle, skipping holes as described above. Yields nothing if there
+      are no rows or every row is empty.
+    - Raises a ValueError for an unknown kind.
+    """
+
+    if kind not in _COORDINATE_ITERATORS:
+        raise ValueError(f"unknown traversal kind: {kind}")
+    rows = len(row_lengths)
+    cols = max(row_lengths, default=0)
+    if cols == 0:
+        return iter(())
+
+    coordinates = _COORDINATE_ITERATORS[kind](rows, cols, 0)
+    if min(row_lengths) == cols:
+        return coordinates
+    return (
+        (row, col) for row, col in coordinates if col < row_lengths[row]
+    )
+
+
+def iter_traversal_of_rows(kind, rows):
+    """
+    Lazily performs a traversal of a grid that is read one row at a time.
+
+    pre:
+    - kind is one of TRAVERSAL_KINDS.
+    - rows is any iterable of sized rows, as in grid_row_lengths; rows may
+      have different lengths.
+
+    post:
+    - Consumes rows once to measure it, then yields the same tuples
+      (row, column) as iter_ragged_traversal(kind, grid_row_lengths(rows)).
+      For a rectangular grid these are the coordinates of the matching
+      traversal function.
+    - Raises a ValueError for an unknown kind.
+    """
+
+    if kind not in _COORDINATE_ITERATORS:
+        raise ValueError(f"unknown traversal kind: {kind}")
+    return iter_ragged_traversal(kind, grid_row_lengths(rows))
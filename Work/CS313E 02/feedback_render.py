@@ -0,0 +1,101 @@
+"""
+Feedback Renderer
+
+Turns (feedback code, word) pairs from feedback_table into the exact bytes
+of the colored strings get_feedback and color_word build, without any
+per-character string formatting. Every (color, character) fragment
+"<color><character><reset>" is encoded once up front; rendering a word is
+five table lookups appended to a reusable bytearray.
+"""
+
+from wordle import RESET_COLOR
+from feedback_table import ALL_CORRECT, DIGIT_COLORS, NUM_CODES, decode_feedback
+
+# FRAGMENTS[digit][byte]: the encoded fragment of one ASCII character in the
+# color of one feedback digit
+FRAGMENTS = tuple(
+    tuple(f"{color}{chr(byte)}{RESET_COLOR}".encode("ascii") for byte in range(128))
+    for color in DIGIT_COLORS
+)
+
+# CODE_FRAGMENTS[code][i]: the fragment table of letter i under a code
+CODE_FRAGMENTS = tuple(
+    tuple(FRAGMENTS[DIGIT_COLORS.index(color)] for color in decode_feedback(code))
+    for code in range(NUM_CODES)
+)
+
+
+class FeedbackRenderer:
+    """
+    Renders feedback into one growing bytearray, which can be written out
+    and cleared between batches so its memory is reused.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def write(self, code, word, end=b""):
+        """
+        Appends the colored word, then end, to the buffer.
+
+        pre: code is an int in range(NUM_CODES), word is a string of exactly
+             5 ASCII characters, end is bytes.
+        post: the buffer grows by the bytes of
+              feedback_table.render_feedback(code, word) followed by end.
+        """
+
+        first, second, third, fourth, fifth = word.encode("ascii")
+        tables = CODE_FRAGMENTS[code]
+        self.buffer += b"".join((
+            tables[0][first],
+            tables[1][second],
+            tables[2][third],
+            tables[3][fourth],
+            tables[4][fifth],
+            end,
+        ))
+
+    def write_many(self, codes, words, end=b"\n"):
+        """
+        pre: codes and words have the same length, as in write.
+        post: writes every (code, word) pair, each followed by end.
+        """
+
+        for code, word in zip(codes, words):
+            self.write(int(code), word, end)
+
+    def write_secret(self, word, end=b""):
+        """
+        pre: word is a string of exactly 5 ASCII characters.
+        post: appends the bytes of main's formatted_secret_word.
+        """
+
+        self.write(ALL_CORRECT, word, end)
+
+    def getvalue(self):
+        """post: returns the buffer contents as bytes."""
+        return bytes(self.buffer)
+
+    def flush(self, outfile):
+        """
+        pre: outfile is a binary file.
+        post: writes the buffer to outfile and clears it, keeping its memory.
+        """
+
+        outfile.write(self.buffer)
+        self.clear()
+
+    def clear(self):
+        """post: empties the buffer."""
+        del self.buffer[:]
+
+
+def render_feedback_bytes(code, word):
+    """
+    pre: as in FeedbackRenderer.write.
+    post: returns get_feedback's string for the code and word, encoded.
+    """
+
+    renderer = FeedbackRenderer()
+    renderer.write(code, word)
+    return renderer.getvalue()
@@ -0,0 +1,259 @@
+"""
+Wordle Feedback Table
+
+Encodes the feedback of wordle.get_feedback as one base-3 integer per
+(guess, secret) pair and precomputes the whole guess x secret matrix of
+codes with vectorized NumPy. The matrix is cached on disk as a .npy file and
+memory-mapped on later loads, so every process shares one copy of it.
+
+Each position of the guess is one base-3 digit: 0 for NOT_IN_WORD_COLOR,
+1 for WRONG_SPOT_COLOR and 2 for CORRECT_COLOR. The first letter is the most
+significant digit, so codes run from 0 (no letter in the word) to 242 (all
+five letters correct).
+"""
+
+import hashlib
+import os
+
+import numpy as np
+
+from wordle import (
+    CORRECT_COLOR,
+    NOT_IN_WORD_COLOR,
+    NUM_LETTERS,
+    WRONG_SPOT_COLOR,
+    color_word,
+)
+
+NOT_IN_WORD = 0
+WRONG_SPOT = 1
+CORRECT = 2
+
+# Color of each base-3 digit
+DIGIT_COLORS = (NOT_IN_WORD_COLOR, WRONG_SPOT_COLOR, CORRECT_COLOR)
+
+# Number of distinct codes and the code of a correct guess
+NUM_CODES = 3 ** NUM_LETTERS
+ALL_CORRECT = NUM_CODES - 1
+
+# Upper bound on guess x secret pairs compared in one vectorized step, so the
+# dozen boolean planes of a block stay in cache.
+BLOCK_PAIRS = 1 << 18
+
+DEFAULT_CACHE_DIR = "feedback_cache"
+
+
+def feedback_code(secret_word, guessed_word):
+    """
+    Computes the feedback of one guess as a code, without building colored
+    strings.
+
+    pre: secret_word and guessed_word are strings of exactly 5 lowercase
+         alphabetic characters.
+    post: returns an int in range(NUM_CODES) that decode_feedback turns into
+          the colors get_feedback(secret_word, guessed_word) uses.
+    """
+
+    digits = [NOT_IN_WORD] * NUM_LETTERS
+    remaining = {}
+    for i in range(NUM_LETTERS):
+        if guessed_word[i] == secret_word[i]:
+            digits[i] = CORRECT
+        else:
+            remaining[secret_word[i]] = remaining.get(secret_word[i], 0) + 1
+
+    for i in range(NUM_LETTERS):
+        letter = guessed_word[i]
+        if digits[i] == NOT_IN_WORD and remaining.get(letter, 0) > 0:
+            digits[i] = WRONG_SPOT
+            remaining[letter] -= 1
+
+    code = 0
+    for digit in digits:
+        code = code * 3 + digit
+    return code
+
+
+def decode_feedback(code):
+    """
+    pre: code is an int in range(NUM_CODES).
+    post: returns the list of 5 colors the code stands for.
+    """
+
+    colors = [None] * NUM_LETTERS
+    for i in range(NUM_LETTERS - 1, -1, -1):
+        code, digit = divmod(code, 3)
+        colors[i] = DIGIT_COLORS[digit]
+    return colors
+
+
+def render_feedback(code, guessed_word):
+    """
+    pre: code is an int in range(NUM_CODES), guessed_word is a string of
+         exactly 5 characters.
+    post: returns the same string as get_feedback for the guess the code
+          was computed from.
+    """
+
+    return color_word(decode_feedback(code), guessed_word)
+
+
+def encode_words(words):
+    """
+    pre: words is a list of strings of exactly 5 lowercase letters.
+    post: returns a uint8 array of shape (len(words), 5) holding the ASCII
+          code of every letter.
+    """
+
+    letters = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return letters.reshape(len(words), NUM_LETTERS)
+
+
+def _block_codes(guesses, secrets):
+    """
+    Feedback codes of every pair of a block of encoded guesses and secrets.
+
+    post: returns a uint8 array of shape (len(guesses), len(secrets)).
+
+    Mirrors get_feedback on whole (guess, secret) planes: first mark the
+    correct letters, then give each other guess letter, from left to right,
+    the first unmatched secret position holding the same letter.
+    """
+
+    correct = [
+        guesses[:, i, np.newaxis] == secrets[np.newaxis, :, i] for i in range(NUM_LETTERS)
+    ]
+    # secret positions not yet matched by a correct or wrong spot letter
+    unmatched = [~is_correct for is_correct in correct]
+
+    codes = np.zeros((len(guesses), len(secrets)), dtype=np.uint8)
+    for i in range(NUM_LETTERS):
+        searching = ~correct[i]
+        letter = guesses[:, i, np.newaxis]
+        for j in range(NUM_LETTERS):
+            # secret position i holds another letter whenever i is searching
+            if j == i:
+                continue
+            found = searching & unmatched[j] & (letter == secrets[np.newaxis, :, j])
+            unmatched[j] &= ~found
+            searching &= ~found
+
+        codes *= 3
+        codes += correct[i] * np.uint8(CORRECT)
+        codes += ~correct[i] & ~searching
+    return codes
+
+
+def feedback_matrix(guesses, secrets):
+    """
+    Computes the feedback code of every guess against every secret.
+
+    pre: guesses and secrets are lists of strings of exactly 5 lowercase
+         letters.
+    post: returns a uint8 array of shape (len(guesses), len(secrets)) where
+          entry (g, s) is feedback_code(secrets[s], guesses[g]).
+    """
+
+    encoded_guesses = encode_words(guesses)
+    encoded_secrets = encode_words(secrets)
+    codes = np.empty((len(guesses), len(secrets)), dtype=np.uint8)
+    step = max(1, BLOCK_PAIRS // max(1, len(secrets)))
+    for start in range(0, len(guesses), step):
+        codes[start:start + step] = _block_codes(
+            encoded_guesses[start:start + step], encoded_secrets
+        )
+    return codes
+
+
+def word_list_digest(guesses, secrets):
+    """
+    post: returns a hex digest that changes whenever guesses, secrets or
+          their order change; used to name cached matrices.
+    """
+
+    digest = hashlib.sha256()
+    digest.update("\n".join(guesses).encode("ascii"))
+    digest.update(b"\0")
+    digest.update("\n".join(secrets).encode("ascii"))
+    return digest.hexdigest()
+
+
+class FeedbackTable:
+    """
+    Feedback codes of every guess against every secret, with lookups by
+    word. codes may be an in-memory array or a read-only memmap.
+    """
+
+    def __init__(self, guesses, secrets, codes):
+        """
+        pre: codes has shape (len(guesses), len(secrets)) and entry (g, s)
+             is feedback_code(secrets[s], guesses[g]).
+        post: creates a table over the given word lists.
+        """
+
+        self.guesses = list(guesses)
+        self.secrets = list(secrets)
+        self.codes = codes
+        self.guess_index = {word: i for i, word in enumerate(self.guesses)}
+        self.secret_index = {word: i for i, word in enumerate(self.secrets)}
+
+    @classmethod
+    def build(cls, guesses, secrets):
+        """
+        post: returns a table whose codes are computed in memory.
+        """
+
+        return cls(guesses, secrets, feedback_matrix(guesses, secrets))
+
+    @classmethod
+    def load(cls, guesses, secrets, cache_dir=DEFAULT_CACHE_DIR):
+        """
+        Memory-maps the cached matrix of the word lists, computing and
+        caching it first if no valid cache file exists.
+
+        pre: guesses and secrets are lists of strings of exactly 5 lowercase
+             letters; cache_dir is a writable directory path.
+        post: returns a table whose codes are a read-only memmap of
+              cache_dir/feedback_<digest>.npy. A file with the wrong shape
+              or dtype is rebuilt; a file for other word lists has another
+              name and is never read.
+        """
+
+        path = os.path.join(
+            cache_dir, f"feedback_{word_list_digest(guesses, secrets)[:16]}.npy"
+        )
+        shape = (len(guesses), len(secrets))
+        if os.path.exists(path):
+            try:
+                codes = np.load(path, mmap_mode="r")
+                if codes.shape == shape and codes.dtype == np.uint8:
+                    return cls(guesses, secrets, codes)
+            except (OSError, ValueError):
+                pass
+
+        os.makedirs(cache_dir, exist_ok=True)
+        # write under a temporary name, so a concurrent loader never maps a
+        # half-written file
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as outfile:
+            np.save(outfile, feedback_matrix(guesses, secrets))
+        os.replace(temporary_path, path)
+        return cls(guesses, secrets, np.load(path, mmap_mode="r"))
+
+    def code(self, secret_word, guessed_word):
+        """
+        pre: guessed_word is in self.guesses and secret_word is in
+             self.secrets.
+        post: returns feedback_code(secret_word, guessed_word).
+              Raises a KeyError for a word outside the table.
+        """
+
+        return int(self.codes[self.guess_index[guessed_word], self.secret_index[secret_word]])
+
+    def feedback(self, secret_word, guessed_word):
+        """
+        pre: as in code.
+        post: returns get_feedback(secret_word, guessed_word).
+        """
+
+        return render_feedback(self.code(secret_word, guessed_word), guessed_word)
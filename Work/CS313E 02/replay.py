@@ -0,0 +1,162 @@
+"""
+Headless Wordle Replay
+
+Plays wordle.main's game loop without a terminal: the command line arguments
+and the guesses are passed in, and the result comes back as a GameResult
+holding both the outcome and the exact text main would print when reading
+those guesses from a file. Many games can be replayed in one process, or
+spread over a process pool, without re-reading the word lists per game.
+"""
+
+import contextlib
+import functools
+import io
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from wordle import (
+    ATTEMPT_NUMBER,
+    CORRECT_COLOR,
+    INVALID_INPUT,
+    RESET_COLOR,
+    choose_secret_word,
+    get_feedback,
+    is_valid_guess,
+    print_explanation,
+    read_word_lists,
+)
+
+# secret_word: the secret, or None if the arguments were invalid.
+# turns: one (guess, feedback) tuple per valid guess, in order.
+# invalid_guesses: the number of guesses rejected by is_valid_guess.
+# won: True if the secret was guessed. finished: False if the guesses ran out
+# before the game ended. output: everything main would print.
+GameResult = namedtuple(
+    "GameResult",
+    ["secret_word", "turns", "invalid_guesses", "won", "finished", "output"],
+)
+
+@functools.lru_cache(maxsize=None)
+def _load():
+    """
+    Reads the word lists and captures the explanation text, once per
+    process.
+    """
+
+    valid_guesses, secret_words = read_word_lists()
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        print_explanation()
+    return valid_guesses, secret_words, buffer.getvalue()
+
+
+def replay_game(arguments, guesses):
+    """
+    Replays one game.
+
+    pre: arguments is the list of command line arguments after the program
+         name (for example ["hello"], ["154"] or []), guesses is an iterable
+         of the lines the player types. The word list files are in the
+         working directory, as for prepare_game.
+    post: returns a GameResult. Its output is the text main prints when
+          run with these arguments and guesses piped in from a file.
+          No terminal input or output happens. As in prepare_game, a seed
+          argument reseeds the global random state, and a game without
+          arguments draws its secret from that state.
+    """
+
+    valid_guesses, secret_words, explanation = _load()
+    try:
+        secret_word, is_custom = choose_secret_word(list(arguments), secret_words)
+    except ValueError:
+        return GameResult(None, [], 0, False, True, INVALID_INPUT + "\n")
+
+    # prepare_game adds a custom secret word to the valid guesses
+    extra_guess = secret_word if is_custom and secret_word not in valid_guesses else None
+    formatted_secret_word = "".join(
+        [CORRECT_COLOR + c + RESET_COLOR for c in secret_word]
+    )
+
+    output = [explanation]
+    turns = []
+    invalid_guesses = 0
+    won = False
+    attempts = 6
+    guesses = iter(guesses)
+    while attempts > 0:
+        prompt = "Enter your " + ATTEMPT_NUMBER[attempts] + " guess: "
+        guess = next(guesses, None)
+        if guess is None:
+            return GameResult(
+                secret_word, turns, invalid_guesses, False, False, "".join(output)
+            )
+        output.append(prompt + guess + "\n")
+
+        if not (is_valid_guess(guess, valid_guesses) or guess == extra_guess):
+            output.append(INVALID_INPUT + "\n")
+            invalid_guesses += 1
+            continue
+
+        feedback = get_feedback(secret_word, guess)
+        output.append(" " * (len(prompt) - 1) + " " + feedback + "\n")
+        turns.append((guess, feedback))
+
+        if feedback == formatted_secret_word:
+            output.append(
+                "Congratulations! You guessed the word '"
+                + formatted_secret_word + "' correctly.\n"
+            )
+            won = True
+            break
+
+        attempts -= 1
+
+    if attempts == 0:
+        output.append(
+            "Sorry, you've run out of attempts. The correct word was '"
+            + formatted_secret_word + "'.\n"
+        )
+    return GameResult(secret_word, turns, invalid_guesses, won, True, "".join(output))
+
+
+def transcript_game(path):
+    """
+    Reads a transcript such as hello.in.
+
+    pre: path names a file of guesses, one per line, whose name without the
+         .in suffix holds the command line arguments, as in the tests.
+    post: returns the tuple (arguments, guesses) to pass to replay_game.
+    """
+
+    with open(path, "r", encoding="UTF-8") as infile:
+        guesses = infile.read().splitlines()
+    arguments = os.path.basename(path).split(".in")[0].split()
+    return arguments, guesses
+
+
+def _replay_args(game):
+    """Pool worker: replay_game(*game)."""
+    return replay_game(*game)
+
+
+def replay_games(games, workers=None, chunksize=64):
+    """
+    Replays many games, in a process pool if workers is not 1.
+
+    pre: games is an iterable of (arguments, guesses) tuples; workers is None
+         (one per CPU) or >= 1.
+    post: returns the list of GameResults in the order of games. Every
+          game with a secret word or seed argument gives the same result as
+          replay_game in this process. A game without arguments is not
+          reproducible: its secret comes from the global random state of
+          whichever process replays it, which depends on the games replayed
+          there before it. With workers == 1 the games run in this process
+          and change its global random state; a pool leaves it alone.
+    """
+
+    games = [(list(arguments), list(guesses)) for arguments, guesses in games]
+    if workers == 1:
+        return [replay_game(*game) for game in games]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_replay_args, games, chunksize=chunksize))
@@ -0,0 +1,253 @@
+"""
+Wordle Solver
+
+Picks guesses that split the remaining secret words as evenly as possible,
+using the precomputed feedback codes of feedback_table instead of calling
+get_feedback. For a guess, the remaining secrets are partitioned by the
+feedback code they would give; the guess is scored by the entropy of that
+partition (expected information in bits) or by the expected size of the
+partition the secret falls in.
+
+The ranking of the first guess depends only on the word lists, so it is
+computed once and cached next to the feedback matrix.
+"""
+
+import os
+
+import numpy as np
+
+from feedback_table import (
+    ALL_CORRECT,
+    NUM_CODES,
+    DEFAULT_CACHE_DIR,
+    FeedbackTable,
+    word_list_digest,
+)
+from word_pack import load_word_list
+
+METRICS = ("entropy", "expected_size")
+
+# Guesses scored in one vectorized step
+BLOCK_GUESSES = 2048
+
+# Tie-breaking bonus for a guess that could itself be the secret
+CANDIDATE_BONUS = 1e-6
+
+
+def partition_sizes(codes):
+    """
+    Counts how many secrets fall into every feedback code, for many guesses.
+
+    pre: codes is a uint8 array of shape (guesses, secrets) of feedback codes.
+    post: returns an int64 array of shape (guesses, NUM_CODES) where entry
+          (g, c) is the number of secrets that guess g gives code c.
+    """
+
+    rows = codes.shape[0]
+    offsets = np.arange(rows, dtype=np.int64)[:, np.newaxis] * NUM_CODES
+    counts = np.bincount((codes + offsets).ravel(), minlength=rows * NUM_CODES)
+    return counts.reshape(rows, NUM_CODES)
+
+
+def score_partitions(sizes, metric="entropy"):
+    """
+    Scores guesses by their partitions; higher scores are better.
+
+    pre: sizes is an array of shape (guesses, NUM_CODES) as returned by
+         partition_sizes, every row summing to the same total >= 1.
+         metric is one of METRICS.
+    post: returns a float array of shape (guesses,). For "entropy" this is
+          the entropy of the partition in bits; for "expected_size" it is
+          minus the expected number of secrets left after the guess.
+          Raises a ValueError for an unknown metric.
+    """
+
+    total = int(sizes[0].sum())
+    if metric == "entropy":
+        # entropy = log2(total) - sum(size * log2(size)) / total
+        size_log_size = np.zeros(total + 1)
+        size_log_size[1:] = np.arange(1, total + 1) * np.log2(np.arange(1, total + 1))
+        return np.log2(total) - size_log_size[sizes].sum(axis=1) / total
+    if metric == "expected_size":
+        return -(sizes * sizes).sum(axis=1) / total
+    raise ValueError(f"unknown metric: {metric}")
+
+
+def best_possible_score(candidates, metric="entropy"):
+    """
+    post: returns the score of a guess that puts every one of candidates
+          secrets in its own partition, an upper bound on every score.
+    """
+
+    if metric == "entropy":
+        return float(np.log2(candidates))
+    return -1.0
+
+
+class WordleSolver:
+    """
+    Entropy (or expected size) maximizing Wordle solver.
+
+    table.guesses are the words the solver may guess and table.secrets the
+    words the secret may be. Candidates are tracked as an array of indices
+    into table.secrets.
+    """
+
+    def __init__(self, table, metric="entropy", cache_dir=None):
+        """
+        pre: table is a FeedbackTable, metric is one of METRICS, cache_dir is
+             None or a writable directory for the first guess ranking.
+        post: creates a solver; raises a ValueError for an unknown metric.
+        """
+
+        if metric not in METRICS:
+            raise ValueError(f"unknown metric: {metric}")
+        self.table = table
+        self.metric = metric
+        self.cache_dir = cache_dir
+        self._first_ranking = None
+
+        # guess row of every secret word that is also a guess
+        self._secret_rows = np.array(
+            [table.guess_index.get(word, -1) for word in table.secrets], dtype=np.int64
+        )
+
+    def all_candidates(self):
+        """post: returns the indices of every secret word."""
+        return np.arange(len(self.table.secrets))
+
+    def filter_candidates(self, candidates, guessed_word, code):
+        """
+        pre: candidates is an array of secret indices, guessed_word is in
+             table.guesses and code is the feedback code it received.
+        post: returns the candidates that would have given that code.
+        """
+
+        row = self.table.codes[self.table.guess_index[guessed_word]]
+        return candidates[row[candidates] == code]
+
+    def rank_guesses(self, candidates):
+        """
+        Scores every guess against the remaining candidates.
+
+        pre: candidates is a non-empty array of secret indices.
+        post: returns a float array with one score per word of table.guesses.
+              Guesses that may be the secret get a tiny bonus, so they win
+              ties.
+        """
+
+        scores = np.empty(len(self.table.guesses))
+        for start in range(0, len(scores), BLOCK_GUESSES):
+            codes = self.table.codes[start:start + BLOCK_GUESSES][:, candidates]
+            scores[start:start + BLOCK_GUESSES] = score_partitions(
+                partition_sizes(codes), self.metric
+            )
+        rows = self._secret_rows[candidates]
+        scores[rows[rows >= 0]] += CANDIDATE_BONUS
+        return scores
+
+    def first_guess_ranking(self):
+        """
+        post: returns rank_guesses(all_candidates()), computed once per
+              solver and, with a cache_dir, once per word lists and metric.
+        """
+
+        if self._first_ranking is not None:
+            return self._first_ranking
+
+        path = None
+        if self.cache_dir is not None:
+            digest = word_list_digest(self.table.guesses, self.table.secrets)[:16]
+            path = os.path.join(self.cache_dir, f"ranking_{self.metric}_{digest}.npy")
+            if os.path.exists(path):
+                try:
+                    ranking = np.load(path)
+                    if ranking.shape == (len(self.table.guesses),):
+                        self._first_ranking = ranking
+                        return ranking
+                except (OSError, ValueError):
+                    pass
+
+        ranking = self.rank_guesses(self.all_candidates())
+        if path is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temporary_path = f"{path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as outfile:
+                np.save(outfile, ranking)
+            os.replace(temporary_path, path)
+        self._first_ranking = ranking
+        return ranking
+
+    def best_guess(self, candidates):
+        """
+        Picks the next guess.
+
+        pre: candidates is a non-empty array of secret indices.
+        post: returns the word of table.guesses with the best score.
+
+        The remaining candidates are scored first. If one of them splits the
+        others into singletons it reaches best_possible_score, which no
+        other guess can beat, and the other guesses are never scored. That
+        early exit is the only pruning: otherwise every guess is scored
+        with rank_guesses.
+        """
+
+        if len(candidates) == len(self.table.secrets):
+            return self.table.guesses[int(np.argmax(self.first_guess_ranking()))]
+        if len(candidates) <= 2:
+            return self.table.secrets[int(candidates[0])]
+
+        rows = self._secret_rows[candidates]
+        rows = rows[rows >= 0]
+        if len(rows):
+            scores = score_partitions(
+                partition_sizes(self.table.codes[rows][:, candidates]), self.metric
+            )
+            best = int(np.argmax(scores))
+            if scores[best] >= best_possible_score(len(candidates), self.metric) - 1e-9:
+                return self.table.guesses[int(rows[best])]
+
+        return self.table.guesses[int(np.argmax(self.rank_guesses(candidates)))]
+
+    def solve(self, secret_word, max_guesses=6):
+        """
+        Plays a game against a known secret word.
+
+        pre: secret_word is a string.
+        post: returns the list of guesses made, ending with secret_word if it
+              was found within max_guesses. Raises a ValueError if
+              secret_word is not in table.secrets.
+        """
+
+        if secret_word not in self.table.secret_index:
+            raise ValueError(f"{secret_word!r} is not a secret word")
+        candidates = self.all_candidates()
+        secret = self.table.secret_index[secret_word]
+        guesses = []
+        while len(guesses) < max_guesses:
+            guess = self.best_guess(candidates)
+            guesses.append(guess)
+            code = int(self.table.codes[self.table.guess_index[guess], secret])
+            if code == ALL_CORRECT:
+                break
+            candidates = self.filter_candidates(candidates, guess, code)
+        return guesses
+
+
+def load_solver(metric="entropy", cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Builds a solver over valid_guesses.txt and secret_words.txt.
+
+    pre: both files are in the working directory, as for prepare_game.
+    post: returns a WordleSolver that may guess any valid guess or secret
+          word, using the cached feedback matrix and first guess ranking in
+          cache_dir. The word lists are read from their word_pack.py packs
+          when those are up to date, as in prepare_game.
+    """
+
+    guesses = load_word_list("valid_guesses.txt")
+    secrets = load_word_list("secret_words.txt")
+    known = set(guesses)
+    guesses += [word for word in secrets if word not in known]
+    table = FeedbackTable.load(guesses, secrets, cache_dir)
+    return WordleSolver(table, metric, cache_dir)
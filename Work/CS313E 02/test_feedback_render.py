@@ -0,0 +1,54 @@
+"""
+Feedback Renderer Test Suite
+"""
+
+import io
+import unittest
+
+from wordle import CORRECT_COLOR, RESET_COLOR, get_feedback
+from feedback_table import NUM_CODES, feedback_code, render_feedback
+from feedback_render import FeedbackRenderer, render_feedback_bytes
+
+
+class TestFeedbackRenderer(unittest.TestCase):
+    """Feedback Renderer Tests"""
+
+    def test_1(self):
+        """render_feedback_bytes(): every code matches color_word byte for byte"""
+        for word in ["ladle", "lllll", "basil", "zzzzz"]:
+            for code in range(NUM_CODES):
+                expected = render_feedback(code, word).encode("ascii")
+                self.assertEqual(render_feedback_bytes(code, word), expected)
+
+    def test_2(self):
+        """write_many(): lines match get_feedback for secret word llama"""
+        guesses = ["ladle", "lllll", "llama", "amall", "crane"]
+        renderer = FeedbackRenderer()
+        renderer.write_many([feedback_code("llama", guess) for guess in guesses], guesses)
+        expected = "".join(get_feedback("llama", guess) + "\n" for guess in guesses)
+        self.assertEqual(renderer.getvalue(), expected.encode("ascii"))
+
+    def test_3(self):
+        """write_secret(): matches main's formatted secret word"""
+        renderer = FeedbackRenderer()
+        renderer.write_secret("hello")
+        expected = "".join([CORRECT_COLOR + c + RESET_COLOR for c in "hello"])
+        self.assertEqual(renderer.getvalue(), expected.encode("ascii"))
+
+    def test_4(self):
+        """flush(): writes the buffer out and reuses it for the next batch"""
+        renderer = FeedbackRenderer()
+        outfile = io.BytesIO()
+        renderer.write(0, "basil", b"\n")
+        renderer.flush(outfile)
+        self.assertEqual(renderer.getvalue(), b"")
+        renderer.write(242, "basil", b"\n")
+        renderer.flush(outfile)
+        expected = (
+            get_feedback("crwth", "basil") + "\n" + get_feedback("basil", "basil") + "\n"
+        )
+        self.assertEqual(outfile.getvalue(), expected.encode("ascii"))
+
+
+if __name__ == "__main__":
+    unittest.main()
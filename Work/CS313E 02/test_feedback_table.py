@@ -0,0 +1,117 @@
+"""
+Feedback Table Test Suite
+"""
+
+import itertools
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from wordle import get_feedback
+from feedback_table import (
+    ALL_CORRECT,
+    FeedbackTable,
+    feedback_code,
+    feedback_matrix,
+    render_feedback,
+)
+
+
+def read_words(path):
+    """Reads one word per line, like prepare_game."""
+    with open(path, "r", encoding="ascii") as infile:
+        return [word.rstrip() for word in infile.readlines()]
+
+
+class TestFeedbackCode(unittest.TestCase):
+    """Feedback Code Tests"""
+
+    def test_1(self):
+        """feedback_code(): secret word llama and guessed word ladle"""
+        code = feedback_code("llama", "ladle")
+        self.assertEqual(code, 2 * 81 + 1 * 27 + 0 * 9 + 1 * 3 + 0)
+        self.assertEqual(render_feedback(code, "ladle"), get_feedback("llama", "ladle"))
+
+    def test_2(self):
+        """feedback_code(): correct guess is ALL_CORRECT"""
+        self.assertEqual(feedback_code("basil", "basil"), ALL_CORRECT)
+
+    def test_3(self):
+        """feedback_code(): extra copies of a letter are not in the word"""
+        code = feedback_code("llama", "lllll")
+        self.assertEqual(render_feedback(code, "lllll"), get_feedback("llama", "lllll"))
+        self.assertEqual(code, 2 * 81 + 2 * 27)
+
+    def test_4(self):
+        """feedback_matrix(): every pair over a 3 letter alphabet matches get_feedback"""
+        words = ["".join(letters) for letters in itertools.product("alm", repeat=5)]
+        codes = feedback_matrix(words, words)
+        for g, guess in enumerate(words):
+            for s, secret in enumerate(words):
+                expected = get_feedback(secret, guess)
+                self.assertEqual(render_feedback(int(codes[g, s]), guess), expected)
+
+    def test_5(self):
+        """feedback_matrix(): sampled pairs of the real word lists match feedback_code"""
+        guesses = read_words("valid_guesses.txt")
+        secrets = read_words("secret_words.txt")
+        rng = random.Random(313)
+        guesses = rng.sample(guesses, 300)
+        codes = feedback_matrix(guesses, secrets)
+        self.assertEqual(codes.dtype, np.uint8)
+        self.assertEqual(codes.shape, (300, len(secrets)))
+        for _ in range(3000):
+            g = rng.randrange(len(guesses))
+            s = rng.randrange(len(secrets))
+            self.assertEqual(codes[g, s], feedback_code(secrets[s], guesses[g]))
+
+
+class TestFeedbackTable(unittest.TestCase):
+    """Feedback Table Cache Tests"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.guesses = ["ladle", "lllll", "llama", "basil", "crane"]
+        self.secrets = ["llama", "basil", "lever"]
+
+    def test_1(self):
+        """FeedbackTable.load(): builds, caches and memory-maps the matrix"""
+        table = FeedbackTable.load(self.guesses, self.secrets, self.directory.name)
+        self.assertIsInstance(table.codes, np.memmap)
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+        self.assertEqual(table.feedback("llama", "ladle"), get_feedback("llama", "ladle"))
+
+        again = FeedbackTable.load(self.guesses, self.secrets, self.directory.name)
+        self.assertTrue(np.array_equal(again.codes, table.codes))
+        self.assertEqual(len(os.listdir(self.directory.name)), 1)
+
+    def test_2(self):
+        """FeedbackTable.load(): other word lists get their own cache file"""
+        FeedbackTable.load(self.guesses, self.secrets, self.directory.name)
+        table = FeedbackTable.load(self.guesses, self.secrets[:2], self.directory.name)
+        self.assertEqual(table.codes.shape, (5, 2))
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+    def test_3(self):
+        """FeedbackTable.load(): a corrupt cache file is rebuilt"""
+        table = FeedbackTable.load(self.guesses, self.secrets, self.directory.name)
+        path = os.path.join(self.directory.name, os.listdir(self.directory.name)[0])
+        del table
+        with open(path, "wb") as outfile:
+            outfile.write(b"not a matrix")
+        table = FeedbackTable.load(self.guesses, self.secrets, self.directory.name)
+        self.assertEqual(table.code("basil", "basil"), ALL_CORRECT)
+
+    def test_4(self):
+        """FeedbackTable.code(): words outside the table raise a KeyError"""
+        table = FeedbackTable.build(self.guesses, self.secrets)
+        with self.assertRaises(KeyError):
+            table.code("llama", "zzzzz")
+
+
+if __name__ == "__main__":
+    unittest.main()
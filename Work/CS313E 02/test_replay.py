@@ -0,0 +1,62 @@
+"""
+Wordle Replay Test Suite
+"""
+
+import glob
+import os
+import unittest
+
+from wordle import INVALID_INPUT
+from replay import replay_game, replay_games, transcript_game
+
+
+def expected_output(input_file):
+    """Reads the expected default output of an .in transcript."""
+    output_file = os.path.splitext(input_file)[0] + ".ansi"
+    with open(
+        os.path.join("expected_default_outputs", output_file), "r", encoding="UTF-8"
+    ) as outfile:
+        return outfile.read()
+
+
+class TestReplay(unittest.TestCase):
+    """Replay Tests"""
+
+    def test_1(self):
+        """replay_game(): every transcript matches its expected output exactly"""
+        for input_file in sorted(glob.glob("*.in")):
+            with self.subTest(input_file=input_file):
+                result = replay_game(*transcript_game(input_file))
+                self.assertEqual(result.output, expected_output(input_file))
+
+    def test_2(self):
+        """replay_games(): a process pool returns the in-process results in order"""
+        games = [transcript_game(input_file) for input_file in sorted(glob.glob("*.in"))]
+        self.assertEqual(
+            replay_games(games, workers=2, chunksize=3), replay_games(games, workers=1)
+        )
+
+    def test_3(self):
+        """replay_game(): structured result of a won game with an invalid guess"""
+        result = replay_game(["lllll"], ["@llow", "llama", "lllll"])
+        self.assertEqual(result.secret_word, "lllll")
+        self.assertEqual([guess for guess, _ in result.turns], ["llama", "lllll"])
+        self.assertEqual(result.invalid_guesses, 1)
+        self.assertEqual((result.won, result.finished), (True, True))
+
+    def test_4(self):
+        """replay_game(): seeded secret words match prepare_game"""
+        self.assertEqual(replay_game(["1234"], []).secret_word, "smell")
+        self.assertEqual(replay_game(["554"], []).secret_word, "trick")
+
+    def test_5(self):
+        """replay_game(): invalid arguments and running out of guesses"""
+        result = replay_game(["hello", "birdy"], ["hello"])
+        self.assertEqual(result.output, INVALID_INPUT + "\n")
+        self.assertEqual(result.secret_word, None)
+        result = replay_game(["hello"], ["lists"])
+        self.assertEqual((result.won, result.finished, len(result.turns)), (False, False, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
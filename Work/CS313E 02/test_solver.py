@@ -0,0 +1,103 @@
+"""
+Wordle Solver Test Suite
+"""
+
+import math
+import tempfile
+import unittest
+from collections import Counter
+
+import numpy as np
+
+from wordle import get_feedback
+from feedback_table import FeedbackTable
+from solver import WordleSolver, load_solver, partition_sizes, score_partitions
+
+
+class TestScoring(unittest.TestCase):
+    """Partition Scoring Tests"""
+
+    def test_1(self):
+        """partition_sizes(): counts secrets per feedback code"""
+        codes = np.array([[0, 0, 5, 242], [7, 7, 7, 7]], dtype=np.uint8)
+        sizes = partition_sizes(codes)
+        self.assertEqual(sizes.shape, (2, 243))
+        self.assertEqual((sizes[0, 0], sizes[0, 5], sizes[0, 242]), (2, 1, 1))
+        self.assertEqual(sizes[1, 7], 4)
+
+    def test_2(self):
+        """score_partitions(): entropy and expected size of a partition"""
+        codes = np.array([[0, 0, 5, 242], [7, 7, 7, 7]], dtype=np.uint8)
+        sizes = partition_sizes(codes)
+        entropy = score_partitions(sizes, "entropy")
+        self.assertAlmostEqual(entropy[0], 1.5)
+        self.assertAlmostEqual(entropy[1], 0.0)
+        expected_size = score_partitions(sizes, "expected_size")
+        self.assertAlmostEqual(expected_size[0], -(4 + 1 + 1) / 4)
+        self.assertAlmostEqual(expected_size[1], -4.0)
+
+    def test_3(self):
+        """rank_guesses(): entropy matches a direct count with get_feedback"""
+        guesses = ["llama", "ladle", "basil", "crane", "lever"]
+        secrets = ["llama", "basil", "lever", "light", "table"]
+        solver = WordleSolver(FeedbackTable.build(guesses, secrets))
+        scores = solver.rank_guesses(solver.all_candidates())
+        for g, guess in enumerate(guesses):
+            counts = Counter(get_feedback(secret, guess) for secret in secrets)
+            expected = -sum(c / 5 * math.log2(c / 5) for c in counts.values())
+            self.assertAlmostEqual(scores[g], expected, places=4)
+
+    def test_4(self):
+        """WordleSolver(): unknown metrics raise a ValueError"""
+        with self.assertRaises(ValueError):
+            WordleSolver(FeedbackTable.build(["llama"], ["llama"]), "fastest")
+
+
+class TestSolver(unittest.TestCase):
+    """Solver Game Tests"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.solver = load_solver(cache_dir=cls.directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.solver
+        cls.directory.cleanup()
+
+    def test_1(self):
+        """load_solver(): the first guess is raise and its ranking is cached"""
+        self.assertEqual(self.solver.best_guess(self.solver.all_candidates()), "raise")
+        again = load_solver(cache_dir=self.directory.name)
+        self.assertTrue(
+            np.array_equal(again.first_guess_ranking(), self.solver.first_guess_ranking())
+        )
+
+    def test_2(self):
+        """solve(): finds sampled secret words within 6 guesses"""
+        for secret in self.solver.table.secrets[::97]:
+            guesses = self.solver.solve(secret)
+            self.assertEqual(guesses[-1], secret)
+            self.assertLessEqual(len(guesses), 6)
+
+    def test_3(self):
+        """filter_candidates(): keeps exactly the secrets with the same feedback"""
+        candidates = self.solver.all_candidates()
+        feedback = get_feedback("llama", "ladle")
+        code = self.solver.table.code("llama", "ladle")
+        kept = self.solver.filter_candidates(candidates, "ladle", code)
+        expected = [
+            i for i, secret in enumerate(self.solver.table.secrets)
+            if get_feedback(secret, "ladle") == feedback
+        ]
+        self.assertEqual(kept.tolist(), expected)
+
+    def test_4(self):
+        """solve(): a word outside the secret list raises a ValueError"""
+        with self.assertRaises(ValueError):
+            self.solver.solve("zzzzz")
+
+
+if __name__ == "__main__":
+    unittest.main()
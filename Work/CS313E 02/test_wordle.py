@@ -13,6 +13,7 @@ from wordle import (
     get_feedback,
     is_valid_guess,
     main,
+    WordList,
     CORRECT_COLOR,
     WRONG_SPOT_COLOR,
     NOT_IN_WORD_COLOR,
@@ -336,6 +337,44 @@ class TestIsValidGuess(unittest.TestCase):
         self.assertEqual(actual, expected)
 
 
+class TestWordList(unittest.TestCase):
+    """Word List Tests"""
+
+    def test_1(self):
+        """WordList: prepare_game returns a WordList equal to the file's list"""
+        sys.argv = ["wordle.py", "table"]
+        _, valid_guesses = prepare_game()
+        with open("valid_guesses.txt", "r", encoding="ascii") as infile:
+            expected = [word.rstrip() for word in infile.readlines()]
+        self.assertIsInstance(valid_guesses, WordList)
+        self.assertEqual(valid_guesses, expected)
+
+    def test_2(self):
+        """WordList: the custom secret word appended by prepare_game is valid"""
+        sys.argv = ["wordle.py", "lllll"]
+        _, valid_guesses = prepare_game()
+        self.assertEqual(valid_guesses[-1], "lllll")
+        self.assertEqual(is_valid_guess("lllll", valid_guesses), True)
+
+    def test_3(self):
+        """WordList: membership follows every kind of change to the list"""
+        words = WordList(["metal", "stars"])
+        self.assertEqual("metal" in words, True)
+        words.append("gaily")
+        words.extend(["prays"])
+        words.insert(0, "adept")
+        self.assertEqual([word in words for word in ["gaily", "prays", "adept"]], [True] * 3)
+        words.remove("metal")
+        words[0] = "brain"
+        del words[-1]
+        self.assertEqual(words, ["brain", "stars", "gaily"])
+        self.assertEqual([word in words for word in ["metal", "adept", "prays"]], [False] * 3)
+        words += ["train"]
+        self.assertEqual("train" in words, True)
+        words.clear()
+        self.assertEqual("brain" in words, False)
+
+
 class TestWordle(unittest.TestCase):
     """Functional Test Cases"""
 
@@ -0,0 +1,138 @@
+"""
+Wordle Statistics Test Suite
+"""
+
+import glob
+import os
+import random
+import shutil
+import tempfile
+import unittest
+
+from wordle import CORRECT_COLOR, RESET_COLOR, WRONG_SPOT_COLOR
+from replay import replay_game, transcript_game
+from wordle_stats import GameStats, aggregate_logs, aggregate_range, format_game
+
+
+def write_log(path, games):
+    """Writes (arguments, guesses) or (arguments, guesses, secret) games as one log."""
+    with open(path, "w", encoding="UTF-8") as outfile:
+        for game in games:
+            outfile.write(format_game(*game))
+
+
+class TestWordleStats(unittest.TestCase):
+    """Game Statistics Tests"""
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.games = [transcript_game(path) for path in sorted(glob.glob("*.in"))]
+        self.path = os.path.join(directory, "games.log")
+        write_log(self.path, self.games * 3)
+
+    def test_1(self):
+        """aggregate_logs(): outcomes match replaying every game"""
+        stats = aggregate_logs([self.path])
+        results = [replay_game(*game) for game in self.games * 3]
+        self.assertEqual(stats.games, len(results))
+        self.assertEqual(stats.wins, sum(result.won for result in results))
+        self.assertEqual(stats.invalid_games, sum(result.secret_word is None for result in results))
+        self.assertEqual(stats.invalid_guesses, sum(result.invalid_guesses for result in results))
+        expected = [0] * 7
+        for result in results:
+            if result.won:
+                expected[len(result.turns)] += 1
+        self.assertEqual(stats.win_distribution, expected)
+
+    def test_2(self):
+        """aggregate_logs(): per-letter feedback matches get_feedback"""
+        stats = aggregate_logs([self.path])
+        expected = GameStats().letter_feedback
+        guess_count = 0
+        for result in (replay_game(*game) for game in self.games * 3):
+            for guess, feedback in result.turns:
+                guess_count += 1
+                fragments = feedback.split(RESET_COLOR)[:5]
+                for letter, fragment in zip(guess, fragments):
+                    if fragment.startswith(CORRECT_COLOR):
+                        expected[letter][2] += 1
+                    elif fragment.startswith(WRONG_SPOT_COLOR):
+                        expected[letter][1] += 1
+                    else:
+                        expected[letter][0] += 1
+        self.assertEqual(stats.letter_feedback, expected)
+        self.assertEqual(sum(stats.code_counts), guess_count)
+
+    def test_3(self):
+        """aggregate_logs(): any split of the log merges to the same stats"""
+        expected = aggregate_logs([self.path])
+        for chunk_bytes in (1, 13, 100, 1000):
+            with self.subTest(chunk_bytes=chunk_bytes):
+                self.assertEqual(aggregate_logs([self.path], 1, chunk_bytes), expected)
+        self.assertEqual(aggregate_logs([self.path], 2, 257), expected)
+
+    def test_4(self):
+        """aggregate_range(): a game belongs to the range it begins in"""
+        size = os.path.getsize(self.path)
+        first = aggregate_range(self.path, 0, size // 2)
+        second = aggregate_range(self.path, size // 2, size)
+        self.assertEqual(first.games + second.games, len(self.games) * 3)
+        self.assertEqual(GameStats().merge(first).merge(second), aggregate_logs([self.path]))
+
+    def test_5(self):
+        """GameStats.add_game(): unfinished games and win rate"""
+        stats = GameStats()
+        stats.add_game(["hello"], ["lists"])
+        stats.add_game(["hello"], ["hello"])
+        self.assertEqual((stats.games, stats.wins, stats.unfinished_games), (2, 1, 1))
+        self.assertEqual(stats.win_distribution[1], 1)
+        self.assertEqual(stats.win_rate(), 1.0)
+
+    def test_6(self):
+        """aggregate_logs(): blank and "#" guesses are typed guesses, as in replay_game"""
+        games = [
+            (["hello"], ["lists", "", "hello"]),
+            (["hello"], ["#game", "##", "hello"]),
+        ]
+        write_log(self.path, games)
+        self.assertEqual(format_game(*games[1]), "#game hello\n##game\n###\nhello\n")
+        stats = aggregate_logs([self.path])
+        results = [replay_game(*game) for game in games]
+        self.assertEqual([result.won for result in results], [True, True])
+        self.assertEqual((stats.games, stats.wins, stats.unfinished_games), (2, 2, 0))
+        invalid_guesses = sum(result.invalid_guesses for result in results)
+        self.assertEqual(stats.invalid_guesses, invalid_guesses)
+        self.assertEqual(stats.win_distribution[1:3], [1, 1])
+
+    def test_7(self):
+        """aggregate_logs(): a game without arguments is scored with its logged secret"""
+        guesses = ["crane", "lists", "brown", "allot", "jello", "basil"]
+        rng = random.Random(313)
+        games = []
+        for _ in range(4):
+            games.append((["hello"], guesses[:3]))
+            games.append(([], rng.sample(guesses, 6), rng.choice(["jello", "basil", "allot"])))
+        games.append(([], guesses))
+        write_log(self.path, games)
+
+        stats = aggregate_logs([self.path])
+        self.assertEqual(stats.games, 9)
+        self.assertEqual((stats.unscored_games, stats.invalid_games), (1, 0))
+        self.assertEqual(stats.wins, 4)
+        self.assertEqual(stats.unfinished_games, 4)
+        expected = GameStats()
+        for game in games[:-1]:
+            expected.add_game(game[0], game[1], *game[2:])
+        self.assertEqual(stats.code_counts, expected.code_counts)
+        self.assertEqual(stats.letter_feedback, expected.letter_feedback)
+
+        # a pool worker has its own random state, so only a logged secret
+        # gives the same stats on any split
+        for chunk_bytes in (7, 64, 1 << 20):
+            with self.subTest(chunk_bytes=chunk_bytes):
+                self.assertEqual(aggregate_logs([self.path], 2, chunk_bytes), stats)
+
+
+if __name__ == "__main__":
+    unittest.main()
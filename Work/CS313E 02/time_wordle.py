@@ -0,0 +1,117 @@
+"""Wordle Lookup and Startup Benchmark
+
+Measures the per-lookup latency of is_valid_guess with the word list that
+prepare_game used to return (a plain list, scanned on every lookup) and the
+WordList it returns now (a list backed by a frozenset), and the time to load
+both word lists from the text files and from word_pack.py packs, and the
+time to render feedback lines with color_word and with FeedbackRenderer.
+The packs are compiled into a temporary directory, so running the benchmark
+leaves the assignment folder (and what prepare_game loads) unchanged.
+
+usage: python3 time_wordle.py [--lookups 20000] [--loads 200]
+       [--renders 200000] [--seed 313]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from wordle import is_valid_guess, prepare_game, read_word_lists
+from feedback_table import feedback_code, render_feedback
+from feedback_render import FeedbackRenderer
+from word_pack import compile_word_list, load_word_list, read_text_word_list
+
+WORD_LISTS = ("valid_guesses.txt", "secret_words.txt")
+
+
+def time_lookups(guesses, valid_guesses):
+    """Returns the mean seconds per is_valid_guess call over guesses."""
+    start_time = time.perf_counter()
+    for guess in guesses:
+        is_valid_guess(guess, valid_guesses)
+    return (time.perf_counter() - start_time) / len(guesses)
+
+
+def time_loads(load, loads):
+    """Returns the mean seconds to load every file of WORD_LISTS with load."""
+    start_time = time.perf_counter()
+    for _ in range(loads):
+        for path in WORD_LISTS:
+            load(path)
+    return (time.perf_counter() - start_time) / loads
+
+
+def time_renders(codes, words):
+    """
+    Returns (seconds with color_word, seconds with FeedbackRenderer) to
+    render one feedback line per (code, word) pair.
+    """
+
+    start_time = time.perf_counter()
+    expected = "".join(render_feedback(code, word) + "\n" for code, word in zip(codes, words))
+    expected = expected.encode("ascii")
+    color_word_time = time.perf_counter() - start_time
+
+    renderer = FeedbackRenderer()
+    start_time = time.perf_counter()
+    renderer.write_many(codes, words)
+    renderer_time = time.perf_counter() - start_time
+    assert renderer.getvalue() == expected, "rendered bytes differ"
+    return color_word_time, renderer_time
+
+
+def main():
+    """Runs the benchmark and prints one row per word list type."""
+    parser = argparse.ArgumentParser(description="is_valid_guess lookup benchmark")
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--loads", type=int, default=200)
+    parser.add_argument("--renders", type=int, default=200000)
+    parser.add_argument("--seed", type=int, default=313)
+    args = parser.parse_args()
+
+    sys.argv = ["wordle.py", "hello"]
+    _, valid_guesses = prepare_game()
+
+    # half the lookups are words from the list, half are random strings
+    rng = random.Random(args.seed)
+    guesses = [
+        rng.choice(valid_guesses) if rng.random() < 0.5
+        else "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=5))
+        for _ in range(args.lookups)
+    ]
+
+    print(f"{'word list':>10} {'ns/lookup':>12}")
+    for name, words in (("list", list(valid_guesses)), ("WordList", valid_guesses)):
+        seconds = time_lookups(guesses, words)
+        print(f"{name:>10} {seconds * 1e9:>12.1f}")
+
+    print()
+    print(f"{'word lists':>10} {'ms/load':>12}")
+    with tempfile.TemporaryDirectory() as pack_dir:
+        pack_paths = {
+            path: os.path.join(pack_dir, os.path.basename(path) + ".pack")
+            for path in WORD_LISTS
+        }
+        for path, pack_path in pack_paths.items():
+            compile_word_list(path, pack_path)
+        for name, load in (
+            ("text", read_text_word_list),
+            ("pack", lambda path: load_word_list(path, pack_paths[path])),
+        ):
+            print(f"{name:>10} {time_loads(load, args.loads) * 1e3:>12.3f}")
+
+    valid_words, secret_words = read_word_lists()
+    words = [rng.choice(valid_words) for _ in range(args.renders)]
+    codes = [feedback_code(rng.choice(secret_words), word) for word in words]
+    color_word_time, renderer_time = time_renders(codes, words)
+    print()
+    print(f"{'renderer':>10} {'ns/line':>12}")
+    print(f"{'color_word':>10} {color_word_time / args.renders * 1e9:>12.1f}")
+    print(f"{'table':>10} {renderer_time / args.renders * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
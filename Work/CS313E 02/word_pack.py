@@ -0,0 +1,127 @@
+"""
+Packed Word Lists
+
+Compiles a word list text file (one word per line) into a pack file that
+prepare_game loads with a single mmap, checksumming and decoding the mapped
+pages in place instead of stripping every line. The pack records the size
+and modification time of the text file it was compiled from and a CRC-32 of
+its words; a pack that is missing, stale or corrupt is ignored and the text
+file is read instead, so the packs are only ever a cache.
+
+usage: python3 word_pack.py valid_guesses.txt [secret_words.txt ...]
+
+Pack layout (little-endian): the 8-byte magic b"WORDPAK1", the text file
+size (uint64) and modification time in ns (int64), the word count and the
+CRC-32 of the payload (uint32 each), then the payload: the 5-letter words
+in file order, ASCII, separated by newlines.
+"""
+
+# A copy of this module lives in "CS313E 06/word_pack.py", so each assignment
+# folder runs on its own. The two differ only in the usage line; apply every
+# fix to both.
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+MAGIC = b"WORDPAK1"
+HEADER = struct.Struct("<8sQqII")
+PACK_SUFFIX = ".pack"
+WORD_LENGTH = 5
+
+
+def default_pack_path(text_path):
+    """post: returns the pack path of a text file, e.g. valid_guesses.pack."""
+    return os.path.splitext(text_path)[0] + PACK_SUFFIX
+
+
+def read_text_word_list(text_path):
+    """
+    pre: text_path is a text file with one word per line.
+    post: returns the words with trailing whitespace removed, in file order.
+    """
+
+    # Specify "ascii" as its representation (encoding) since its required by pylint.
+    with open(text_path, "r", encoding="ascii") as infile:
+        return [word.rstrip() for word in infile.readlines()]
+
+
+def compile_word_list(text_path, pack_path=None):
+    """
+    Packs a word list text file.
+
+    pre: text_path is a text file with one 5 letter lowercase word per line.
+    post: writes the pack (to default_pack_path(text_path) unless pack_path
+          is given) and returns the number of words. Raises a ValueError if
+          a line is not a 5 letter lowercase word; no pack is written then.
+    """
+
+    pack_path = pack_path or default_pack_path(text_path)
+    source = os.stat(text_path)
+    words = read_text_word_list(text_path)
+    for word in words:
+        if len(word) != WORD_LENGTH or not (word.isalpha() and word.islower()):
+            raise ValueError(f"{text_path}: {word!r} is not a 5 letter lowercase word")
+
+    payload = "\n".join(words).encode("ascii")
+    header = HEADER.pack(
+        MAGIC, source.st_size, source.st_mtime_ns, len(words), zlib.crc32(payload)
+    )
+    # write under a temporary name, so a starting game never reads half a pack
+    temporary_path = f"{pack_path}.{os.getpid()}.tmp"
+    with open(temporary_path, "wb") as outfile:
+        outfile.write(header)
+        outfile.write(payload)
+    os.replace(temporary_path, pack_path)
+    return len(words)
+
+
+def read_pack(text_path, pack_path=None):
+    """
+    pre: text_path is the text file the pack was compiled from.
+    post: returns the packed words as a list, or None if the pack is
+          missing, does not match the current text file or fails its
+          checksum.
+    """
+
+    pack_path = pack_path or default_pack_path(text_path)
+    try:
+        source = os.stat(text_path)
+        with open(pack_path, "rb") as infile, mmap.mmap(
+            infile.fileno(), 0, access=mmap.ACCESS_READ
+        ) as packed:
+            magic, size, mtime_ns, count, checksum = HEADER.unpack_from(packed, 0)
+            if magic != MAGIC or (size, mtime_ns) != (source.st_size, source.st_mtime_ns):
+                return None
+            # checksum and decode straight from the mapped pages; the view
+            # must be released before the map is closed
+            with memoryview(packed)[HEADER.size:] as payload:
+                if zlib.crc32(payload) != checksum:
+                    return None
+                words = str(payload, "ascii").split("\n") if count else []
+    except (OSError, ValueError, struct.error):
+        return None
+
+    return words if len(words) == count else None
+
+
+def load_word_list(text_path, pack_path=None):
+    """
+    pre: text_path is a text file with one word per line.
+    post: returns the same list as read_text_word_list(text_path), read from
+          the pack when it is valid and from the text file otherwise.
+    """
+
+    words = read_pack(text_path, pack_path)
+    if words is None:
+        words = read_text_word_list(text_path)
+    return words
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python3 word_pack.py word_list.txt [word_list.txt ...]")
+    for path in sys.argv[1:]:
+        print(f"{path}: packed {compile_word_list(path)} words into {default_pack_path(path)}")
@@ -18,6 +18,8 @@ UT EID 1: wah938
 import random
 import sys
 
+from word_pack import load_word_list
+
 # ANSI escape codes for text color
 # These must be used by wrapping it around a single character string
 # for the test cases to work. Please use the color_word function to format
@@ -38,6 +40,71 @@ NUM_LETTERS = 5
 INVALID_INPUT = "Bad input detected. Please try again."
 
 
+class WordList(list):
+    """
+    A list of words with constant time membership tests.
+
+    Behaves exactly like the list it is built from, but `word in words` is
+    answered by a frozenset of the words instead of a scan of the list. The
+    frozenset is built on the first membership test after the list is
+    created or changed, so appending the secret word in prepare_game costs
+    nothing extra.
+    """
+
+    def __init__(self, words=()):
+        super().__init__(words)
+        self._lookup = None
+
+    def __contains__(self, word):
+        if self._lookup is None:
+            self._lookup = frozenset(self)
+        return word in self._lookup
+
+    def _invalidate(self):
+        """Drops the lookup set; called by every method that changes the list."""
+        self._lookup = None
+
+    def append(self, word):
+        self._invalidate()
+        return super().append(word)
+
+    def extend(self, words):
+        self._invalidate()
+        return super().extend(words)
+
+    def insert(self, index, word):
+        self._invalidate()
+        return super().insert(index, word)
+
+    def remove(self, word):
+        self._invalidate()
+        return super().remove(word)
+
+    def pop(self, index=-1):
+        self._invalidate()
+        return super().pop(index)
+
+    def clear(self):
+        self._invalidate()
+        return super().clear()
+
+    def __setitem__(self, index, value):
+        self._invalidate()
+        return super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        self._invalidate()
+        return super().__delitem__(index)
+
+    def __iadd__(self, words):
+        self._invalidate()
+        return super().__iadd__(words)
+
+    def __imul__(self, count):
+        self._invalidate()
+        return super().__imul__(count)
+
+
 # DO NOT change this function
 def print_explanation():
     """Prints the 'how to play' instructions on the official website"""
@@ -91,6 +158,57 @@ def color_word(colors, word):
 
     return "".join(colored_word)
 
+def read_word_lists():
+    """
+    Reads the valid guesses and the secret words.
+
+    pre: The file valid_guesses.txt exists and contains valid guessable words, one per line.
+         The file secret_words.txt exists and contains secret words, one per line.
+    post: Returns a tuple (valid_words, secret_words), a WordList and a list
+          of strings in file order. Each list is read from its pack file
+          (valid_guesses.pack, secret_words.pack) when that is up to date,
+          and from the text file otherwise.
+    """
+
+    # packs compiled with word_pack.py are used when they are up to date
+    valid_words = WordList(load_word_list("valid_guesses.txt"))
+    secret_words = load_word_list("secret_words.txt")
+
+    return valid_words, secret_words
+
+
+def choose_secret_word(arguments, secret_words):
+    """
+    Chooses the secret word from the command line arguments, without the
+    program name.
+
+    If an integer is passed in, it must be converted and used as the seed for random.
+    If a valid 5 letter lowercase word is passed in, it will be used as the secret word.
+    All other inputs are invalid, including passing in multiple arguments in the command line.
+
+    pre: arguments is a list of strings, secret_words a list of secret words.
+    post: Returns a tuple (secret_word, is_custom) where is_custom is True if
+          the secret word was passed in, or raises a ValueError on invalid
+          user input.
+    """
+
+    if len(arguments) > 1:
+        raise ValueError(INVALID_INPUT)
+
+    if len(arguments) == 1:
+        arg_string = arguments[0]
+
+        if arg_string.isdigit():
+            random.seed(int(arg_string))
+            return random.choice(secret_words), False
+        if arg_string.islower() and arg_string.isalpha() and len(arg_string) == 5:
+            return arg_string, True
+        raise ValueError(INVALID_INPUT)
+
+    # no command line argument
+    return random.choice(secret_words), False
+
+
 def prepare_game():
     """
     Prepares the game by reading in the valid words and secret words and
@@ -105,37 +223,15 @@ def prepare_game():
     post: Returns a tuple (secret_word, valid_words) or raises a ValueError on invalid user
           secret_word: A string that is either a randomly chosen word from secret_words.txt
           or a valid 5-letter word.
-          valid_words: A list of valid guess words from valid_guesses.txt.
+          valid_words: A WordList (a list with constant time `in`) of valid
+          guess words from valid_guesses.txt.
     """
 
-    # Specify "ascii" as its representation (encoding) since its required by pylint.
-    with open("valid_guesses.txt", "r", encoding="ascii") as valid_nonsecret_words:
-        valid_words = [word.rstrip() for word in valid_nonsecret_words.readlines()]
-
-    with open("secret_words.txt", "r", encoding="ascii") as valid_secret_words:
-        secret_words = [word.rstrip() for word in valid_secret_words.readlines()]
+    valid_words, secret_words = read_word_lists()
+    secret_word, is_custom = choose_secret_word(sys.argv[1:], secret_words)
 
-    # Modify this if statement! This is just starter code.
-    if len(sys.argv) > 2:
-        raise ValueError(INVALID_INPUT)
-
-    if len(sys.argv) == 2:
-        arg_string = sys.argv[1]
-
-        if arg_string.isdigit():
-            random.seed(int(arg_string))
-            secret_word = random.choice(secret_words)
-        elif arg_string.islower() and arg_string.isalpha() and len(arg_string) == 5:
-            secret_word = arg_string
-            if secret_word not in valid_words: # for edge cases like mello.in and lllll.in
-                valid_words.append(secret_word)
-        else:
-            raise ValueError(INVALID_INPUT)
-
-    elif len(sys.argv) == 1: # no command line argument
-        secret_word = random.choice(secret_words)
-    else:
-        raise ValueError(INVALID_INPUT)
+    if is_custom and secret_word not in valid_words: # for edge cases like mello.in and lllll.in
+        valid_words.append(secret_word)
 
     # You do not have to change this return statement
     return secret_word, valid_words
@@ -146,7 +242,8 @@ def is_valid_guess(guess, valid_guesses):
 
     pre: guess must be a string.
          valid_guesses must be a list of strings, each string
-          being a valid 5 letter lowercase guess.
+          being a valid 5 letter lowercase guess. A WordList from
+          prepare_game answers in constant time instead of scanning.
     post: returns a boolean value
     """
 
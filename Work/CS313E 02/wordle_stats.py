@@ -0,0 +1,285 @@
+"""
+Wordle Game Statistics
+
+Aggregates guess distributions, win rates and per-letter feedback counts
+over logs of many wordle.py games. Every game in a log starts with a header
+line "#game" followed by the command line arguments of the game, if any
+(a secret word or a seed, as in the names of the .in files), and then a
+line "#secret" followed by the secret word the game was played with. Every
+following line up to the next header is one typed guess, exactly like the
+lines of an .in file, so blank guesses are kept. A guess that starts with
+"#" is written with one more "#" in front, so no guess can be mistaken for
+a header; format_game writes games this way.
+
+A game without arguments draws its secret from the global random state of
+the process that played it, so it can only be scored from its "#secret"
+line; one logged without that line is counted as unscored.
+
+Games are scored with feedback_table.feedback_code instead of colored
+strings, and only running counters are kept, so memory does not grow with
+the size of the log. Logs can be split into byte ranges that are
+aggregated in a process pool; the per-range GameStats merge exactly.
+
+usage: python3 wordle_stats.py game.log [more.log ...] [--workers 4]
+"""
+
+import argparse
+import functools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from string import ascii_lowercase
+
+from wordle import choose_secret_word, is_valid_guess, read_word_lists
+from feedback_table import ALL_CORRECT, NUM_CODES, feedback_code
+
+MAX_ATTEMPTS = 6
+
+HEADER = "#game"
+SECRET = "#secret"
+
+# Bytes of log per pool task
+CHUNK_BYTES = 1 << 24
+
+
+class GameStats:
+    """
+    Running counters over scored games. All counters are ints, so merging
+    the stats of disjoint sets of games gives exactly the stats of their
+    union.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.wins = 0
+        # games whose argument prepare_game rejects, or whose log ends early
+        self.invalid_games = 0
+        self.unfinished_games = 0
+        # games without arguments or a logged secret word
+        self.unscored_games = 0
+        self.invalid_guesses = 0
+        # win_distribution[n]: wins on the n-th valid guess (index 0 unused)
+        self.win_distribution = [0] * (MAX_ATTEMPTS + 1)
+        # code_counts[c]: valid guesses that received feedback code c
+        self.code_counts = [0] * NUM_CODES
+        # letter_feedback[letter]: [not in word, wrong spot, correct] counts
+        self.letter_feedback = {letter: [0, 0, 0] for letter in ascii_lowercase}
+
+    def add_game(self, arguments, guesses, secret_word=None):
+        """
+        Scores one game the way wordle.main plays it and counts it.
+
+        pre: arguments is the list of command line arguments of the game,
+             guesses an iterable of typed guesses, secret_word None or the
+             secret word the game was played with.
+        post: every counter is updated for the game. A game without
+              arguments is only scored with its secret_word, since its
+              secret was drawn from the random state of another process.
+        """
+
+        valid_guesses, secret_words = _word_lists()
+        self.games += 1
+        if not arguments:
+            if secret_word is None:
+                self.unscored_games += 1
+                return
+            is_custom = False
+        else:
+            try:
+                chosen_word, is_custom = choose_secret_word(arguments, secret_words)
+            except ValueError:
+                self.invalid_games += 1
+                return
+            secret_word = secret_word or chosen_word
+
+        # prepare_game adds a custom secret word to the valid guesses
+        extra_guess = secret_word if is_custom and secret_word not in valid_guesses else None
+        attempts = 0
+        for guess in guesses:
+            if not (is_valid_guess(guess, valid_guesses) or guess == extra_guess):
+                self.invalid_guesses += 1
+                continue
+
+            attempts += 1
+            code = feedback_code(secret_word, guess)
+            self.code_counts[code] += 1
+            digits = code
+            for letter in reversed(guess):
+                digits, digit = divmod(digits, 3)
+                self.letter_feedback.setdefault(letter, [0, 0, 0])[digit] += 1
+
+            if code == ALL_CORRECT:
+                self.wins += 1
+                self.win_distribution[attempts] += 1
+                return
+            if attempts == MAX_ATTEMPTS:
+                return
+
+        self.unfinished_games += 1
+
+    def merge(self, other):
+        """
+        pre: other is a GameStats over games disjoint from this one's.
+        post: adds every counter of other to this one and returns self.
+        """
+
+        self.games += other.games
+        self.wins += other.wins
+        self.invalid_games += other.invalid_games
+        self.unfinished_games += other.unfinished_games
+        self.unscored_games += other.unscored_games
+        self.invalid_guesses += other.invalid_guesses
+        for attempts, count in enumerate(other.win_distribution):
+            self.win_distribution[attempts] += count
+        for code, count in enumerate(other.code_counts):
+            self.code_counts[code] += count
+        for letter, counts in other.letter_feedback.items():
+            totals = self.letter_feedback.setdefault(letter, [0, 0, 0])
+            for digit in range(3):
+                totals[digit] += counts[digit]
+        return self
+
+    def win_rate(self):
+        """post: returns wins over played (valid, scored and finished) games, or 0.0."""
+        played = self.games - self.invalid_games - self.unfinished_games - self.unscored_games
+        return self.wins / played if played else 0.0
+
+    def to_dict(self):
+        """post: returns every counter as a JSON serializable dict."""
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "invalid_games": self.invalid_games,
+            "unfinished_games": self.unfinished_games,
+            "unscored_games": self.unscored_games,
+            "invalid_guesses": self.invalid_guesses,
+            "win_rate": self.win_rate(),
+            "win_distribution": self.win_distribution[1:],
+            "code_counts": self.code_counts,
+            "letter_feedback": self.letter_feedback,
+        }
+
+    def __eq__(self, other):
+        return isinstance(other, GameStats) and self.to_dict() == other.to_dict()
+
+
+@functools.lru_cache(maxsize=None)
+def _word_lists():
+    """Reads the word lists once per process."""
+    return read_word_lists()
+
+
+def format_game(arguments, guesses, secret_word=None):
+    """
+    pre: arguments is a list of command line arguments without spaces,
+         guesses a list of typed guesses without newlines, secret_word None
+         or the secret word the game was played with.
+    post: returns the log text of the game: its header line, its secret
+          line if secret_word is given, then one line per guess, with
+          guesses that start with "#" escaped.
+    """
+
+    lines = [" ".join([HEADER, *arguments])]
+    if secret_word is not None:
+        lines.append(f"{SECRET} {secret_word}")
+    lines.extend("#" + guess if guess.startswith("#") else guess for guess in guesses)
+    return "\n".join(lines) + "\n"
+
+
+def _is_header(text):
+    """Checks whether a log line (without its newline) starts a game."""
+    return text.startswith(HEADER) and text[len(HEADER):len(HEADER) + 1] in ("", " ")
+
+
+def aggregate_range(path, start, end):
+    """
+    Aggregates the games of a log whose header begins at a byte offset in
+    [start, end).
+
+    pre: path is a game log, 0 <= start <= end.
+    post: returns the GameStats of those games. A game that begins before
+          start belongs to an earlier range and is skipped; a game that
+          begins before end is read to its last line.
+    """
+
+    stats = GameStats()
+    with open(path, "rb") as infile:
+        if start > 0:
+            # a line that straddles start belongs to the previous range
+            infile.seek(start - 1)
+            if infile.read(1) != b"\n":
+                infile.readline()
+        position = infile.tell()
+
+        # arguments is None until the first header of the range is read
+        arguments = None
+        secret_word = None
+        guesses = []
+        for line in infile:
+            text = line.decode("utf-8").rstrip("\r\n")
+            if _is_header(text):
+                if arguments is not None:
+                    stats.add_game(arguments, guesses, secret_word)
+                    arguments = None
+                if position >= end:
+                    break
+                arguments = text[len(HEADER):].split()
+                secret_word = None
+                guesses = []
+            elif arguments is not None and not guesses and text.startswith(SECRET + " "):
+                secret_word = text[len(SECRET) + 1:]
+            elif arguments is not None:
+                # undo the escaping of guesses that start with "#"
+                guesses.append(text[1:] if text.startswith("#") else text)
+            position += len(line)
+
+        if arguments is not None:
+            stats.add_game(arguments, guesses, secret_word)
+    return stats
+
+
+def aggregate_logs(paths, workers=1, chunk_bytes=CHUNK_BYTES):
+    """
+    Aggregates the games of many logs.
+
+    pre: paths is a list of game logs, workers >= 1, chunk_bytes >= 1.
+    post: returns the GameStats of every game. With workers > 1 the logs are
+          split into byte ranges of chunk_bytes that are aggregated in a
+          process pool and merged; the result is the same for any workers
+          and chunk_bytes.
+    """
+
+    ranges = []
+    for path in paths:
+        size = os.path.getsize(path)
+        ranges.extend(
+            (path, start, min(start + chunk_bytes, size))
+            for start in range(0, size, chunk_bytes)
+        )
+
+    total = GameStats()
+    if workers == 1:
+        for path, start, end in ranges:
+            total.merge(aggregate_range(path, start, end))
+        return total
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for stats in executor.map(aggregate_range, *zip(*ranges)):
+            total.merge(stats)
+    return total
+
+
+def main():
+    """Aggregates the logs given on the command line and prints JSON."""
+    parser = argparse.ArgumentParser(description="Wordle game log statistics")
+    parser.add_argument("logs", nargs="+")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-bytes", type=int, default=CHUNK_BYTES)
+    args = parser.parse_args()
+
+    stats = aggregate_logs(args.logs, args.workers, args.chunk_bytes)
+    print(json.dumps(stats.to_dict(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
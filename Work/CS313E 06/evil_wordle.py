@@ -18,6 +18,8 @@ UT EID 1: wah938
 import random
 import sys
 
+from word_pack import load_word_list
+
 # ANSI escape codes for text color
 # These must be used by wrapping it around a single character string
 # for the test cases to work. Please use the color_word function to format
@@ -308,10 +310,8 @@ def prepare_game():
     else:
         raise ValueError()
 
-    # Specify "ascii" as its representation (encoding) since it's required by
-    # pylint.
-    with open(valid_words_file_name, "r", encoding="ascii") as valid_words:
-        valid_words = [word.rstrip() for word in valid_words.readlines()]
+    # read from the word_pack.py pack of the file when it is up to date
+    valid_words = load_word_list(valid_words_file_name)
 
     return attempts, valid_words
 
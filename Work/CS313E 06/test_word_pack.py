@@ -0,0 +1,74 @@
+"""
+Packed Word List Test Suite
+"""
+
+# Identical to "CS313E 02/test_word_pack.py"; apply every fix to both.
+
+import os
+import tempfile
+import unittest
+
+from word_pack import (
+    compile_word_list,
+    default_pack_path,
+    load_word_list,
+    read_pack,
+    read_text_word_list,
+)
+
+
+class TestWordPack(unittest.TestCase):
+    """Word Pack Tests"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.text_path = os.path.join(self.directory.name, "words.txt")
+        self.write_words("llama\nladle  \nbasil\n")
+
+    def write_words(self, text):
+        """Writes the text file and moves its modification time forward."""
+        with open(self.text_path, "w", encoding="ascii") as outfile:
+            outfile.write(text)
+        stat = os.stat(self.text_path)
+        os.utime(self.text_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    def test_1(self):
+        """compile_word_list(): the pack holds the same words as the text file"""
+        self.assertEqual(compile_word_list(self.text_path), 3)
+        self.assertEqual(default_pack_path(self.text_path)[-10:], "words.pack")
+        self.assertEqual(read_pack(self.text_path), ["llama", "ladle", "basil"])
+        self.assertEqual(load_word_list(self.text_path), read_text_word_list(self.text_path))
+
+    def test_2(self):
+        """read_pack(): a pack of an older text file is stale"""
+        compile_word_list(self.text_path)
+        self.write_words("crane\n")
+        self.assertEqual(read_pack(self.text_path), None)
+        self.assertEqual(load_word_list(self.text_path), ["crane"])
+
+    def test_3(self):
+        """read_pack(): a corrupt pack fails its checksum"""
+        compile_word_list(self.text_path)
+        pack_path = default_pack_path(self.text_path)
+        with open(pack_path, "r+b") as packfile:
+            packfile.seek(-1, os.SEEK_END)
+            packfile.write(b"x")
+        self.assertEqual(read_pack(self.text_path), None)
+        self.assertEqual(load_word_list(self.text_path), ["llama", "ladle", "basil"])
+
+    def test_4(self):
+        """load_word_list(): falls back to the text file without a pack"""
+        self.assertEqual(read_pack(self.text_path), None)
+        self.assertEqual(load_word_list(self.text_path), ["llama", "ladle", "basil"])
+
+    def test_5(self):
+        """compile_word_list(): words that are not 5 lowercase letters raise"""
+        self.write_words("llama\nHello\n")
+        with self.assertRaises(ValueError):
+            compile_word_list(self.text_path)
+        self.assertEqual(os.path.exists(default_pack_path(self.text_path)), False)
+
+
+if __name__ == "__main__":
+    unittest.main()